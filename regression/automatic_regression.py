@@ -38,16 +38,20 @@ modules = [
 
     # ----------------------- Regression List --------------------------
     'scripts/aerodynamics/aerodynamics.py', 
+    'scripts/aerodynamics/vortex_lattice.py',
     'scripts/airfoil_import/airfoil_import_test.py',    
     'scripts/atmosphere/atmosphere.py',
     'scripts/atmosphere/constant_temperature.py',
     'scripts/AVL/test_AVL.py',
+    'scripts/AVL/AVL_jobs.py',
     'scripts/B737/mission_B737.py',
     'scripts/battery/battery.py', 
     'scripts/battery_propeller/battery_propeller.py',    
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',    
     'scripts/concorde/concorde.py',
+    'scripts/configs/overlay_config.py',
+    'scripts/data_ordered/data_ordered.py',
     'scripts/DC_10_noise/DC_10_noise.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
@@ -69,8 +73,11 @@ modules = [
     'scripts/motor/motor_test.py',     
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py', 
+    'scripts/noise_optimization/noise_observers.py',
     'scripts/optimization_packages/optimization_packages.py',    
+    'scripts/optimization_packages/nexus_aliases.py',
     'scripts/payload_range/payload_range.py', 
+    'scripts/payload_range/mission_sweep.py',
     'scripts/plots/plot_test.py',    
     'scripts/propeller/propeller_test.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
@@ -80,11 +87,17 @@ modules = [
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',   
     'scripts/segments/segment_test.py',     
+    'scripts/segments/block_sparse_mission.py',
+    'scripts/segments/optimized_climb.py',
+    'scripts/segments/warm_start_mission.py',
+    'scripts/segments/adaptive_control_points.py',
+    'scripts/segments/ensemble_mission.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/SU2_surrogate/BWB-450.py',   
+    'scripts/SU2_surrogate/SU2_jobs.py',
     'scripts/sweeps/test_sweeps.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',    
@@ -0,0 +1,153 @@
+# AVL_jobs.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" runs the AVL training batches one at a time and concurrently, each in its own folder, with a
+    stub executable in place of avl, and checks that the training tables are the same. a second
+    training of the same analysis takes every batch from the training cache. the adaptive training
+    is refined from a coarse grid within a sample budget, on conditions sampled from a thin airfoil
+    model in place of avl
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+import os
+import sys
+import copy
+import shutil
+import tempfile
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    geometry = configs.cruise
+
+    # the tables avl wrote for the same batches
+    truth = np.loadtxt('cruise_aero_data.txt')
+
+    stub   = os.path.abspath('avl_stub.py')
+    origin = os.getcwd()
+    # the airfoil files are found from the folder above, as in the other regressions
+    folder = tempfile.mkdtemp(dir=os.path.dirname(origin))
+    os.chdir(folder)
+
+    try:
+        serial     = sample_training(geometry,stub,1)
+        concurrent = sample_training(geometry,stub,4)
+
+        error = np.max(np.abs(serial.coefficients - concurrent.coefficients))
+        print('concurrent training error: ', error)
+        assert error < 1e-12
+
+        CL = concurrent.coefficients[0].reshape(-1)
+        assert np.max(np.abs(CL - truth[:,0])) < 1e-12
+
+        # the batch folders are removed after they are read
+        assert os.listdir(folder) == []
+
+        # the second time every batch comes from the cache, an avl that always fails is never called
+        cache = os.path.join(folder,'cache')
+        avl   = analysis(geometry,stub,4,cache)
+        avl.sample_training()
+        first = avl.training.coefficients.copy()
+        assert len(os.listdir(cache)) == 6
+
+        avl.settings.filenames.avl_bin_name = 'false'
+        avl.sample_training()
+        assert avl.current_status.batch_index == 6
+        assert len(os.listdir(cache)) == 6
+        assert np.all(avl.training.coefficients == first)
+        assert np.all(avl.training.coefficients == concurrent.coefficients)
+
+        # adaptive training, refined from a coarse grid within the sample budget
+        fixed    = adaptive_setup(geometry,stub,None,None)
+        adaptive = adaptive_setup(geometry,stub,1e-3,48)
+        n_AoA    = len(adaptive.training.angle_of_attack)
+        n_Mach   = len(adaptive.training.Mach)
+        print('adaptive training conditions: ', n_AoA, 'x', n_Mach)
+        assert n_AoA*n_Mach <= 48
+        assert n_AoA*n_Mach > 16
+
+        AoA  = np.linspace(-10.,10.,9) * Units.deg
+        Mach = np.linspace(0.1,0.8,8)
+        Mach_mesh, AoA_mesh = np.meshgrid(Mach, AoA)
+        truth = thin_airfoil(np.vstack([AoA_mesh.flatten(),Mach_mesh.flatten()]).T)
+        for i, surrogate in enumerate(['lift_coefficient','drag_coefficient']):
+            values = truth[:,i].reshape(AoA_mesh.shape)
+            fixed_error    = np.max(np.abs(fixed.surrogates[surrogate](AoA,Mach) - values)) / np.max(np.abs(values))
+            adaptive_error = np.max(np.abs(adaptive.surrogates[surrogate](AoA,Mach) - values)) / np.max(np.abs(values))
+            print(surrogate + ' coarse training error: ', fixed_error, ' adaptive training error: ', adaptive_error)
+            assert adaptive_error < 0.05
+            assert adaptive_error < fixed_error
+
+    finally:
+        os.chdir(origin)
+        shutil.rmtree(folder)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def sample_training(geometry,stub,number_of_jobs):
+
+    avl = analysis(geometry,stub,number_of_jobs)
+    avl.sample_training()
+
+    return avl.training
+
+def analysis(geometry,stub,number_of_jobs,cache=None):
+
+    avl = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    avl.geometry = copy.deepcopy(geometry)
+    avl.settings.spanwise_vortices         = 30
+    avl.settings.number_of_jobs            = number_of_jobs
+    avl.settings.training_cache_directory  = cache
+    avl.settings.filenames.avl_bin_name    = stub
+    avl.settings.filenames.log_filename    = os.devnull
+    avl.settings.filenames.err_filename    = os.devnull
+
+    return avl
+
+def adaptive_setup(geometry,stub,tolerance,samples):
+
+    avl = analysis(geometry,stub,1)
+    avl.settings.adaptive_training_tolerance = tolerance
+    avl.settings.adaptive_training_samples   = samples
+    avl.training.angle_of_attack = np.array([-10.,-3.,3.,10.]) * Units.deg
+    avl.training.Mach            = np.array([0.1,0.35,0.6,0.85])
+    # the stub only replays the recorded batches, so new conditions come from a thin airfoil model
+    avl.sample_points = thin_airfoil
+    avl.sample_training()
+    avl.build_surrogate()
+
+    return avl
+
+def thin_airfoil(points):
+
+    AoA  = points[:,0]
+    Mach = points[:,1]
+    CL   = 2. * np.pi * AoA / np.sqrt(1. - Mach**2)
+    e    = 0.9 * np.ones_like(CL)
+    CD   = CL**2 / (np.pi * 10. * e)
+
+    return np.vstack([CL,CD,e]).T
+
+if __name__ == '__main__':
+    main()
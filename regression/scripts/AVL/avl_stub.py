@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# avl_stub.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" stands in for avl in the regression, it reads the commands of an input deck from stdin and
+    copies the output files that avl wrote for the same cases, which are kept in avl_files
+"""
+
+import os
+import sys
+import shutil
+
+def main():
+
+    outputs = os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_files')
+
+    # the geometry has to be in the case folder
+    open(sys.argv[1]).close()
+
+    # the output file follows each of these commands
+    write_commands = ['st','fn','fs','sb']
+
+    previous = None
+    for line in iter(sys.stdin.readline,''):
+        line = line.strip()
+        if line == 'QUIT':
+            break
+        elif line.startswith('CASE') or line.startswith('MASS'):
+            open(line.split()[1]).close()
+        elif previous in write_commands:
+            shutil.copy(os.path.join(outputs,line),line)
+        previous = line
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python
+# SU2_CFD_stub.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" stands in for SU2_CFD in the regression, it reads the Mach number and angle of attack from a
+    configuration file and writes a history file with a thin airfoil lift coefficient
+"""
+
+import sys
+import numpy as np
+
+def main():
+
+    settings = {}
+    with open(sys.argv[1]) as f:
+        for line in f:
+            if '=' in line:
+                key, value = line.split('=',1)
+                settings[key.strip()] = value.strip()
+
+    mach = float(settings['MACH_NUMBER'])
+    aoa  = float(settings['AOA']) * np.pi / 180.
+
+    CL = 2. * np.pi * aoa / np.sqrt(1. - mach**2)
+    CD = 0.01 + CL**2 / (np.pi * 8.)
+
+    # the mesh has to be in the case folder
+    open(settings['MESH_FILENAME']).close()
+
+    with open(settings['CONV_FILENAME'] + '.dat','w') as history:
+        history.write('"Iteration","a","b","c","d","e","f","g","CD","CL"\n')
+        history.write('0,0,0,0,0,0,0,0,' + str(CD) + ',' + str(CL) + '\n')
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+# SU2_jobs.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" runs the SU2 training cases one at a time and concurrently, each in its own folder, with a
+    stub executable in place of SU2_CFD, and checks that the training tables are the same. cases
+    stored in the training cache are not run again until the mesh changes. the adaptive training
+    adds cases where the coefficients are least certain
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Core.jobs import run_jobs
+
+import numpy as np
+
+import os
+import sys
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    stub   = os.path.abspath('SU2_CFD_stub.py')
+    origin = os.getcwd()
+    folder = tempfile.mkdtemp()
+    os.chdir(folder)
+
+    try:
+        geometry = Data()
+        geometry.tag            = 'stub_wing'
+        geometry.reference_area = 10.
+
+        # the mesh is linked into every case folder
+        open(geometry.tag + '.su2','w').close()
+
+        serial     = sample_training(geometry,stub,1)
+        concurrent = sample_training(geometry,stub,4)
+
+        error = np.max(np.abs(serial.coefficients - concurrent.coefficients))
+        print('concurrent training error: ', error)
+        assert error < 1e-12
+        assert np.all(serial.grid_points == concurrent.grid_points)
+
+        # thin airfoil lift at the first case
+        CL_truth = 2. * np.pi * (-2. * Units.deg) / np.sqrt(1. - 0.3**2)
+        assert np.abs(serial.coefficients[0,0] - CL_truth) < 1e-6
+
+        # the second time every case comes from the cache, a solver that always fails is never called
+        cache  = os.path.join(folder,'cache')
+        first  = sample_training(geometry,stub,4,cache)
+        stored = sample_training(geometry,'false',1,cache)
+        assert len(os.listdir(cache)) == 9
+        assert np.all(stored.coefficients == first.coefficients)
+        assert np.all(stored.coefficients == concurrent.coefficients)
+
+        # a new mesh runs the cases again
+        with open(geometry.tag + '.su2','w') as mesh:
+            mesh.write('NDIME= 3')
+        sample_training(geometry,stub,4,cache)
+        assert len(os.listdir(cache)) == 18
+
+        # refined from the table where thin airfoil lift grows fastest with Mach number
+        adaptive = sample_training(geometry,stub,4,None,0.01,20)
+        n_AoA    = len(adaptive.angle_of_attack)
+        n_Mach   = len(adaptive.Mach)
+        assert n_AoA * n_Mach <= 20 and len(adaptive.coefficients) == n_AoA * n_Mach
+        assert n_Mach > 3 and np.all(adaptive.Mach[1:-1] > 0.3)
+
+        CL_truth = 2. * np.pi * adaptive.grid_points[:,0] / np.sqrt(1. - adaptive.grid_points[:,1]**2)
+        assert np.max(np.abs(adaptive.coefficients[:,0] - CL_truth)) < 1e-6
+
+        # a case that fails is retried, a case that runs out of time is reported
+        jobs = [stub_job('sleep',1.),stub_job('fail',0.),stub_job('ok',0.)]
+        results = run_jobs(jobs,number_of_workers=3,timeout=0.5,retries=1,scratch_folder='scratch')
+
+        assert not results[0].success and results[0].returncode is None and results[0].attempts == 2
+        assert not results[1].success and results[1].attempts == 2
+        assert results[2].success and results[2].value == 'ok'
+        assert os.listdir('scratch') == []
+
+    finally:
+        os.chdir(origin)
+        shutil.rmtree(folder)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def sample_training(geometry,stub,number_of_jobs,cache=None,tolerance=None,samples=None):
+
+    su2 = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+    su2.geometry = geometry
+    su2.settings.executable                  = stub
+    su2.settings.number_of_jobs              = number_of_jobs
+    su2.settings.training_cache_directory    = cache
+    su2.settings.adaptive_training_tolerance = tolerance
+    su2.settings.adaptive_training_samples   = samples
+    su2.sample_training()
+
+    return su2.training
+
+def stub_job(mode,delay):
+
+    job = Data()
+    job.tag     = mode
+    job.command = [sys.executable,'-c','import sys,time; time.sleep({0}); sys.exit({1})'.format(delay,int(mode=='fail'))]
+    job.collect = lambda: mode
+
+    return job
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,203 @@
+# vortex_lattice.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" evaluates the vortex lattice directly, without a surrogate, and checks that the reused
+    vortex distribution, the cached induced velocities, the evaluation in blocks of flight
+    conditions and the factorization shared across angles of attack give the same results. the
+    surrogate training is split across processes and stored on disk, and can be refined from a
+    coarse grid
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+import sys
+import os
+import shutil
+import tempfile
+import warnings
+
+sys.path.append('../Vehicles')
+
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+
+    # angles of attack at a few repeated Mach numbers, like a mission segment
+    aoa  = np.array([[-2.,0.,2.,4.,-2.,0.,2.,4.]]).T * Units.deg
+    mach = np.array([[0.3,0.3,0.3,0.3,0.78,0.78,0.78,0.78]]).T
+
+    # without the cache
+    vortex_lattice = vortex_lattice_setup(vehicle)
+    vortex_lattice.settings.influence_cache_memory = 0.
+    reference = evaluate(vortex_lattice,aoa,mach)
+
+    # with the cache, evaluated twice
+    vortex_lattice = vortex_lattice_setup(vehicle)
+    VD     = vortex_lattice.settings.vortex_distribution
+    first  = evaluate(vortex_lattice,aoa,mach)
+    second = evaluate(vortex_lattice,aoa,mach)
+
+    # the panelization is reused while the geometry is unchanged
+    assert vortex_lattice.settings.vortex_distribution is VD
+    assert len(vortex_lattice.settings.influence_cache) == 2
+
+    # the cache is kept with the analysis, so configs of the vehicle can still be diffed
+    config = SUAVE.Components.Configs.Config(vehicle)
+    config.tag = 'cruise'
+    config.wings.main_wing.twists.root = 2. * Units.deg
+    config.store_diff()
+    assert 'wings' in config._diff
+
+    for results in [first,second]:
+        error = np.max(np.abs(results.lift_coefficient - reference.lift_coefficient))
+        print('lift coefficient error: ', error)
+        assert error < 1e-10
+
+        error = np.max(np.abs(results.induced_drag - reference.induced_drag))
+        print('induced drag error: ', error)
+        assert error < 1e-10
+
+    # blocks of one flight condition at a time
+    vortex_lattice.settings.memory_budget = 1.
+    chunked = evaluate(vortex_lattice,aoa,mach)
+
+    error = np.max(np.abs(chunked.lift_coefficient - reference.lift_coefficient))
+    print('chunked lift coefficient error: ', error)
+    assert error < 1e-10
+
+    error = np.max(np.abs(chunked.induced_drag - reference.induced_drag))
+    print('chunked induced drag error: ', error)
+    assert error < 1e-10
+
+    # with the wake along the chord line, each Mach number is factored once for all angles of attack
+    vortex_lattice.settings.memory_budget            = 0.
+    vortex_lattice.settings.align_wake_to_freestream = False
+    grouped = evaluate(vortex_lattice,aoa,mach)
+
+    for i in range(len(aoa)):
+        single = evaluate(vortex_lattice,aoa[i:i+1],mach[i:i+1])
+        error  = np.abs(single.lift_coefficient[0,0] - grouped.lift_coefficient[i,0])
+        assert error < 1e-10
+
+    vortex_lattice.settings.align_wake_to_freestream = True
+
+    # a change in the geometry rebuilds the vortex distribution
+    vehicle.wings.main_wing.spans.projected = 1.05 * vehicle.wings.main_wing.spans.projected
+    stretched = evaluate(vortex_lattice,aoa,mach)
+
+    assert vortex_lattice.settings.vortex_distribution is not VD
+    assert np.all(stretched.lift_coefficient[aoa[:,0]>0.] != first.lift_coefficient[aoa[:,0]>0.])
+
+    # surrogate training split across processes, stored on disk and loaded for the same geometry
+    directory = tempfile.mkdtemp()
+
+    serial   = surrogate_setup(vehicle,None,1)
+    parallel = surrogate_setup(vehicle,directory,2)
+    assert len(os.listdir(directory)) == 1
+
+    stored   = surrogate_setup(vehicle,directory,1)
+
+    for key in ['lift_coefficient_sub','lift_coefficient_sup','drag_coefficient_sub','drag_coefficient_sup']:
+        error = np.max(np.abs(parallel.training[key] - serial.training[key]))
+        print(key + ' parallel training error: ', error)
+        assert error < 1e-12
+        assert np.all(stored.training[key] == parallel.training[key])
+
+    shutil.rmtree(directory)
+
+    # a vehicle that can not be sent to the processes is trained in this one, with a warning
+    vehicle.unpicklable = lambda: None
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        fallback = surrogate_setup(vehicle,None,2)
+    del vehicle.unpicklable
+
+    assert any(['one process' in str(warning.message) for warning in caught])
+    for key in ['lift_coefficient_sub','drag_coefficient_sub']:
+        assert np.all(fallback.training[key] == serial.training[key])
+
+    # adaptive training from a coarse grid, within the sample budget
+    adaptive = adaptive_setup(vehicle,0.01,96)
+    n_AoA    = len(adaptive.training.angle_of_attack)
+    n_Mach   = len(adaptive.training.Mach)
+    print('adaptive training grid: ', n_AoA, ' x ', n_Mach)
+    assert n_AoA * n_Mach <= 96
+    assert n_AoA * n_Mach > 4 * 8
+
+    for surrogate in ['lift_coefficient_sub','drag_coefficient_sub']:
+        fixed   = serial.surrogates[surrogate](aoa[:,0],mach[:,0],grid=False)
+        refined = adaptive.surrogates[surrogate](aoa[:,0],mach[:,0],grid=False)
+        error   = np.max(np.abs(refined - fixed)) / np.max(np.abs(fixed))
+        print(surrogate + ' adaptive training error: ', error)
+        assert error < 0.05
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def vortex_lattice_setup(vehicle):
+
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.initialize(False, False, 8, 4, False)
+
+    return vortex_lattice
+
+def surrogate_setup(vehicle,directory,processes):
+
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.settings.training_cache_directory = directory
+    vortex_lattice.settings.training_processes       = processes
+    vortex_lattice.initialize(True, False, 8, 4, False)
+
+    return vortex_lattice
+
+def adaptive_setup(vehicle,tolerance,samples):
+
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.settings.adaptive_training_tolerance = tolerance
+    vortex_lattice.settings.adaptive_training_samples   = samples
+    vortex_lattice.training.angle_of_attack = np.array([[-5.,0.,5.,12.]]).T * Units.deg
+    vortex_lattice.training.Mach            = np.array([[0.0,0.3,0.6,0.9,1.3,1.5,2.5,3.5]]).T
+    vortex_lattice.initialize(True, False, 8, 4, False)
+
+    return vortex_lattice
+
+def evaluate(vortex_lattice,aoa,mach):
+
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(len(aoa))
+
+    state.conditions.aerodynamics.angle_of_attack = aoa
+    state.conditions.freestream.mach_number       = mach * 1.
+    state.conditions.freestream.velocity          = mach * 300.
+
+    vortex_lattice.evaluate(state,vortex_lattice.settings,vortex_lattice.geometry)
+
+    results = Data()
+    results.lift_coefficient = state.conditions.aerodynamics.lift_coefficient
+    results.induced_drag     = state.conditions.aerodynamics.drag_breakdown.induced.inviscid
+
+    return results
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,7 @@
 # 
 # Created:  Mike Colonno, Dec 2013
 # Modified: Trent Lukaczyk, Jun 2014
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -50,6 +51,24 @@ def main():
     print('Max Density Difference        = %.4e' % rho_err)
     print('Max Speed of Sound Difference = %.4e' % a_err)
     
+    # repeated inputs return copies of the stored values
+    p_layers = p.copy()
+    conditions.pressure[:] = 0.
+    repeated = atm.compute_values(z)
+    assert( np.all( repeated.pressure == p_layers ) )
+    
+    # the lookup table is close to the layers
+    atm_table = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atm_table.settings.use_lookup_table = True
+    table = atm_table.compute_values(z)
+    p_table_err = np.max( np.abs( table.pressure / repeated.pressure - 1. ) )
+    T_table_err = np.max( np.abs( table.temperature - repeated.temperature ) )
+    
+    print('Max Table Pressure Difference = %.4e' % p_table_err)
+    
+    assert( p_table_err < 1e-5 )
+    assert( T_table_err < 1e-8 )
+    
     
     # ------------------------------------------------------------------
     #   Plotting
@@ -0,0 +1,151 @@
+# overlay_config.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that overlay configurations follow their base like the diffed configurations do
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data, DataOrdered
+import numpy as np
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    
+    diffed  = configs_setup(vehicle_setup(),SUAVE.Components.Configs.Config)
+    overlay = configs_setup(vehicle_setup(),SUAVE.Components.Configs.Overlay_Config)
+    
+    for iteration in range(3):
+        sizing(diffed,iteration)
+        sizing(overlay,iteration)
+        
+        for tag in ['base','cruise','takeoff','landing']:
+            compare(diffed[tag],overlay[tag],tag)
+            
+    base    = overlay.base
+    landing = overlay.landing
+    
+    # the configurations do not change their base
+    assert( base.wings.main_wing.control_surfaces.flap.deflection == 0. )
+    assert( landing.wings.main_wing.control_surfaces.flap.deflection == 30. * Units.deg )
+    assert( landing.wings.main_wing is not base.wings.main_wing )
+    
+    # but share the values they have not changed
+    assert( landing.fuselages.fuselage.lengths.total is base.fuselages.fuselage.lengths.total )
+    
+    # arrays and lists of the base are copied before they are changed in place
+    origin = base.wings.main_wing.origin[0][0]
+    cg     = base.wings.main_wing.mass_properties.center_of_gravity[0,0]
+    landing.wings.main_wing.origin[0][0] = 99.
+    landing.wings.main_wing.mass_properties.center_of_gravity[0,0] = 99.
+    assert( base.wings.main_wing.origin[0][0] == origin )
+    assert( base.wings.main_wing.mass_properties.center_of_gravity[0,0] == cg )
+    
+    # the changes are kept when diffed
+    landing.store_diff()
+    landing.pull_base()
+    assert( landing.wings.main_wing.origin[0][0] == 99. )
+    assert( landing.wings.main_wing.mass_properties.center_of_gravity[0,0] == 99. )
+    
+    # and dropped when not
+    cruise = overlay.cruise
+    cruise.wings.main_wing.origin[0][0] = 98.
+    cruise.pull_base()
+    assert( cruise.wings.main_wing.origin[0][0] == origin )
+    
+    # a change in place on the base reaches the configurations
+    base.wings.horizontal_stabilizer.origin[0][0] = 40.
+    base.store_diff()
+    cruise.pull_base()
+    assert( cruise.wings.horizontal_stabilizer.origin[0][0] == 40. )
+    
+    return
+
+# ----------------------------------------------------------------------
+#   Configurations
+# ----------------------------------------------------------------------
+
+def configs_setup(vehicle,config_class):
+    
+    configs = SUAVE.Components.Configs.Config.Container()
+
+    base_config = config_class(vehicle)
+    base_config.tag = 'base'
+    configs.append(base_config)
+
+    config = config_class(base_config)
+    config.tag = 'cruise'
+    configs.append(config)
+
+    config = config_class(base_config)
+    config.tag = 'takeoff'
+    config.wings['main_wing'].control_surfaces.flap.deflection = 20. * Units.deg
+    config.wings['main_wing'].control_surfaces.slat.deflection = 25. * Units.deg
+    config.V2_VS_ratio = 1.21
+    configs.append(config)
+
+    config = config_class(base_config)
+    config.tag = 'landing'
+    config.wings['main_wing'].control_surfaces.flap.deflection = 30. * Units.deg
+    config.wings['main_wing'].control_surfaces.slat.deflection = 25. * Units.deg
+    config.Vref_VS_ratio = 1.23
+    configs.append(config)
+    
+    return configs
+
+def sizing(configs,iteration):
+    
+    base = configs.base
+    base.pull_base()
+    
+    # a design change on the base
+    base.wings.main_wing.areas.reference  = (124.862 + iteration) * Units.meter**2
+    base.wings.main_wing.areas.wetted     = 2.0 * base.wings.main_wing.areas.reference
+    base.mass_properties.max_takeoff      = (79015.8 + 100. * iteration) * Units.kilogram
+    base.mass_properties.max_zero_fuel    = 0.9 * base.mass_properties.max_takeoff
+    base.store_diff()
+    
+    # a change on a configuration that is kept
+    landing = configs.landing
+    landing.pull_base()
+    landing.mass_properties.landing = 0.85 * base.mass_properties.max_takeoff
+    landing.store_diff()
+    
+    # and one that is not diffed, so it is dropped
+    takeoff = configs.takeoff
+    takeoff.pull_base()
+    takeoff.mass_properties.takeoff = 1.
+    
+    configs.finalize()
+    
+    return
+
+def compare(a,b,path):
+    
+    for key in a.keys():
+        if key.startswith('_'):
+            continue
+        va = a[key]
+        vb = b[key]
+        if isinstance(va,(Data,DataOrdered)):
+            compare(va,vb,path + '.' + key)
+        elif isinstance(va,np.ndarray):
+            assert np.all(va == vb), path + '.' + key
+        elif va != vb:
+            raise AssertionError(path + '.' + key + ' differs: ' + str(va) + ' ' + str(vb))
+    
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+# data_ordered.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" checks that DataOrdered, ContainerOrdered and Process behave like the linked list DataOrdered,
+    and times both for attribute gets and sets, iteration and deep_get
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import DataOrdered, ContainerOrdered, Data
+from SUAVE.Analyses import Process
+
+import numpy as np
+import pickle
+import copy
+import time
+
+from legacy_data_ordered import DataOrdered as Legacy_DataOrdered
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_behavior()
+
+    timings = benchmark()
+
+    print('\n%-24s %12s %12s %8s' % ('case','legacy [us]','current [us]','speedup'))
+    for case, (legacy, current) in timings.items():
+        print('%-24s %12.3f %12.3f %8.1f' % (case, legacy*1e6, current*1e6, legacy/current))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Behavior
+# ----------------------------------------------------------------------
+
+def check_behavior():
+
+    for klass in [DataOrdered, ContainerOrdered, Process]:
+        current = build(klass)
+        legacy  = build(Legacy_DataOrdered)
+        compare(current,legacy)
+
+        # order after resetting and deleting keys
+        for data in [current,legacy]:
+            data.step_a = 10.
+            del data.step_b
+            data.step_b = 11.
+        compare(current,legacy)
+
+        # copies and pickles keep the order and the class
+        for data in [copy.deepcopy(current), pickle.loads(pickle.dumps(current))]:
+            assert type(data) is klass
+            compare(data,legacy)
+
+        # a clear empties both
+        current.clear()
+        legacy.clear()
+        compare(current,legacy)
+
+    # class level settings are attributes, not items
+    class Legacy_Process(Legacy_DataOrdered):
+        verbose = False
+    for klass in [Process, Legacy_Process]:
+        process = build(klass)
+        process.verbose = False
+        assert 'verbose' not in process.keys()
+        assert process.verbose is False
+        copied = copy.deepcopy(process)
+        assert 'verbose' not in copied.keys()
+        assert copied.verbose is False
+
+    # index, deep and nested access
+    current = build_tree(DataOrdered,4,4)
+    legacy  = build_tree(Legacy_DataOrdered,4,4)
+    assert current.deep_get('b.c.d.value') == legacy.deep_get('b.c.d.value')
+    assert current[2].c.keys() == legacy[2].c.keys()
+    current.deep_set('a.a.a.value',-1.)
+    legacy.deep_set('a.a.a.value',-1.)
+    assert current.a.a.a.value == legacy.a.a.a.value == -1.
+    assert str(current).split('\n')[1:] == str(legacy).split('\n')[1:]
+
+    # processes still evaluate their steps in order
+    process = Process()
+    for tag in ['first','second','third']:
+        process[tag] = lambda segment, tag=tag: segment.append(tag)
+    visited = []
+    results = process(visited)
+    assert visited == ['first','second','third']
+    assert list(results.keys()) == ['first','second','third']
+
+    return
+
+def compare(current,legacy):
+
+    assert current.keys()   == legacy.keys()
+    assert current.values() == legacy.values()
+    assert current.items()  == legacy.items()
+    assert len(current)     == len(legacy)
+    assert list(current)    == list(legacy)
+    for i, key in enumerate(legacy.keys()):
+        assert current[i] == legacy[i] == current[key] == getattr(current,key)
+
+    return
+
+def build(klass):
+
+    data = klass()
+    for i, tag in enumerate(['step_a','step_b','step_c','step_d']):
+        data[tag] = float(i)
+    data.append(Data(tag='Appended Step'))
+
+    return data
+
+def build_tree(klass,depth,width):
+
+    data = klass()
+    data.value = float(depth)
+    if depth:
+        for tag in 'abcdefgh'[:width]:
+            data[tag] = build_tree(klass,depth-1,width)
+
+    return data
+
+# ----------------------------------------------------------------------
+#   Benchmark
+# ----------------------------------------------------------------------
+
+def benchmark(repeats=5,number=20000):
+
+    timings = Data()
+
+    for name, case in [['attribute_get' , get_case    ],
+                       ['attribute_set' , set_case    ],
+                       ['item_get'      , item_case   ],
+                       ['iteration'     , iter_case   ],
+                       ['deep_get'      , deep_case   ],
+                       ['process_steps' , process_case]]:
+        timings[name] = [ best_time(case(Legacy_DataOrdered),repeats,number),
+                          best_time(case(DataOrdered)       ,repeats,number) ]
+
+    return timings
+
+def best_time(function,repeats,number):
+
+    best = np.inf
+    for repeat in range(repeats):
+        start = time.perf_counter()
+        for i in range(number):
+            function()
+        best = min(best,(time.perf_counter()-start)/number)
+
+    return best
+
+def get_case(klass):
+    data = build(klass)
+    def case():
+        return data.step_a, data.step_b, data.step_c, data.step_d
+    return case
+
+def set_case(klass):
+    data = build(klass)
+    def case():
+        data.step_a = 1.
+        data.step_b = 2.
+        data.step_c = 3.
+        data.step_d = 4.
+    return case
+
+def item_case(klass):
+    data = build(klass)
+    def case():
+        return data['step_a'], data['step_b'], data['step_c'], data['step_d']
+    return case
+
+def iter_case(klass):
+    data = build_tree(klass,1,8)
+    def case():
+        for value in data:
+            pass
+        for key, value in data.items():
+            pass
+    return case
+
+def deep_case(klass):
+    data = build_tree(klass,4,4)
+    def case():
+        return data.deep_get('d.c.b.a.value')
+    return case
+
+def process_case(klass):
+    process = build_tree(klass,1,8)
+    for key in process.keys():
+        process[key] = len
+    def case():
+        for tag, step in process.items():
+            step(tag)
+    return case
+
+if __name__ == '__main__':
+    main()
@@ -165,6 +165,38 @@ def main():
     #print lift_test
         
     assert(np.max(lift_test)<1e-4), 'Aero regression failed at compute lift test'    
+    
+    # --------------------------------------------------------------------
+    # Adaptive training from a coarse table, within the sample budget
+    # --------------------------------------------------------------------
+    fixed    = lifting_line_setup(vehicle,None,None)
+    adaptive = lifting_line_setup(vehicle,1e-3,9)
+    n_AoA    = len(adaptive.training.angle_of_attack)
+    print('adaptive training angles of attack: ', n_AoA)
+    assert n_AoA <= 9
+    assert n_AoA > 3
+    
+    for surrogate in ['lift_coefficient','drag_coefficient']:
+        fixed_values    = fixed.surrogates[surrogate](angle_of_attacks)
+        adaptive_values = adaptive.surrogates[surrogate](angle_of_attacks)
+        error = np.max(np.abs(adaptive_values - fixed_values)) / np.max(np.abs(fixed_values))
+        print(surrogate + ' adaptive training error: ', error)
+        assert error < 1e-2
+    
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+def lifting_line_setup(vehicle,tolerance,samples):
+    
+    lifting_line = SUAVE.Analyses.Aerodynamics.Lifting_Line()
+    lifting_line.geometry = vehicle
+    if tolerance is not None:
+        lifting_line.settings.adaptive_training_tolerance = tolerance
+        lifting_line.settings.adaptive_training_samples   = samples
+        lifting_line.training.angle_of_attack = np.array([-10.,0.,10.]) * Units.deg
+    lifting_line.initialize(True, False, None, None, False)
+    
+    return lifting_line
 
 if __name__ == '__main__':
 
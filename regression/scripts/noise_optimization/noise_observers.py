@@ -0,0 +1,112 @@
+# noise_observers.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" computes the SAE engine noise and the Fink airframe noise of a flyover for several observers at
+    once, and checks the results of each observer against a computation for that observer alone
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform import wing_planform
+from SUAVE.Methods.Noise.Fidelity_One.Airframe import noise_airframe_Fink
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup, configs_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle = vehicle_setup()
+    wing_planform(vehicle.wings.main_wing)
+    configs = configs_setup(vehicle)
+
+    analyses = Data()
+    analyses.atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+
+    # a microphone under the path, one to the side and one behind the start
+    observers = np.array([[2000.,0.],[3000.,450.],[-500.,200.]])
+    segment   = flyover_segment(observers)
+
+    # the landing configuration has every airframe source
+    for config in [configs.takeoff,configs.landing]:
+        turbofan = config.propulsors['turbofan']
+
+        engine   = noise_SAE(turbofan,segment,config,analyses)
+        airframe = noise_airframe_Fink(config,analyses,segment)
+
+        for i in range(len(observers)):
+            observer = single_observer(segment,i)
+
+            engine_i   = noise_SAE(turbofan,observer,config,analyses)
+            airframe_i = noise_airframe_Fink(config,analyses,observer)
+
+            for multiple, single in [(engine,engine_i),(airframe,airframe_i)]:
+                assert np.shape(single[0]) == () and np.ndim(single[1]) == 2
+                for value, value_i in zip(multiple,single):
+                    error = np.max(np.abs(value[i] - value_i))
+                    assert error < 1e-10
+
+        print(config.tag + ' engine EPNL: ', engine[0])
+        print(config.tag + ' airframe EPNL: ', airframe[0])
+
+    return
+
+# ----------------------------------------------------------------------
+#   Helper Functions
+# ----------------------------------------------------------------------
+
+def flyover_segment(observers):
+
+    n_points = 16
+    ones     = np.ones((n_points,1))
+    time     = np.linspace(0.,40.,n_points)[:,None]
+    velocity = 80.
+    distance = velocity * time
+    altitude = 50. + distance * np.tan(6. * Units.deg)
+
+    conditions = Data()
+    conditions.frames       = Data(inertial = Data(time = time))
+    conditions.freestream   = Data(velocity = velocity * ones,altitude = altitude)
+    conditions.aerodynamics = Data(angle_of_attack = 8. * Units.deg * ones)
+
+    acoustic_outputs      = Data()
+    acoustic_outputs.core = Data(exit_stagnation_temperature = 800. * ones,exit_stagnation_pressure = 1.5e5 * ones)
+    acoustic_outputs.fan  = Data(exit_stagnation_temperature = 320. * ones,exit_stagnation_pressure = 1.3e5 * ones)
+    conditions.propulsion = Data(acoustic_outputs = acoustic_outputs)
+
+    segment = Data()
+    segment.conditions = conditions
+
+    # a column for each microphone on the ground
+    x_observer = observers[:,0][None,:]
+    y_observer = observers[:,1][None,:]
+    segment.dist  = np.sqrt((x_observer - distance)**2 + y_observer**2 + altitude**2)
+    segment.theta = np.arccos((x_observer - distance) / segment.dist)
+    segment.phi   = np.arctan2(y_observer,altitude)
+
+    return segment
+
+def single_observer(segment,i):
+
+    observer = Data()
+    observer.conditions = segment.conditions
+    observer.dist  = segment.dist[:,i]
+    observer.theta = segment.theta[:,i]
+    observer.phi   = segment.phi[:,i]
+
+    return observer
+
+if __name__ == '__main__':
+    main()
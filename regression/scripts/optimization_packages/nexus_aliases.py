@@ -0,0 +1,149 @@
+# nexus_aliases.py
+# Created: Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Units, Data
+from SUAVE.Optimization import Nexus
+import SUAVE.Optimization.helper_functions as help_fun
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Run the whole thing
+# ----------------------------------------------------------------------
+def main():
+
+    # ------------------------------------------------------------------
+    #   Wildcards and Indices
+    # ------------------------------------------------------------------
+    print('Checking the setters and getters of the aliases')
+    tree    = configurations(['base','cruise','takeoff'])
+    inputs  = np.array([
+        [ 'x'  ,  2.  , (   0.   ,   5.   )  ,   1.   , Units.less],
+        [ 's'  ,  3.  , (   0.   ,   5.   )  ,   1.   , Units.less],
+    ])
+    aliases = [
+        [ 'x' , 'configs.*.x'                                              ],
+        [ 's' , ['configs.base.wing.spans[1]','configs.cruise.wing.spans[1]'] ],
+        [ 'y' , 'configs.cruise.x'                                         ],
+        [ 'z' , 'configs.base.wing.spans[1]'                               ],
+    ]
+
+    # the wildcard is expanded over the three configurations
+    setters = help_fun.compile_setters(tree,inputs,aliases)
+    help_fun.set_compiled_values(tree,setters,np.array([2.,3.]))
+
+    assert( len(setters) == 5 )
+    assert( all([config.x == 2. for config in tree.configs.values()]) )
+    assert( np.all(tree.configs.base.wing.spans   == [0.,3.,0.]) )
+    assert( np.all(tree.configs.cruise.wing.spans == [0.,3.,0.]) )
+    assert( np.all(tree.configs.takeoff.wing.spans == 0.) )
+
+    getters = help_fun.compile_getters(np.array([['y',1.,Units.less],['z',1.,Units.less]]),aliases)
+    assert( np.all(help_fun.get_compiled_values(tree,getters) == [2.,3.]) )
+
+    # the values are the same as without compiling
+    assert( np.all(help_fun.get_values(tree,np.array([['y',1.,Units.less],['z',1.,Units.less]]),aliases) == [2.,3.]) )
+
+    # a wildcard in the first key
+    configs = configurations(['base','cruise']).configs
+    help_fun.set_values(configs,inputs[:1],np.array([4.]),[['x','*.x']])
+    assert( configs.base.x == 4. and configs.cruise.x == 4. )
+
+    # a new last key is added, as with deep_set
+    help_fun.set_values(tree,inputs[:1],np.array([5.]),[['x','configs.base.y']])
+    assert( tree.configs.base.y == 5. )
+
+    # the setters follow the path again when an object along it is replaced
+    tree.configs = configurations(['base','cruise','takeoff']).configs
+    help_fun.set_compiled_values(tree,setters,np.array([6.,7.]))
+    assert( tree.configs.takeoff.x == 6. and tree.configs.base.wing.spans[1] == 7. )
+
+    tree.configs.base = configuration()
+    tree.configs.cruise.wing = Data(spans=np.ones(3))
+    help_fun.set_compiled_values(tree,setters,np.array([8.,9.]))
+    assert( tree.configs.base.x == 8. and tree.configs.base.wing.spans[1] == 9. )
+    assert( np.all(tree.configs.cruise.wing.spans == [1.,9.,1.]) )
+
+    # ------------------------------------------------------------------
+    #   Validation
+    # ------------------------------------------------------------------
+    print('Checking the aliases are validated')
+    for path in ['configs.landing.x','configs.base.wing.chords[0]','configs.base.x.y']:
+        try:
+            help_fun.compile_setters(tree,inputs[:1],[['x',path]])
+        except KeyError:
+            pass
+        else:
+            raise AssertionError('the missing path "' + path + '" was not found')
+
+    # an input without an alias
+    try:
+        help_fun.compile_setters(tree,inputs,aliases[:1])
+    except KeyError:
+        pass
+    else:
+        raise AssertionError('the input without an alias was not found')
+
+    # ------------------------------------------------------------------
+    #   Compiled Aliases of the Nexus
+    # ------------------------------------------------------------------
+    print('Checking the compiled aliases of the nexus')
+    nexus   = Nexus()
+    problem = Data()
+    nexus.optimization_problem = problem
+    problem.inputs      = inputs[:1]
+    problem.objective   = np.array([['y',1.,Units.less]])
+    problem.constraints = np.array([])
+    problem.aliases     = [['x','vehicle_configurations.*.x'],['y','vehicle_configurations.base.x']]
+    nexus.vehicle_configurations = configurations(['base','cruise']).configs
+
+    nexus.unpack_inputs()
+    compiled = nexus.compiled_aliases()
+    assert( len(compiled.setters) == 2 )
+    assert( nexus.vehicle_configurations.cruise.x == 2. )
+
+    # a configuration added in place is only set once the aliases are compiled again
+    nexus.vehicle_configurations.landing = configuration()
+    nexus.unpack_inputs(np.array([3.]))
+    assert( nexus.vehicle_configurations.landing.x == 0. )
+    assert( nexus.compiled_aliases() is compiled )
+
+    nexus.clear_aliases()
+    nexus.unpack_inputs(np.array([4.]))
+    assert( len(nexus.compiled_aliases().setters) == 3 )
+    assert( nexus.vehicle_configurations.landing.x == 4. )
+
+    # new aliases are compiled without clearing
+    problem.aliases = [['x','vehicle_configurations.base.x'],['y','vehicle_configurations.base.x']]
+    nexus.unpack_inputs(np.array([5.]))
+    assert( len(nexus.compiled_aliases().setters) == 1 )
+    assert( nexus.vehicle_configurations.base.x == 5. and nexus.vehicle_configurations.cruise.x == 4. )
+
+    return
+
+# ----------------------------------------------------------------------
+#   Configurations
+# ----------------------------------------------------------------------
+
+def configurations(tags):
+
+    tree = Data()
+    tree.configs = Data()
+    for tag in tags:
+        tree.configs[tag] = configuration()
+
+    return tree
+
+def configuration():
+
+    config = Data()
+    config.x    = 0.
+    config.wing = Data()
+    config.wing.spans = np.zeros(3)
+
+    return config
+
+if __name__ == '__main__':
+    main()
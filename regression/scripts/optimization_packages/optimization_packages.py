@@ -2,6 +2,7 @@
 # Created: Sep. 2019, M. Clarke
 #          Mar 2020, M. Clarke
 #          Jul 2020, M. Clarke
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -11,10 +12,10 @@ from SUAVE.Core import Units, Data
 import numpy as np
 import vehicle_opt_pack
 import procedure_opt_pack 
-from SUAVE.Optimization import Nexus, carpet_plot 
+from SUAVE.Optimization import Nexus, carpet_plot, Surrogate_Optimization, read_optimization_outputs
 import SUAVE.Optimization.Package_Setups.scipy_setup as scipy_setup
 import SUAVE.Optimization.write_optimization_outputs as write_optimization_outputs
-import os , sys
+import os , sys , shutil , warnings
 # ----------------------------------------------------------------------        
 #   Run the whole thing
 # ----------------------------------------------------------------------  
@@ -108,9 +109,167 @@ def main():
     assert( np.isclose(x1 ,  0, atol=1e-1) )
     assert( np.isclose(x2 ,  1, atol=1e-1) )     
     
+    # ------------------------------------------------------------------
+    #   Batch Evaluation
+    # ------------------------------------------------------------------     
+    print('\n\n Checking batch evaluation on worker processes')
+    problem     = setup(solver_name)
+    X           = np.random.uniform(-2.,2.,(8,2))
+    serial      = problem.evaluate_batch(X)
+    grad, jac   = problem.finite_difference(np.array([0.5,1.5]))
+    
+    problem.number_of_workers = 2
+    parallel        = problem.evaluate_batch(X)
+    grad_2, jac_2   = problem.finite_difference(np.array([0.5,1.5]))
+    problem.stop_workers()
+    
+    #   Check Results 
+    assert( np.all(serial.objective == parallel.objective) )
+    assert( np.all(serial.all_constraints == parallel.all_constraints) )
+    assert( np.allclose(serial.objective[:,0], X[:,0]**2 + X[:,1]**2) )
+    assert( np.all(grad == grad_2) and np.all(jac == jac_2) )
+    assert( np.allclose(grad, [1.,3.], atol=1e-6) )
+    
+    # errors of the procedure in the workers are raised, not evaluated again here
+    problem.procedure.fail = fail
+    try:
+        problem.evaluate_batch(X)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('the error of the procedure was not raised')
+    problem.stop_workers()
+    
+    # ------------------------------------------------------------------
+    #   Particle Swarm Optimization on Worker Processes
+    # ------------------------------------------------------------------     
+    print('\n\n Checking particle swarm optimization on worker processes')
+    swarms = []
+    for unpicklable in [False,True]:
+        problem     = setup(solver_name)
+        problem.optimization_problem.constraints = np.array([
+            [ 'x1' , '>', -10., 1., Units.less],
+            [ 'x2' , '>',   1., 1., Units.less],
+            [ 'x2' , '<',   2., 1., Units.less],
+        ])
+        problem.number_of_workers = 2
+        if unpicklable:
+            # the swarm is evaluated in this process instead
+            problem.unpicklable = lambda nexus: nexus
+        np.random.seed(1)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            sys.stdout = open(os.devnull,'w')      
+            outputs = scipy_setup.SciPy_Solve(problem, solver='particle_swarm_optimization' , sense_step = 1.4901161193847656e-08, pop_size =  20 , prob_seed = seed )  
+            sys.stdout = sys.__stdout__
+        problem.stop_workers()
+        fallbacks = [w for w in caught if 'worker processes' in str(w.message)]
+        assert( (len(fallbacks) > 0) == unpicklable )
+        swarms.append(outputs)
+    print(swarms[0])
+    
+    #   Check Results 
+    assert( np.all(swarms[0][0] == swarms[1][0]) and swarms[0][1] == swarms[1][1] )
+    assert( np.isclose(swarms[0][1],  1, atol=1e-2) )
+    
+    # ------------------------------------------------------------------
+    #   Surrogate Samples on Worker Processes
+    # ------------------------------------------------------------------     
+    print('\n\n Checking surrogate samples on worker processes')
+    X_samples = np.random.uniform(-2.,2.,(6,2))
+    samples   = []
+    for number_of_workers in [1,2]:
+        problem     = setup(solver_name)
+        problem.procedure.record  = record
+        problem.samples_file      = os.path.abspath('surrogate_samples.txt')
+        problem.number_of_workers = number_of_workers
+        
+        surrogate = Surrogate_Optimization()
+        surrogate.problem          = problem
+        surrogate.number_of_points = len(X_samples)
+        surrogate.sample_plan      = lambda bounds, npoints: X_samples
+        surrogate.build_surrogate()
+        problem.stop_workers()
+        
+        opt_prob = problem.optimization_problem
+        iterations, obj, inputs, cons = read_optimization_outputs(problem.samples_file,opt_prob.inputs,opt_prob.constraints)
+        os.remove(problem.samples_file)
+        
+        # the workers may finish in any order
+        order = np.lexsort(inputs.T)
+        assert( problem.evaluation_count == len(X_samples) )
+        samples.append(np.hstack([inputs[order],obj[order,None]]))
+        
+    #   Check Results 
+    assert( np.all(samples[0] == samples[1]) )
+    assert( np.allclose(samples[0][:,2], np.sum(samples[0][:,:2]**2,axis=1)) )
+    
+    # ------------------------------------------------------------------
+    #   Evaluation Cache
+    # ------------------------------------------------------------------     
+    print('\n\n Checking reuse of earlier evaluations')
+    problem     = setup(solver_name)
+    problem.evaluation_cache_directory = 'evaluation_cache'
+    obj         = problem.objective(np.array([0.5,1.5]))
+    problem.objective(np.array([1.,1.]))
+    count       = problem.evaluation_count
+    obj_2       = problem.objective(np.array([0.5,1.5]))
+    
+    # a new problem resumes from the values stored on disk
+    resumed     = setup(solver_name)
+    resumed.evaluation_cache_directory = 'evaluation_cache'
+    obj_3       = resumed.objective(np.array([0.5,1.5]))
+    
+    # a changed model is given a new version, so the stored values are not used
+    changed     = setup(solver_name)
+    changed.evaluation_cache_directory = 'evaluation_cache'
+    changed.evaluation_cache_version   = 'changed model'
+    changed.objective(np.array([0.5,1.5]))
+    shutil.rmtree('evaluation_cache')
+    
+    #   Check Results 
+    assert( problem.evaluation_count == count )
+    assert( resumed.evaluation_count == 0 )
+    assert( changed.evaluation_count == 1 )
+    assert( np.all(obj == obj_2) and np.all(obj == obj_3) )
+    
+    # values kept in memory are reused with the summary of their inputs
+    problem     = setup(solver_name)
+    problem.procedure.summarize      = summarize
+    problem.evaluation_cache_size    = 8
+    problem.evaluation_cache_results = True
+    problem.objective(np.array([0.5,1.5]))
+    problem.objective(np.array([1.,1.]))
+    count       = problem.evaluation_count
+    problem.objective(np.array([0.5,1.5]))
+    
+    #   Check Results 
+    assert( problem.evaluation_count == count )
+    assert( problem.summary.objective == 2.5 )
+    
+    # the procedure was not run at these inputs, so evaluating them runs it
+    assert( problem.last_inputs is None )
+    problem.evaluate(np.array([0.5,1.5]))
+    assert( problem.evaluation_count == count + 1 )
      
     return
 
+def fail(nexus):
+    
+    raise ValueError('the procedure failed')
+
+def record(nexus):
+    
+    write_optimization_outputs(nexus,nexus.samples_file)
+    
+    return nexus
+
+def summarize(nexus):
+    
+    nexus.summary.objective = nexus.obj[0]
+    
+    return nexus
+
 # ----------------------------------------------------------------------        
 #   Inputs, Objective, & Constraints
 # ----------------------------------------------------------------------  
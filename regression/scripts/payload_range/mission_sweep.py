@@ -0,0 +1,95 @@
+# mission_sweep.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" sweeps the E190 mission over payload and fuel on worker processes, and checks the results
+    against flying the same scenarios in this process and against the table written on disk
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import shutil
+
+from mission_Embraer_E190_constThr_payload_range import full_setup
+
+from SUAVE.Methods.Performance import mission_sweep, scenario_grid, load_sweep_table
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # define the problem
+    configs, analyses = full_setup()
+
+    configs.finalize()
+    analyses.finalize()
+
+    mission = analyses.missions
+
+    # a small payload range carpet
+    scenarios = scenario_grid(payload = [13063., 9000.],
+                              fuel    = [6000., 9000.],
+                              temperature_deviation = [0., 15.])
+    reserves  = 1750.
+
+    serial   = mission_sweep(mission,scenarios,'cruise',reserves)
+    parallel = mission_sweep(mission,scenarios,'cruise',reserves,directory='mission_sweep_table',number_of_workers=2)
+
+    assert np.all(parallel.converged == 1.)
+
+    # the fuel burned is the fuel load less the reserves
+    error = np.max(np.abs(parallel.fuel_burn - (parallel.fuel - reserves)))
+    print('fuel burn error: ', error)
+    assert error < 1.
+
+    # the workers fly the same scenarios as this process
+    error = np.max(np.abs(parallel.range - serial.range)/serial.range)
+    print('range error: ', error)
+    assert error < 1e-6
+
+    # more fuel goes farther
+    print('range [nm]: ', parallel.range / Units.nautical_mile)
+    ranges = np.reshape(parallel.range,(2,2,2))
+    assert np.all(ranges[:,1,:] > ranges[:,0,:])
+
+    # the table on disk has a row for every scenario
+    table = load_sweep_table('mission_sweep_table')
+    order = np.argsort(table.case)
+    for key in parallel.keys():
+        assert np.allclose(table[key][order],parallel[key],equal_nan=True)
+
+    shutil.rmtree('mission_sweep_table')
+
+    # a payload alone is flown at the takeoff weight of the mission, which sets the fuel
+    payloads = mission_sweep(mission,Data(payload=[13063., 9000.]),'cruise',reserves,number_of_workers=2)
+    vehicle  = mission.segments[0].analyses.weights.vehicle
+    TOW      = vehicle.mass_properties.takeoff
+    OEW      = vehicle.mass_properties.operating_empty
+
+    assert np.all(payloads.converged == 1.)
+    assert np.all(payloads.takeoff_weight == TOW)
+    assert np.allclose(payloads.fuel,TOW - OEW - payloads.payload)
+    error = np.max(np.abs(payloads.fuel_burn - (payloads.fuel - reserves)))
+    print('payload fuel burn error: ', error)
+    assert error < 1.
+    assert payloads.range[1] > payloads.range[0]
+
+    # errors of a scenario in the workers are raised, not flown again here
+    try:
+        mission_sweep(mission,Data(payload=[TOW,9000.]),'cruise',reserves,number_of_workers=2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('the scenario with a negative fuel load was flown')
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,7 @@
 # full_setup.py
 #
 # Created:  SUAVE Team, Aug 2014
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 """ setup file for a mission with a E190
 """
@@ -53,6 +53,16 @@ def main():
     
     check_results(payload_range_results)
     
+    # the results are kept on the function, so they are copied before it runs again
+    serial_range = copy.deepcopy(payload_range_results.range)
+    
+    # the points solved together as an ensemble
+    ensemble_results = payload_range(vehicle,mission,cruise_segment_tag,reserves,ensemble=True)
+    
+    error = np.max(np.abs(ensemble_results.range - serial_range)/np.maximum(serial_range,1.))
+    print('ensemble range error: ', error)
+    assert error < 1e-3
+    
     return
 
 
@@ -190,6 +190,27 @@ def main():
     
     for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
+        
+    # several flight conditions at once, each row converges on its own
+    velocities = np.array([0.5,1.0,1.5])*V
+    conditions_m                                   = copy.deepcopy(conditions)
+    conditions_m.frames.inertial.velocity_vector   = np.array([[v,0,0] for v in velocities])
+    conditions_m.frames.body.transform_to_inertial = np.array([np.eye(3)]*3)
+    conditions_m.propulsion.throttle               = np.ones((3,1))
+    for key in ['density','dynamic_viscosity','speed_of_sound','temperature']:
+        conditions_m.freestream[key] = conditions.freestream[key]*np.ones((3,1))
+    prop_a.inputs.omega = np.array(prop.angular_velocity,ndmin=2)*np.ones((3,1))
+    F_m, Q_m, P_m, Cplast_m ,output_m , etap_m = prop_a.spin(conditions_m)
+    
+    assert(np.abs(F_m[1,0]-F_a_truth)/F_a_truth < 1e-4)
+    
+    # each row matches the same flight condition on its own
+    for i, velocity in enumerate(velocities):
+        conditions_1 = copy.deepcopy(conditions)
+        conditions_1.frames.inertial.velocity_vector = np.array([[velocity,0,0]])
+        prop_a.inputs.omega = np.array(prop.angular_velocity,ndmin=2)
+        F_1 = prop_a.spin(conditions_1)[0]
+        assert(np.abs(F_m[i,0]-F_1[0,0])/F_1[0,0] < 1e-4)
      
     return
 
@@ -0,0 +1,147 @@
+# adaptive_control_points.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" flies missions with a fixed number of control points and with adaptive control points that start
+    from a few, and compares them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    for mission_type in [SUAVE.Analyses.Mission.All_At_Once, SUAVE.Analyses.Mission.Sequential_Segments]:
+
+        mission = mission_setup(analyses,mission_type,16,False)
+        fixed   = mission.evaluate()
+
+        mission  = mission_setup(analyses,mission_type,4,True)
+        adaptive = mission.evaluate()
+
+        # sequential segments are converged one at a time
+        if mission_type is SUAVE.Analyses.Mission.All_At_Once:
+            assert mission.converged
+        else:
+            for segment in mission.segments.values():
+                assert segment.converged
+
+        points = [segment.state.numerics.number_control_points for segment in mission.segments.values()]
+        print(mission.tag + ' control points: ', points)
+        assert sum(points) < 16*len(points)
+
+        # no temporary store is left behind, and the starting number is kept
+        for segment in mission.segments.values():
+            assert segment.state.numerics.warm_start is None
+            assert segment.state.numerics.initial_control_points == 4
+
+        fixed_mass    = fixed.segments.descent.conditions.weights.total_mass[-1,0]
+        adaptive_mass = adaptive.segments.descent.conditions.weights.total_mass[-1,0]
+        error_mass    = np.abs(fixed_mass - adaptive_mass)/fixed_mass
+        print('landing mass error: ', error_mass)
+        assert error_mass < 1e-4
+
+        fixed_range    = fixed.segments.descent.conditions.frames.inertial.position_vector[-1,0]
+        adaptive_range = adaptive.segments.descent.conditions.frames.inertial.position_vector[-1,0]
+        error_range    = np.abs(fixed_range - adaptive_range)/fixed_range
+        print('range error: ', error_range)
+        assert error_range < 1e-4
+
+        # flying again does not add points
+        adaptive    = mission.evaluate()
+        points_next = [segment.state.numerics.number_control_points for segment in mission.segments.values()]
+        print(mission.tag + ' control points flown again: ', points_next)
+        assert all([next_N <= N for next_N, N in zip(points_next,points)])
+
+        # a segment with more points than it needs gets fewer the next time
+        numerics = mission.segments.cruise.state.numerics
+        numerics.number_control_points = 16
+        numerics.needed_control_points = None
+        mission.evaluate()
+        assert numerics.number_control_points == 16
+        assert 4 <= numerics.needed_control_points < 16
+
+        adaptive = mission.evaluate()
+        print(mission.tag + ' cruise control points coarsened: ', numerics.number_control_points)
+        assert numerics.number_control_points < 16
+
+        adaptive_mass = adaptive.segments.descent.conditions.weights.total_mass[-1,0]
+        error_mass    = np.abs(fixed_mass - adaptive_mass)/fixed_mass
+        print('landing mass error: ', error_mass)
+        assert error_mass < 1e-4
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses,mission_type,number_control_points,adaptive_control_points):
+
+    mission = mission_type()
+    mission.tag = mission_type.__name__
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points   = number_control_points
+    base_segment.state.numerics.adaptive_control_points = adaptive_control_points
+    base_segment.process.iterate.conditions.stability    = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability = SUAVE.Methods.skip
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = 2000.   * Units.km
+    mission.append_segment(segment)
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+# block_sparse_mission.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" solves an all at once mission with the dense and the block sparse Jacobian, with incremental
+    evaluation of the sub segments and with a contiguous state, and compares them. the block sparse
+    solve takes less than half the mission evaluations of the dense one
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+import sys
+from copy import deepcopy
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # dense finite difference Jacobian through fsolve
+    mission, counter  = mission_setup(analyses)
+    dense             = mission.evaluate()
+    dense_evaluations = counter[0]
+
+    # colored, block sparse Jacobian
+    mission, counter   = mission_setup(analyses)
+    mission.state.numerics.solver_jacobian = 'block_sparse'
+    sparse             = mission.evaluate()
+    sparse_evaluations = counter[0]
+
+    assert mission.converged
+
+    # the colored Jacobian takes a few evaluations where fsolve differences every unknown
+    print('mission evaluations, dense: ', dense_evaluations, ' sparse: ', sparse_evaluations)
+    assert sparse_evaluations < 0.5 * dense_evaluations
+
+    # only re-evaluate the sub segments that changed
+    mission, _ = mission_setup(analyses)
+    mission.state.numerics.incremental_evaluation = True
+    incremental = mission.evaluate()
+
+    # pack, unpack and merge through preallocated contiguous arrays
+    mission, _ = mission_setup(analyses)
+    mission.state.numerics.contiguous_state = True
+    contiguous = mission.evaluate()
+
+    # the layout is bound, but is not one of the unknowns
+    unknowns = contiguous.state.unknowns
+    assert isinstance(unknowns._layout, SUAVE.Core.Layout)
+    assert not '_layout' in unknowns.keys()
+    assert not '_layout' in deepcopy(unknowns).keys()
+    assert np.all(unknowns.pack_array() == deepcopy(unknowns).pack_array())
+
+    for tag in ['climb','cruise','descent']:
+        dense_throttle  = dense.segments[tag].conditions.propulsion.throttle
+        sparse_throttle = sparse.segments[tag].conditions.propulsion.throttle
+        error = np.max(np.abs(dense_throttle - sparse_throttle))
+        print(tag + ' throttle error: ', error)
+        assert error < 1e-6
+
+        incremental_throttle = incremental.segments[tag].conditions.propulsion.throttle
+        error = np.max(np.abs(dense_throttle - incremental_throttle))
+        print(tag + ' incremental throttle error: ', error)
+        assert error < 1e-12
+
+        contiguous_throttle = contiguous.segments[tag].conditions.propulsion.throttle
+        error = np.max(np.abs(dense_throttle - contiguous_throttle))
+        print(tag + ' contiguous throttle error: ', error)
+        assert error < 1e-12
+
+    dense_mass  = dense.segments.descent.conditions.weights.total_mass[-1,0]
+    sparse_mass = sparse.segments.descent.conditions.weights.total_mass[-1,0]
+    error_mass  = np.abs(dense_mass - sparse_mass)/dense_mass
+    print('landing mass error: ', error_mass)
+    assert error_mass < 1e-6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses):
+
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points = 4
+    base_segment.process.iterate.conditions.stability    = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability = SUAVE.Methods.skip
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = 2000.00 * Units.km
+    mission.append_segment(segment)
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    # count the evaluations of the mission
+    counter = [0]
+    def count(segment):
+        counter[0] += 1
+    mission.process.iterate.count = count
+
+    return mission, counter
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# ensemble_mission.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" converges variants of an all at once mission together as an ensemble and compares them to the
+    variants solved alone
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Missions.Segments import converge_ensemble
+
+import numpy as np
+
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    distances = [2000.,2100.,2200.]
+
+    # each variant alone, with the same colored Jacobian
+    alone = []
+    alone_evaluations = 0
+    for distance in distances:
+        mission, counter = mission_setup(analyses,distance)
+        mission.state.numerics.solver_jacobian = 'block_sparse'
+        alone.append(mission.evaluate())
+        alone_evaluations += counter[0]
+
+    # the variants together
+    missions = []
+    counters = []
+    for distance in distances:
+        mission, counter = mission_setup(analyses,distance)
+        mission.process.initialize(mission)
+        missions.append(mission)
+        counters.append(counter)
+
+    converge_ensemble(missions)
+
+    for mission in missions:
+        mission.process.iterate(mission)
+        mission.process.finalize(mission)
+
+    ensemble_evaluations = sum([counter[0] for counter in counters])
+
+    print('mission evaluations, alone: ', alone_evaluations, ' ensemble: ', ensemble_evaluations)
+    print('ensemble evaluations of each variant: ', [counter[0] for counter in counters])
+
+    # the later variants start from the first one and share its Jacobian
+    assert ensemble_evaluations < 0.85*alone_evaluations
+    assert counters[1][0] < counters[0][0] and counters[2][0] < counters[0][0]
+
+    for results, mission in zip(alone, missions):
+        assert mission.converged
+        for tag in ['climb','cruise','descent']:
+            alone_throttle    = results.segments[tag].conditions.propulsion.throttle
+            ensemble_throttle = mission.segments[tag].conditions.propulsion.throttle
+            error = np.max(np.abs(alone_throttle - ensemble_throttle))
+            print(tag + ' throttle error: ', error)
+            assert error < 1e-6
+
+        alone_mass    = results.segments.descent.conditions.weights.total_mass[-1,0]
+        ensemble_mass = mission.segments.descent.conditions.weights.total_mass[-1,0]
+        error_mass    = np.abs(alone_mass - ensemble_mass)/alone_mass
+        print('landing mass error: ', error_mass)
+        assert error_mass < 1e-6
+
+    # a longer cruise burns more fuel
+    landing_mass = [mission.segments.descent.conditions.weights.total_mass[-1,0] for mission in missions]
+    assert landing_mass[0] > landing_mass[1] > landing_mass[2]
+
+    # a small step is not enough to converge while the residuals are larger than asked for
+    missions = []
+    for distance in distances[:2]:
+        mission, counter = mission_setup(analyses,distance)
+        mission.process.initialize(mission)
+        missions.append(mission)
+    missions[1].state.numerics.tolerance_residual = 1e-14
+
+    converge_ensemble(missions)
+
+    assert missions[0].converged
+    assert not missions[1].converged
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses,cruise_distance):
+
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points = 4
+    base_segment.process.iterate.conditions.stability    = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability = SUAVE.Methods.skip
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = cruise_distance * Units.km
+    mission.append_segment(segment)
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    # count the evaluations of the mission
+    counter = [0]
+    def count(segment):
+        counter[0] += 1
+    mission.process.iterate.count = count
+
+    return mission, counter
+
+if __name__ == '__main__':
+    main()
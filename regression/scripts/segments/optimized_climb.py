@@ -0,0 +1,105 @@
+# optimized_climb.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" flies an optimized climb with the separate SLSQP callbacks and with the shared evaluation and
+    sparse gradients, and compares them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    # separate objective and constraint callbacks with finite differences in SLSQP
+    mission, counter = mission_setup(analyses)
+    dense = mission.evaluate()
+    dense_evaluations = counter[0]
+
+    # one evaluation per point, colored finite differences
+    mission, counter = mission_setup(analyses)
+    mission.segments.climb.state.numerics.solver_jacobian = 'block_sparse'
+    sparse = mission.evaluate()
+    sparse_evaluations = counter[0]
+
+    assert mission.segments.climb.converged
+
+    print('segment evaluations, dense: ', dense_evaluations, ' sparse: ', sparse_evaluations)
+    assert sparse_evaluations < dense_evaluations
+
+    dense_time  = dense.segments.climb.conditions.frames.inertial.time[-1,0]
+    sparse_time = sparse.segments.climb.conditions.frames.inertial.time[-1,0]
+    error_time  = np.abs(dense_time - sparse_time)/dense_time
+    print('time to climb error: ', error_time)
+    assert error_time < 1e-3
+
+    dense_mass  = dense.segments.climb.conditions.weights.total_mass[-1,0]
+    sparse_mass = sparse.segments.climb.conditions.weights.total_mass[-1,0]
+    error_mass  = np.abs(dense_mass - sparse_mass)/dense_mass
+    print('climb mass error: ', error_mass)
+    assert error_mass < 1e-4
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses):
+
+    mission = SUAVE.Analyses.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    segment = Segments.Climb.Optimized()
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.state.numerics.number_control_points = 4
+    segment.altitude_start  = 0.0   * Units.km
+    segment.altitude_end    = 3.0   * Units.km
+    segment.air_speed_start = 125.0 * Units['m/s']
+    segment.air_speed_end   = 160.0 * Units['m/s']
+    segment.objective       = 'conditions.frames.inertial.time[-1,0]'
+    segment.process.iterate.conditions.stability    = SUAVE.Methods.skip
+    segment.process.finalize.post_process.stability = SUAVE.Methods.skip
+
+    # count the evaluations of the segment
+    counter = [0]
+    def count(segment):
+        counter[0] += 1
+    segment.process.iterate.outputs.count = count
+
+    mission.append_segment(segment)
+
+    return mission, counter
+
+if __name__ == '__main__':
+    main()
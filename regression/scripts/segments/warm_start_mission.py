@@ -0,0 +1,171 @@
+# warm_start_mission.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" solves all at once missions cold and from a warm start store, with the same and with a different
+    number of control points, and compares them
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+from copy import deepcopy
+
+import sys
+
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+from Boeing_737 import vehicle_setup, configs_setup
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    configs  = configs_setup(vehicle)
+    analyses = mission_B737.analyses_setup(configs)
+
+    configs.finalize()
+    analyses.finalize()
+
+    store = SUAVE.Analyses.Mission.Warm_Start()
+
+    # fill the store
+    mission, counter = mission_setup(analyses)
+    mission.state.numerics.warm_start = store
+    mission.evaluate()
+
+    assert mission.converged
+    assert store.number_of_solutions() == 3
+
+    # the same mission again, which starts from its own solution
+    mission, counter = mission_setup(analyses)
+    mission.evaluate()
+    cold_evaluations = counter[0]
+
+    mission, counter = mission_setup(analyses)
+    mission.state.numerics.warm_start = store
+    mission.evaluate()
+    warm_evaluations = counter[0]
+
+    print('same mission, mission evaluations, cold: ', cold_evaluations, ' warm: ', warm_evaluations)
+    assert warm_evaluations < cold_evaluations
+    assert len(store.jacobians) == 1
+
+    # a new mission with a longer cruise, cold and warm
+    for number_control_points in [4,6]:
+        mission, counter = mission_setup(analyses,number_control_points,2100.)
+        cold = mission.evaluate()
+        cold_evaluations = counter[0]
+
+        mission, counter = mission_setup(analyses,number_control_points,2100.)
+        mission.state.numerics.warm_start = store
+        warm = mission.evaluate()
+        warm_evaluations = counter[0]
+
+        assert mission.converged
+
+        # the first guesses and the stored solution are evaluated before the solve, which starts from
+        # the residuals of the stored solution, and with its Jacobian when it has as many unknowns
+        residuals = counter[1]
+        print(number_control_points, ' control points, mission evaluations, cold: ', cold_evaluations, ' warm: ', warm_evaluations)
+        print(number_control_points, ' control points, residuals, first guess: ', residuals[0], ' stored solution: ', residuals[1])
+        assert residuals[1] < 0.01 * residuals[0]
+        assert warm_evaluations <= cold_evaluations
+
+        for tag in ['climb','cruise','descent']:
+            cold_throttle = cold.segments[tag].conditions.propulsion.throttle
+            warm_throttle = warm.segments[tag].conditions.propulsion.throttle
+            error = np.max(np.abs(cold_throttle - warm_throttle))
+            print(tag + ' throttle error: ', error)
+            assert error < 1e-6
+
+    # a store that is further from the solution than the first guesses is not used
+    bad_store = deepcopy(store)
+    for solutions in bad_store.solutions.values():
+        for solution in solutions:
+            for value in solution.unknowns.values():
+                if isinstance(value,np.ndarray):
+                    value[...] = 1.5
+
+    mission, counter = mission_setup(analyses)
+    mission.evaluate()
+    cold_evaluations = counter[0]
+
+    mission, counter = mission_setup(analyses)
+    mission.state.numerics.warm_start = bad_store
+    mission.evaluate()
+    warm_evaluations = counter[0]
+
+    print('bad store, mission evaluations, cold: ', cold_evaluations, ' warm: ', warm_evaluations)
+    assert mission.converged
+    assert warm_evaluations == cold_evaluations + 2
+
+    # both point counts are kept for each segment
+    assert store.number_of_solutions() == 6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses,number_control_points=4,cruise_distance=2000.):
+
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+    base_segment.state.numerics.number_control_points = number_control_points
+    base_segment.process.iterate.conditions.stability    = SUAVE.Methods.skip
+    base_segment.process.finalize.post_process.stability = SUAVE.Methods.skip
+
+    segment = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.takeoff )
+    segment.altitude_start = 0.0   * Units.km
+    segment.altitude_end   = 5.0   * Units.km
+    segment.air_speed      = 125.0 * Units['m/s']
+    segment.climb_rate     = 6.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    segment = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.cruise )
+    segment.air_speed  = 230.412 * Units['m/s']
+    segment.distance   = cruise_distance * Units.km
+    mission.append_segment(segment)
+
+    segment = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.landing )
+    segment.altitude_end = 0.0   * Units.km
+    segment.air_speed    = 145.0 * Units['m/s']
+    segment.descent_rate = 5.0   * Units['m/s']
+    mission.append_segment(segment)
+
+    # count the evaluations of the mission and keep their residuals
+    counter = [0,[]]
+    def count(segment):
+        counter[0] += 1
+        counter[1].append(np.linalg.norm(segment.state.residuals.pack_array()))
+    mission.process.iterate.count = count
+
+    return mission, counter
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@
 #           Oct 2018, M. Clarke
 #           Aug 2019, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,7 +24,9 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry            import write_geome
 from SUAVE.Methods.Aerodynamics.AVL.write_mass_file           import write_mass_file
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases           import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck          import write_input_deck
-from SUAVE.Methods.Aerodynamics.AVL.run_analysis              import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis              import run_analysis, run_analysis_jobs, batch_cache_keys
+from SUAVE.Core.result_cache                                  import load_result, save_result
+from SUAVE.Methods.Utilities.adaptive_grid_sampling           import adaptive_grid_sampling
 from SUAVE.Methods.Aerodynamics.AVL.translate_data            import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files               import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings             import Settings
@@ -214,53 +217,51 @@ class AVL_Inviscid(Aerodynamics):
         self.training.
           coefficients     [-] CL and CD
           grid_points      [radians,-] angles of attack and Mach numbers 
+          angle_of_attack  [radians] refined, with adaptive training
+          Mach             [-] refined, with adaptive training
         Properties Used:
         self.geometry.tag  <string>
         self.training.     
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.training_cache_directory (optional - folder of previous AVL batches)
+        self.settings.
+          adaptive_training_tolerance [-] (optional - refine the table until this error)
+          adaptive_training_samples   [-]
         """          
         # Unpack
         run_folder    = os.path.abspath(self.settings.filenames.run_folder)
         geometry      = self.geometry
         training      = self.training   
-        trim_aircraft = self.settings.trim_aircraft 
+        settings      = self.settings
         AoA           = training.angle_of_attack
         Mach          = training.Mach   
-        atmosphere    = SUAVE.Analyses.Atmospheric.US_Standard_1976()
-        atmo_data     = atmosphere.compute_values(altitude = 0.0) 
-        
-        len_AoA = len(AoA)
-        len_Mach = len(Mach)
-        
-        CL = np.zeros((len_AoA,len_Mach))
-        CD = np.zeros_like(CL)  
-        e  = np.zeros_like(CL)
         
         # remove old files in run directory
         if os.path.exists('avl_files'):
             if not self.regression_flag:
                 rmtree(run_folder)
                 
-        for i,_ in enumerate(Mach):
-            # Set training conditions
-            run_conditions = Aerodynamics()
-            run_conditions.freestream.density           = atmo_data.density[0,0]  
-            run_conditions.freestream.gravity           = 9.81        
-            run_conditions.aerodynamics.angle_of_attack = AoA 
-            run_conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound[0,0] 
-            run_conditions.aerodynamics.side_slip_angle = 0.0
-            run_conditions.freestream.mach_number       = Mach[i]
-            run_conditions.freestream.velocity          = Mach[i] * run_conditions.freestream.speed_of_sound
-            
-            #Run Analysis at AoA[i] and Mach[j]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
+        if settings.adaptive_training_tolerance is None or self.training_file:
+            # Run Analysis at AoA[:] and Mach[i], one AVL batch per Mach number
+            Mach_mesh, AoA_mesh = np.meshgrid(Mach, AoA, indexing='ij')
+            points       = np.vstack([AoA_mesh.flatten(),Mach_mesh.flatten()]).T
+            coefficients = self.sample_points(points).reshape((len(Mach),len(AoA),3)).transpose((2,1,0))
+        else:
+            # Start from the table and add the conditions where the coefficients are least certain
+            AoA, Mach, coefficients = adaptive_grid_sampling(self.sample_points, AoA, Mach,
+                                                             settings.adaptive_training_tolerance,
+                                                             settings.adaptive_training_samples)
+            training.angle_of_attack = AoA
+            training.Mach            = Mach
             
-            # Obtain CD , CL and e
-            CL[:,i] = results.aerodynamics.lift_coefficient[:,0]
-            CD[:,i] = results.aerodynamics.drag_breakdown.induced.total[:,0]      
-            e [:,i] = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
+        len_AoA  = len(AoA)
+        len_Mach = len(Mach)
+        
+        CL = coefficients[0]
+        CD = coefficients[1]
+        e  = coefficients[2]
         
         if self.training_file:
             # load data 
@@ -294,6 +295,80 @@ class AVL_Inviscid(Aerodynamics):
         return        
     
 
+    def sample_points(self,points):
+        """Runs AVL at a list of conditions, one batch per Mach number. Batches in the training cache
+        are loaded instead of run, and the batches that are run are added to it.
+        Assumptions:
+        Returned drag values are not meaningful.
+        Source:
+        N/A
+        Inputs:
+        points             [radians,-] angles of attack and Mach numbers
+        Outputs:
+        coefficients       [-] CL, CD and e of each condition, array of [len(points),3]
+        Properties Used:
+        self.settings.
+          trim_aircraft
+          number_of_jobs
+          training_cache_directory
+          training_cache_memory
+        self.regression_flag
+        """   
+        settings      = self.settings
+        trim_aircraft = settings.trim_aircraft 
+        atmosphere    = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+        atmo_data     = atmosphere.compute_values(altitude = 0.0) 
+        
+        # Mach numbers in the order they first appear
+        _, first = np.unique(points[:,1], return_index=True)
+        Mach     = points[np.sort(first),1]
+        
+        batches = []
+        rows    = []
+        for i,_ in enumerate(Mach):
+            index = np.where(points[:,1] == Mach[i])[0]
+            
+            # Set training conditions
+            run_conditions = Aerodynamics()
+            run_conditions.freestream.density           = atmo_data.density[0,0]  
+            run_conditions.freestream.gravity           = 9.81        
+            run_conditions.aerodynamics.angle_of_attack = points[index,0] 
+            run_conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound[0,0] 
+            run_conditions.aerodynamics.side_slip_angle = 0.0
+            run_conditions.freestream.mach_number       = Mach[i]
+            run_conditions.freestream.velocity          = Mach[i] * run_conditions.freestream.speed_of_sound
+            batches.append(run_conditions)
+            rows.append(index)
+            
+        # batches in the training cache are not run again
+        cache_directory = settings.training_cache_directory
+        keys            = batch_cache_keys(self, batches, trim_aircraft)
+        stored          = [load_result(cache_directory,key) for key in keys]
+        run             = [i for i,values in enumerate(stored) if values is None]
+        
+        if settings.number_of_jobs > 1 and not self.regression_flag:
+            batch_results = run_analysis_jobs(self, [batches[i] for i in run], trim_aircraft)
+        else:
+            batch_results = [self.evaluate_conditions(batches[i], trim_aircraft) for i in run]
+            
+        coefficients = np.zeros((len(points),3))
+        
+        for i,results in zip(run,batch_results):
+            
+            # Obtain CD , CL and e
+            CL = results.aerodynamics.lift_coefficient[:,0]
+            CD = results.aerodynamics.drag_breakdown.induced.total[:,0]      
+            e  = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
+            coefficients[rows[i]] = np.vstack([CL,CD,e]).T
+            
+            save_result(cache_directory, keys[i], dict(CL=CL,CD=CD,e=e), settings.training_cache_memory)
+            
+        for i,values in enumerate(stored):
+            if values is not None:
+                coefficients[rows[i]] = np.vstack([values['CL'],values['CD'],values['e']]).T
+                
+        return coefficients
+
     def build_surrogate(self):
         """Builds a surrogate based on sample evalations using a Guassian process.
         Assumptions:
@@ -364,6 +439,53 @@ class AVL_Inviscid(Aerodynamics):
           cases
         """           
         
+        run_folder = os.path.abspath(self.settings.filenames.run_folder)
+        
+        # write the input files
+        with redirect.folder(run_folder,force=False):
+            cases = self.write_conditions(run_conditions, trim_aircraft)
+
+            # RUN AVL!
+            results_avl = run_analysis(self)
+    
+        # translate results
+        results = self.translate_results(run_conditions, cases, results_avl)
+        
+        if not self.keep_files:
+            rmtree( run_folder )
+            
+        return results
+        
+    def write_conditions(self,run_conditions, trim_aircraft):
+        """Writes the geometry, mass, run case and input deck files of one AVL batch in the working
+        directory.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        trim_aircraft  <boolean>
+
+        Outputs:
+        cases          <SUAVE data type> the run cases of the batch
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          output_template
+          batch_template
+          deck_template
+        self.current_status.
+          batch_index
+          batch_file
+          deck_file
+          cases
+        """           
+        
         # unpack
         run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
         run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')   
@@ -428,20 +550,34 @@ class AVL_Inviscid(Aerodynamics):
             case.eigen_result_filename_1    = dynamic_results_template_1.format(case.tag)     # 'eigen_mode_{}.dat'
             case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)     # 'system_matrix_{}.dat'
         
-        # write the input files
-        with redirect.folder(run_folder,force=False):
-            write_geometry(self,run_script_path)
-            write_mass_file(self,run_conditions)
-            write_run_cases(self,trim_aircraft)
-            write_input_deck(self, trim_aircraft)
+        write_geometry(self,run_script_path)
+        write_mass_file(self,run_conditions)
+        write_run_cases(self,trim_aircraft)
+        write_input_deck(self, trim_aircraft)
+            
+        return cases
+        
+    def translate_results(self,run_conditions, cases, results_avl):
+        """Translates the results read from the AVL output files of one batch to conditions.
 
-            # RUN AVL!
-            results_avl = run_analysis(self)
-    
-        # translate results
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        cases          <SUAVE data type> the run cases of the batch
+        results_avl    <SUAVE data type>
+
+        Outputs:
+        results        <SUAVE data type>
+
+        Properties Used:
+        N/A
+        """           
+        
         results = translate_results_to_conditions(cases,results_avl)
-    
-        if not self.keep_files:
-            rmtree( run_folder )
             
         return results
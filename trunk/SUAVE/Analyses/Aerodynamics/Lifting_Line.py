@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2017, E. Botero
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,7 @@ import numpy as np
 from SUAVE.Core import Data, Units
 from SUAVE.Methods.Aerodynamics.Lifting_Line import lifting_line as LL
 from .Aerodynamics import Aerodynamics
+from SUAVE.Methods.Utilities.adaptive_grid_sampling import adaptive_grid_sampling
 
 # ----------------------------------------------------------------------
 #  Class
@@ -59,6 +61,11 @@ class Lifting_Line(Aerodynamics):
         # vortex lattice configurations
         self.settings.number_of_stations  = 100
         
+        # the training angles of attack are refined until the leave-one-out error of the
+        # coefficients is below the tolerance, None to run the table as it is
+        self.settings.adaptive_training_tolerance = None
+        self.settings.adaptive_training_samples   = 20
+        
         # conditions table, used for surrogate model training
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
@@ -195,6 +202,9 @@ class Lifting_Line(Aerodynamics):
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
+        self.settings.
+          adaptive_training_tolerance [-] (optional - refine the table until this error)
+          adaptive_training_samples   [-]
         self.training.angle_of_attack [radians]
         """        
         # unpack
@@ -202,6 +212,10 @@ class Lifting_Line(Aerodynamics):
         settings = self.settings
         training = self.training
         
+        if settings.adaptive_training_tolerance is not None:
+            self.sample_adaptive_training()
+            return
+        
         AoA = training.angle_of_attack
         CL  = np.zeros_like(AoA)
         CDi = np.zeros_like(AoA)
@@ -233,6 +247,75 @@ class Lifting_Line(Aerodynamics):
 
         return
 
+    def sample_adaptive_training(self):
+        """Runs the lifting line from the training angles of attack, adding angles of attack where
+        the leave-one-out error of the lift and drag is largest.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        see properties used
+
+        Outputs:
+        self.training.
+          angle_of_attack             [radians] refined
+          lift_coefficient            [-] 
+          wing_lift_coefficients      [-] (wing specific)
+          drag_coefficient            [-] 
+          wing_drag_coefficients      [-] (wing specific)
+
+        Properties Used:
+        self.geometry.wings.*.tag
+        self.settings                 (passed to calculate vortex lattice)
+        self.settings.
+          adaptive_training_tolerance [-]
+          adaptive_training_samples   [-]
+        self.training.angle_of_attack [radians]
+        """   
+        # unpack
+        geometry = self.geometry
+        settings = self.settings
+        training = self.training
+        wings    = list(geometry.wings.keys())
+        
+        # condition input, local, do not keep
+        konditions              = Data()
+        konditions.aerodynamics = Data()
+        
+        def sample(points):
+            values = np.zeros((len(points),2+2*len(wings)))
+            for i in range(len(points)):
+                konditions.aerodynamics.angle_of_attack = points[i,0]
+                CL, wing_lifts, CDi, wing_drags = calculate_lift_lifting_line(konditions, settings, geometry)
+                values[i,0] = CL
+                values[i,1] = CDi
+                for j,wing in enumerate(wings):
+                    values[i,2+j]            = wing_lifts[wing]
+                    values[i,2+len(wings)+j] = wing_drags[wing]
+            return values
+        
+        # a single line in the second direction, only the angle of attack is refined
+        AoA, _, values = adaptive_grid_sampling(sample, training.angle_of_attack, [0.],
+                                                settings.adaptive_training_tolerance,
+                                                settings.adaptive_training_samples, error_columns=[0,1])
+        values = values[:,:,0]
+        
+        # store training data
+        training.angle_of_attack        = AoA
+        training.lift_coefficient       = values[0]
+        training.drag_coefficient       = values[1]
+        training.wing_lift_coefficients = Data()
+        training.wing_drag_coefficients = Data()
+        for j,wing in enumerate(wings):
+            training.wing_lift_coefficients[wing] = values[2+j]
+            training.wing_drag_coefficients[wing] = values[2+len(wings)+j]
+        
+        return
+
     def build_surrogate(self):
         """Build a surrogate using sample evaluation results.
 
@@ -4,6 +4,7 @@
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,10 +18,15 @@ from SUAVE.Core import Data, Units
 from .Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Input_Output.SU2.read_SU2_history import read_SU2_history
+from SUAVE.Core.jobs import iterate_jobs
+from SUAVE.Core.result_cache import hash_files, load_result, save_result
+from SUAVE.Methods.Utilities.adaptive_grid_sampling import adaptive_grid_sampling
 from sklearn.gaussian_process.kernels import ExpSineSquared
 
 # Package imports
 import numpy as np
+import os
 import time
 import pylab as plt
 import sklearn
@@ -67,6 +73,22 @@ class SU2_inviscid(Aerodynamics):
         self.settings.parallel           = False
         self.settings.processors         = 1
         self.settings.maximum_iterations = 1500
+        
+        # Concurrent cases, each in its own folder
+        self.settings.executable         = 'SU2_CFD'
+        self.settings.number_of_jobs     = 1
+        self.settings.job_timeout        = None
+        self.settings.job_retries        = 0
+        self.settings.scratch_folder     = None
+        
+        # Cases already run for the same configuration and mesh are loaded from here
+        self.settings.training_cache_directory = None
+        self.settings.training_cache_memory    = 256. * 2**20
+        
+        # The training grid is refined from the conditions table until the leave-one-out error of
+        # the coefficients is below the tolerance, None to run the table as it is
+        self.settings.adaptive_training_tolerance = None
+        self.settings.adaptive_training_samples   = 30
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -179,6 +201,8 @@ class SU2_inviscid(Aerodynamics):
         self.training.
           coefficients     [-] CL and CD
           grid_points      [radians,-] angles of attack and mach numbers 
+          angle_of_attack  [radians] refined, with adaptive training
+          Mach             [-] refined, with adaptive training
 
         Properties Used:
         self.geometry.tag  <string>
@@ -186,6 +210,10 @@ class SU2_inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.training_cache_directory (optional - folder of previous SU2 cases)
+        self.settings.
+          adaptive_training_tolerance [-] (optional - refine the table until this error)
+          adaptive_training_samples   [-]
         """               
         # Unpack
         geometry = self.geometry
@@ -194,29 +222,37 @@ class SU2_inviscid(Aerodynamics):
         
         AoA  = training.angle_of_attack
         mach = training.Mach 
-        CL   = np.zeros([len(AoA)*len(mach),1])
-        CD   = np.zeros([len(AoA)*len(mach),1])
-
-        # Condition input, local, do not keep (k is used to avoid confusion)
-        konditions              = Data()
-        konditions.aerodynamics = Data()
 
         if self.training_file is None:
-            # Calculate aerodynamics for table
-            table_size = len(AoA)*len(mach)
-            xy = np.zeros([table_size,2])
-            count = 0
             time0 = time.time()
-            for i,_ in enumerate(AoA):
-                for j,_ in enumerate(mach):
-                    
-                    xy[count,:] = np.array([AoA[i],mach[j]])
-                    # Set training conditions
-                    konditions.aerodynamics.angle_of_attack = AoA[i]
-                    konditions.aerodynamics.mach            = mach[j]
-                    
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
-                    count += 1
+            
+            if settings.adaptive_training_tolerance is None:
+                # Calculate aerodynamics for table
+                table_size = len(AoA)*len(mach)
+                xy = np.zeros([table_size,2])
+                count = 0
+                for i,_ in enumerate(AoA):
+                    for j,_ in enumerate(mach):
+                        xy[count,:] = np.array([AoA[i],mach[j]])
+                        count += 1
+                        
+                CL,CD = run_SU2_cases(xy, settings, geometry)
+                
+            else:
+                # Start from the table and add the cases where the coefficients are least certain
+                sample = lambda points: np.hstack(run_SU2_cases(points, settings, geometry))
+                AoA, mach, values = adaptive_grid_sampling(sample, AoA, mach, settings.adaptive_training_tolerance,
+                                                           settings.adaptive_training_samples)
+                
+                training.angle_of_attack = AoA
+                training.Mach            = mach
+                
+                AoA_mesh, mach_mesh = np.meshgrid(AoA, mach, indexing='ij')
+                xy = np.vstack([AoA_mesh.flatten(),mach_mesh.flatten()]).T
+                CL = np.reshape(values[0],(-1,1))
+                CD = np.reshape(values[1],(-1,1))
+                
+                print('SU2 adaptive training cases: ' + str(len(xy)))
             
             time1 = time.time()
             
@@ -331,6 +367,67 @@ class SU2_inviscid(Aerodynamics):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+def run_SU2_cases(xy,settings,geometry):
+    """Runs SU2 at a list of conditions, concurrently when more than one job is allowed. Cases in
+    the training cache are loaded instead of run, and the cases that are run are added to it.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    xy                   [radians,-] angles of attack and mach numbers of the cases
+    settings.
+      number_of_jobs     [-]
+      parallel           <boolean>
+      training_cache_directory <string> or None
+      training_cache_memory    [bytes]
+      (see call_SU2 and call_SU2_jobs)
+    geometry             (see call_SU2)
+
+    Outputs:
+    CL                   [-] array of [len(xy),1]
+    CD                   [-] array of [len(xy),1]
+
+    Properties Used:
+    N/A
+    """      
+    
+    CL = np.zeros([len(xy),1])
+    CD = np.zeros([len(xy),1])
+    
+    # Condition input, local, do not keep (k is used to avoid confusion)
+    konditions              = Data()
+    konditions.aerodynamics = Data()
+    
+    # cases in the training cache are not run again
+    keys = training_cache_keys(xy, settings, geometry)
+    run  = []
+    for count,key in enumerate(keys):
+        values = load_result(settings.training_cache_directory,key)
+        if values is None:
+            run.append(count)
+        else:
+            CL[count],CD[count] = values['CL'],values['CD']
+            
+    if settings.number_of_jobs > 1 and not settings.parallel:
+        CL[run,0],CD[run,0] = call_SU2_jobs(xy[run], settings, geometry)
+    else:
+        for count in run:
+            # Set training conditions
+            konditions.aerodynamics.angle_of_attack = xy[count,0]
+            konditions.aerodynamics.mach            = xy[count,1]
+            
+            CL[count],CD[count] = call_SU2(konditions, settings, geometry)
+            
+    for count in run:
+        save_result(settings.training_cache_directory,keys[count],dict(CL=CL[count],CD=CD[count]),
+                    settings.training_cache_memory)
+        
+    return CL, CD
+
 def call_SU2(conditions,settings,geometry):
     """Calculates lift and drag using SU2
 
@@ -349,6 +446,7 @@ def call_SU2(conditions,settings,geometry):
       parallel           <boolean>
       processors         [-]
       maximum_iterations [-]
+      executable         <string>
     geometry.
       tag
       reference_area     [m^2]
@@ -361,10 +459,47 @@ def call_SU2(conditions,settings,geometry):
     N/A
     """      
 
-    half_mesh_flag = settings.half_mesh_flag
     tag            = geometry.tag
     parallel       = settings.parallel
     processors     = settings.processors 
+    
+    # Build SU2 configuration file
+    write_SU2_case(conditions, settings, geometry)
+    
+    # Run SU2
+    CL, CD = call_SU2_CFD(tag,parallel,processors,settings.executable)
+        
+    return CL, CD
+
+def write_SU2_case(conditions,settings,geometry):
+    """Writes the SU2 configuration file of one case in the working directory
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions.
+      mach_number        [-]
+      angle_of_attack    [radians]
+    settings.
+      half_mesh_flag     <boolean> Determines if a symmetry plane is used
+      maximum_iterations [-]
+    geometry.
+      tag
+      reference_area     [m^2]
+
+    Outputs:
+    <tag>.cfg
+
+    Properties Used:
+    N/A
+    """      
+
+    half_mesh_flag = settings.half_mesh_flag
+    tag            = geometry.tag
     iters          = settings.maximum_iterations
     
     SU2_settings = Data()
@@ -376,10 +511,109 @@ def call_SU2(conditions,settings,geometry):
     SU2_settings.angle_of_attack = conditions.aerodynamics.angle_of_attack / Units.deg
     SU2_settings.maximum_iterations = iters
     
-    # Build SU2 configuration file
     write_SU2_cfg(tag, SU2_settings)
     
-    # Run SU2
-    CL, CD = call_SU2_CFD(tag,parallel,processors)
+    return
+
+def call_SU2_jobs(xy,settings,geometry):
+    """Runs the SU2 cases concurrently, each in its own folder with a link to the mesh
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    xy                   [radians,-] angles of attack and mach numbers of the cases
+    settings.
+      executable         <string>
+      number_of_jobs     [-]
+      job_timeout        [s]
+      job_retries        [-]
+      scratch_folder     <string>
+      (see write_SU2_case)
+    geometry.
+      tag
+
+    Outputs:
+    CL                   [-]
+    CD                   [-]
+
+    Properties Used:
+    N/A
+    """      
+    
+    tag  = geometry.tag
+    mesh = os.path.abspath(tag + '.su2')
+    
+    jobs = []
+    for count in range(len(xy)):
+        konditions              = Data()
+        konditions.aerodynamics = Data()
+        konditions.aerodynamics.angle_of_attack = xy[count,0]
+        konditions.aerodynamics.mach            = xy[count,1]
+        
+        job         = Data()
+        job.tag     = tag + '_{0:03d}'.format(count)
+        job.command = [settings.executable, tag + '.cfg']
+        job.link    = [mesh]
+        job.prepare = lambda konditions=konditions: write_SU2_case(konditions, settings, geometry)
+        job.collect = lambda: read_SU2_history(tag + '_history.dat')
+        jobs.append(job)
+        
+    CL = np.zeros(len(xy))
+    CD = np.zeros(len(xy))
+    
+    for count, result in iterate_jobs(jobs,settings.number_of_jobs,settings.job_timeout,settings.job_retries,
+                                      settings.scratch_folder):
+        if not result.success:
+            raise RuntimeError('SU2 case ' + jobs[count].tag + ' ' + result.message)
+        CL[count], CD[count] = result.value
+        print('CL:',CL[count])
+        print('CD:',CD[count])
         
     return CL, CD
+
+def training_cache_keys(xy,settings,geometry):
+    """Finds the keys of the SU2 cases in the training cache from the configuration file written
+    for each case and the mesh
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    xy                   [radians,-] angles of attack and mach numbers of the cases
+    settings.
+      training_cache_directory <string> or None
+      (see write_SU2_case)
+    geometry.
+      tag
+
+    Outputs:
+    keys                 [list of strings] None for each case if there is no cache
+
+    Properties Used:
+    N/A
+    """      
+    
+    if settings.training_cache_directory is None:
+        return [None] * len(xy)
+    
+    tag  = geometry.tag
+    mesh = hash_files([tag + '.su2'])
+    
+    konditions              = Data()
+    konditions.aerodynamics = Data()
+    
+    keys = []
+    for count in range(len(xy)):
+        konditions.aerodynamics.angle_of_attack = xy[count,0]
+        konditions.aerodynamics.mach            = xy[count,1]
+        write_SU2_case(konditions, settings, geometry)
+        keys.append(hash_files([tag + '.cfg'], 'SU2 ' + mesh))
+        
+    return keys
@@ -9,6 +9,7 @@
 #           Dec 2018, M. Clarke
 #           Apr 2020, M. Clarke
 #           Jun 2020, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -19,16 +20,22 @@ import SUAVE
 
 from SUAVE.Core import Data
 from SUAVE.Core import Units
+from SUAVE.Core.jobs import picklable
 
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM, get_vortex_distribution
 # local imports
 from .Aerodynamics import Aerodynamics
-from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution import compute_vortex_distribution
 from SUAVE.Plots import plot_vehicle_vlm_panelization  
 from SUAVE.Methods.Aerodynamics.Supersonic_Zero.Drag.Cubic_Spline_Blender import Cubic_Spline_Blender
+from SUAVE.Methods.Utilities.adaptive_grid_sampling import adaptive_grid_sampling
 
 # package imports
 import numpy as np 
+import hashlib
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from scipy.interpolate import interp2d, RectBivariateSpline, RegularGridInterpolator
 
 # ----------------------------------------------------------------------
@@ -69,6 +76,15 @@ class Vortex_Lattice(Aerodynamics):
         self.settings.number_panels_spanwise         = 10
         self.settings.number_panels_chordwise        = 2 
         self.settings.vortex_distribution            = Data()   
+        self.settings.influence_cache_memory         = 256. * 2**20 # bytes of induced velocities kept per Mach number
+        self.settings.influence_cache                = None         # induced velocities of the vortex distribution, by Mach number
+        self.settings.memory_budget                  = 2. * 2**30   # bytes of influence matrices built at once
+        self.settings.align_wake_to_freestream       = True         # otherwise the wake follows the chord line
+        self.settings.training_cache_directory       = None         # folder of stored training samples, None to not store them
+        self.settings.training_cache_size            = 32           # number of stored training samples kept
+        self.settings.training_processes             = 1            # processes the training Mach numbers are split across
+        self.settings.adaptive_training_tolerance    = None         # leave-one-out error the training grid is refined to, None for a fixed grid
+        self.settings.adaptive_training_samples      = 256          # most training samples of the refined grid
         
         # conditions table, used for surrogate model training
         self.training                                = Data()    
@@ -135,11 +151,10 @@ class Vortex_Lattice(Aerodynamics):
         if n_cw is not None:
             settings.number_panels_chordwise = n_cw
             
-        # generate vortex distribution
-        VD = compute_vortex_distribution(geometry,settings)      
+        # generate vortex distribution, reused by the VLM while the geometry is unchanged
+        VD = get_vortex_distribution(geometry,settings)      
         
         # Pack
-        settings.vortex_distribution        = VD
         settings.use_surrogate              = use_surrogate
         settings.include_slipstream_effect  = include_slipstream_effect
         
@@ -354,43 +369,55 @@ class Vortex_Lattice(Aerodynamics):
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
+        self.settings.
+          training_cache_directory    [-]
+          training_cache_size         [-]
+          training_processes          [-]
+          adaptive_training_tolerance [-]
+          adaptive_training_samples   [-]
         self.training.angle_of_attack [radians]
+        self.training.Mach            [-]
         """
         # unpack
         geometry      = self.geometry
         settings      = self.settings
         training      = self.training
-        AoA           = training.angle_of_attack 
-        Mach          = training.Mach
-        data_len      = len(AoA) 
-        
-        # Assign placeholders        
-        CL_sub    = np.zeros((data_len,data_len))
-        CL_sup    = np.zeros_like(CL_sub)  
-        CDi_sub   = np.zeros_like(CL_sub)
-        CDi_sup   = np.zeros_like(CL_sub)
+        
         CL_w_sub  = Data()
         CL_w_sup  = Data()
         CDi_w_sub = Data()
         CDi_w_sup = Data() 
+        
+        # Reuse stored samples of the same panelized geometry, otherwise split the Mach numbers across processes
+        key     = training_key(settings,geometry,training)
+        samples = load_training_samples(settings.training_cache_directory,key,geometry)
+        
+        if samples is None:
+            if settings.adaptive_training_tolerance is None:
+                AoA     = training.angle_of_attack 
+                Mach    = training.Mach
+                AoAs    = np.atleast_2d(np.tile(AoA,len(Mach)).T.flatten()).T
+                Machs   = np.atleast_2d(np.tile(Mach,len(AoA)).flatten()).T
+                samples = evaluate_training_samples(settings,geometry,AoAs,Machs)
+            else:
+                samples = evaluate_adaptive_training_samples(settings,geometry,training)
+            save_training_samples(settings.training_cache_directory,key,samples,settings.training_cache_size)
+            
+        # The adaptive training refines the grid
+        if 'angle_of_attack' in samples:
+            training.angle_of_attack = samples.angle_of_attack
+            training.Mach            = samples.Mach
             
         # Setup new array shapes for vectorization
+        AoA    = training.angle_of_attack 
+        Mach   = training.Mach
         lenAoA = len(AoA)
-        lenM   = len(Mach)
-        AoAs   = np.atleast_2d(np.tile(AoA,lenM).T.flatten()).T
         Machs  = np.atleast_2d(np.tile(Mach,lenAoA).flatten()).T
-        zeros  = np.zeros_like(Machs)
-        
-        # Setup Konditions                      
-        konditions                              = Data()
-        konditions.aerodynamics                 = Data()
-        konditions.freestream                   = Data()
-        konditions.aerodynamics.angle_of_attack = AoAs
-        konditions.freestream.mach_number       = Machs
-        konditions.freestream.velocity          = zeros
-        
-        total_lift, total_drag, wing_lifts, wing_drags, wing_lift_distribution , wing_drag_distribution, pressure_coefficient = \
-                        calculate_VLM(konditions,settings,geometry)     
+            
+        total_lift = samples.lift_coefficient
+        total_drag = samples.drag_coefficient
+        wing_lifts = samples.wing_lift_coefficients
+        wing_drags = samples.wing_drag_coefficients
         
         # Split subsonic from supersonic
         sub_sup_split = np.where(Machs < 1.0)[0][-1] + 1 
@@ -401,11 +428,11 @@ class Vortex_Lattice(Aerodynamics):
         CDi_sub = total_drag[0:sub_sup_split,0]
         CDi_sup = total_drag[sub_sup_split:,0]
         
-        # A little reshape to get into the right order
-        CL_sub  = np.reshape(CL_sub,(lenAoA,int(len(CL_sub)/lenAoA))).T
-        CL_sup  = np.reshape(CL_sup,(lenAoA,int(len(CL_sup)/lenAoA))).T
-        CDi_sub = np.reshape(CDi_sub ,(lenAoA,int(len(CDi_sub )/lenAoA))).T
-        CDi_sup = np.reshape(CDi_sup,(lenAoA,int(len(CDi_sup)/lenAoA))).T
+        # A little reshape to get into the right order, angles of attack along the rows
+        CL_sub  = np.reshape(CL_sub,(int(len(CL_sub)/lenAoA),lenAoA)).T
+        CL_sup  = np.reshape(CL_sup,(int(len(CL_sup)/lenAoA),lenAoA)).T
+        CDi_sub = np.reshape(CDi_sub ,(int(len(CDi_sub )/lenAoA),lenAoA)).T
+        CDi_sup = np.reshape(CDi_sup,(int(len(CDi_sup)/lenAoA),lenAoA)).T
         
         # Now do the same for each wing
         for wing in geometry.wings.keys():
@@ -417,10 +444,10 @@ class Vortex_Lattice(Aerodynamics):
             CDi_wing_sup = wing_drags[wing][sub_sup_split:,0]  
             
             # Rearrange and pack
-            CL_w_sub[wing]  = np.reshape(CL_wing_sub,(lenAoA,int(len(CL_wing_sub)/lenAoA))).T
-            CL_w_sup[wing]  = np.reshape(CL_wing_sup,(lenAoA,int(len(CL_wing_sup)/lenAoA))).T
-            CDi_w_sub[wing] = np.reshape(CDi_wing_sub,(lenAoA,int(len(CDi_wing_sub)/lenAoA))).T        
-            CDi_w_sup[wing] = np.reshape(CDi_wing_sup,(lenAoA,int(len(CDi_wing_sup)/lenAoA))).T       
+            CL_w_sub[wing]  = np.reshape(CL_wing_sub,(int(len(CL_wing_sub)/lenAoA),lenAoA)).T
+            CL_w_sup[wing]  = np.reshape(CL_wing_sup,(int(len(CL_wing_sup)/lenAoA),lenAoA)).T
+            CDi_w_sub[wing] = np.reshape(CDi_wing_sub,(int(len(CDi_wing_sub)/lenAoA),lenAoA)).T        
+            CDi_w_sup[wing] = np.reshape(CDi_wing_sup,(int(len(CDi_wing_sup)/lenAoA),lenAoA)).T       
         
         # surrogate not run on sectional coefficients and pressure coefficients
         # Store training data 
@@ -481,8 +508,8 @@ class Vortex_Lattice(Aerodynamics):
         CDi_w_data_sup = training.wing_drag_coefficient_sup 
          
         # transonic regime   	                             
-        CL_data_trans        = np.zeros((len(mach_data_sub),3))	      
-        CDi_data_trans       = np.zeros((len(mach_data_sub),3))	 	      
+        CL_data_trans        = np.zeros((len(AoA_data),3))	      
+        CDi_data_trans       = np.zeros((len(AoA_data),3))	 	      
         CL_w_data_trans      = Data()	                     
         CDi_w_data_trans     = Data()    
         CL_data_trans[:,0]   = CL_data_sub[:,-1]    	     
@@ -601,3 +628,314 @@ def calculate_VLM(conditions,settings,geometry):
         i+=1
 
     return total_lift_coeff, total_induced_drag_coeff, wing_lifts, wing_drags , cl_y , cdi_y , CPi
+
+
+def evaluate_training_samples(settings,geometry,AoAs,Machs):
+    """Runs the vortex lattice over the training conditions. The conditions are split into blocks of
+    whole Mach numbers, evaluated in parallel when more than one process is allowed. The blocks are
+    evaluated in this process, with a warning, if the analysis can't be sent to the processes or they
+    stop unexpectedly. Errors of the vortex lattice itself are raised.
+
+    Assumptions:
+    The conditions are ordered by Mach number
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.training_processes     [-]
+    settings                        (passed to vortex lattice method)
+    geometry                        (passed to vortex lattice method)
+    AoAs                            [radians]
+    Machs                           [-]
+
+    Outputs:
+    samples.
+      lift_coefficient              [array]
+      drag_coefficient              [array]
+      wing_lift_coefficients        [Data]
+      wing_drag_coefficients        [Data]
+
+    Properties Used:
+    N/A
+    """    
+    
+    bounds    = np.concatenate([[0],np.where(np.diff(Machs[:,0]) != 0.)[0] + 1,[len(Machs)]])
+    n_mach    = len(bounds) - 1
+    processes = min(max(int(settings.training_processes),1),n_mach)
+    blocks    = [np.arange(bounds[block[0]],bounds[block[-1]+1]) for block in np.array_split(np.arange(n_mach),processes)]
+    
+    # the cached induced velocities stay in this process
+    worker_settings = Data(settings)
+    worker_settings.influence_cache = None
+    
+    if processes > 1 and not picklable(worker_settings,geometry):
+        warnings.warn('The vortex lattice can not be sent to worker processes, training in one process',stacklevel=2)
+        processes = 1
+    
+    results = None
+    if processes > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(evaluate_training_block,worker_settings,geometry,AoAs[rows],Machs[rows]) for rows in blocks]
+                results = [future.result() for future in futures]
+        except BrokenProcessPool:
+            warnings.warn('The training processes stopped unexpectedly, training in one process',stacklevel=2)
+            results = None
+            
+    if results is None:
+        results = [evaluate_training_block(settings,geometry,AoAs[rows],Machs[rows]) for rows in blocks]
+    
+    # Stack the blocks back in order
+    samples = Data()
+    samples.lift_coefficient       = np.vstack([result.lift_coefficient for result in results])
+    samples.drag_coefficient       = np.vstack([result.drag_coefficient for result in results])
+    samples.wing_lift_coefficients = Data()
+    samples.wing_drag_coefficients = Data()
+    
+    for wing in geometry.wings.keys():
+        samples.wing_lift_coefficients[wing] = np.vstack([result.wing_lift_coefficients[wing] for result in results])
+        samples.wing_drag_coefficients[wing] = np.vstack([result.wing_drag_coefficients[wing] for result in results])
+    
+    return samples
+
+def evaluate_adaptive_training_samples(settings,geometry,training):
+    """Runs the vortex lattice from the training grid, adding angles of attack and Mach numbers where
+    the leave-one-out error of the total lift and drag is largest
+
+    Assumptions:
+    The subsonic and supersonic Mach numbers are refined separately
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.
+      adaptive_training_tolerance   [-]
+      adaptive_training_samples     [-]
+      (see evaluate_training_samples)
+    geometry.wings.*.tag
+    training.angle_of_attack        [radians]
+    training.Mach                   [-]
+
+    Outputs:
+    samples.
+      angle_of_attack               [radians] refined
+      Mach                          [-] refined
+      (see evaluate_training_samples)
+
+    Properties Used:
+    N/A
+    """    
+    
+    wings = list(geometry.wings.keys())
+    
+    def sample(points):
+        block  = evaluate_training_samples(settings,geometry,points[:,0:1],points[:,1:2])
+        values = [block.lift_coefficient,block.drag_coefficient]
+        values = values + [block.wing_lift_coefficients[wing] for wing in wings]
+        values = values + [block.wing_drag_coefficients[wing] for wing in wings]
+        return np.hstack(values)
+    
+    AoA, Mach, values = adaptive_grid_sampling(sample,training.angle_of_attack,training.Mach,
+                                               settings.adaptive_training_tolerance,
+                                               settings.adaptive_training_samples,
+                                               y_breaks=[1.],error_columns=[0,1])
+    
+    # back in the order of the fixed grid, all angles of attack for each Mach number
+    values = np.reshape(np.transpose(values,(0,2,1)),(values.shape[0],-1,1))
+    
+    samples = Data()
+    samples.angle_of_attack        = np.atleast_2d(AoA).T
+    samples.Mach                   = np.atleast_2d(Mach).T
+    samples.lift_coefficient       = values[0]
+    samples.drag_coefficient       = values[1]
+    samples.wing_lift_coefficients = Data()
+    samples.wing_drag_coefficients = Data()
+    
+    for i,wing in enumerate(wings):
+        samples.wing_lift_coefficients[wing] = values[2+i]
+        samples.wing_drag_coefficients[wing] = values[2+len(wings)+i]
+    
+    return samples
+
+def evaluate_training_block(settings,geometry,AoAs,Machs):
+    """Runs the vortex lattice for one block of training conditions
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    settings                        (passed to vortex lattice method)
+    geometry                        (passed to vortex lattice method)
+    AoAs                            [radians]
+    Machs                           [-]
+
+    Outputs:
+    samples                         [Data]
+
+    Properties Used:
+    N/A
+    """    
+    
+    # Setup Konditions                      
+    konditions                              = Data()
+    konditions.aerodynamics                 = Data()
+    konditions.freestream                   = Data()
+    konditions.aerodynamics.angle_of_attack = AoAs
+    konditions.freestream.mach_number       = Machs
+    konditions.freestream.velocity          = np.zeros_like(Machs)
+    
+    total_lift, total_drag, wing_lifts, wing_drags, wing_lift_distribution , wing_drag_distribution, pressure_coefficient = \
+                    calculate_VLM(konditions,settings,geometry)
+    
+    samples = Data()
+    samples.lift_coefficient       = total_lift
+    samples.drag_coefficient       = total_drag
+    samples.wing_lift_coefficients = wing_lifts
+    samples.wing_drag_coefficients = wing_drags
+    
+    return samples
+
+def training_key(settings,geometry,training):
+    """Hashes everything the training samples depend on: the panelized geometry, the reference
+    area, the wake model and the training conditions
+
+    Assumptions:
+    The vortex distribution was built by get_vortex_distribution
+
+    Source:
+    N/A
+
+    Inputs:
+    settings.vortex_distribution    [-]
+    settings.align_wake_to_freestream
+    geometry.reference_area         [m^2]
+    training.angle_of_attack        [radians]
+    training.Mach                   [-]
+    settings.adaptive_training_tolerance
+    settings.adaptive_training_samples
+
+    Outputs:
+    key                             [string]
+
+    Properties Used:
+    N/A
+    """        
+    
+    digest = hashlib.sha1()
+    digest.update(settings.vortex_distribution._geometry_key.encode())
+    digest.update(str((geometry.reference_area,settings.align_wake_to_freestream)).encode())
+    digest.update(np.ascontiguousarray(training.angle_of_attack,dtype=float).tobytes())
+    digest.update(np.ascontiguousarray(training.Mach,dtype=float).tobytes())
+    
+    # a refined grid depends on how it was refined
+    if settings.adaptive_training_tolerance is not None:
+        digest.update(str((settings.adaptive_training_tolerance,settings.adaptive_training_samples)).encode())
+    
+    return digest.hexdigest()
+
+def load_training_samples(directory,key,geometry):
+    """Loads stored training samples, and marks them as recently used
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    directory                       [-] None when nothing is stored
+    key                             [-]
+    geometry.wings.*.tag
+
+    Outputs:
+    samples                         [Data] or None if nothing is stored for the key
+
+    Properties Used:
+    N/A
+    """       
+    
+    if directory is None:
+        return None
+    
+    path = os.path.join(directory,key + '.npz')
+    
+    try:
+        with np.load(path) as stored:
+            samples = Data()
+            samples.lift_coefficient       = stored['lift_coefficient']
+            samples.drag_coefficient       = stored['drag_coefficient']
+            samples.wing_lift_coefficients = Data()
+            samples.wing_drag_coefficients = Data()
+            for wing in geometry.wings.keys():
+                samples.wing_lift_coefficients[wing] = stored['wing_lift_coefficient_' + wing]
+                samples.wing_drag_coefficients[wing] = stored['wing_drag_coefficient_' + wing]
+            if 'angle_of_attack' in stored.files:
+                samples.angle_of_attack = stored['angle_of_attack']
+                samples.Mach            = stored['Mach']
+        os.utime(path)
+    except (IOError,OSError,KeyError,ValueError):
+        return None
+    
+    return samples
+
+def save_training_samples(directory,key,samples,size):
+    """Stores training samples, removing the least recently used ones beyond the cache size
+
+    Assumptions:
+    The modification time of a file is the last time it was used
+
+    Source:
+    N/A
+
+    Inputs:
+    directory                       [-] None to not store anything
+    key                             [-]
+    samples                         [Data]
+    size                            [-]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """      
+    
+    if directory is None:
+        return
+    
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+        
+    arrays = dict()
+    arrays['lift_coefficient'] = samples.lift_coefficient
+    arrays['drag_coefficient'] = samples.drag_coefficient
+    if 'angle_of_attack' in samples:
+        arrays['angle_of_attack'] = samples.angle_of_attack
+        arrays['Mach']            = samples.Mach
+    for wing in samples.wing_lift_coefficients.keys():
+        arrays['wing_lift_coefficient_' + wing] = samples.wing_lift_coefficients[wing]
+        arrays['wing_drag_coefficient_' + wing] = samples.wing_drag_coefficients[wing]
+    
+    # write to a temporary file first, so other processes never read a partial file
+    path = os.path.join(directory,key + '.npz')
+    temp = path + '.' + str(os.getpid()) + '.tmp'
+    with open(temp,'wb') as f:
+        np.savez(f,**arrays)
+    os.replace(temp,path)
+    
+    # least recently used first
+    stored = [os.path.join(directory,name) for name in os.listdir(directory) if name.endswith('.npz')]
+    stored = sorted(stored,key=os.path.getmtime)
+    
+    for old in stored[:max(len(stored)-int(size),0)]:
+        try:
+            os.remove(old)
+        except OSError:
+            pass
+    
+    return
@@ -3,13 +3,20 @@
 #
 # Created:  Feb 2015, T. MacDonald
 # Modified: Feb 2016, A. Wendorff
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
+import numpy as np
+from collections import OrderedDict
+from warnings import warn
+
 from SUAVE.Attributes.Atmospheres.Atmosphere import Atmosphere
+from SUAVE.Attributes.Gases import Air
+from SUAVE.Attributes.Planets import Earth
 from SUAVE.Analyses import Analysis
 
 
@@ -21,35 +28,225 @@ from SUAVE.Analyses import Analysis
 class Atmospheric(Analysis):
     """This is the base class for atmospheric analyses. It contains functions
     that are built into the default class.
-    
+
     Assumptions:
     None
-    
+
     Source:
     N/A
     """
     def __defaults__(self):
         """This sets the default values for the analysis to function.
-        
+
         Assumptions:
         None
-        
+
         Source:
         N/A
-        
+
         Inputs:
         None
-        
+
         Outputs:
         None
-        
+
         Properties Used:
         N/A
-        """          
+        """
         atmo_data = Atmosphere()
         self.update(atmo_data)
-        
-        
+
+        # values for the most recent distinct inputs are reused, 0 to always compute them
+        self.settings.cache_size = 8
+
+    # the stored values are kept out of the data of the analysis, so they are not archived with
+    # the results of a mission
+    _values_cache       = None
+    _checked_properties = None
+
     def compute_values(self,altitude):
         """This function is not implemented for the base class."""
         raise NotImplementedError
+
+    def properties_key(self):
+        """Identifies the properties the atmospheric values are computed from, so stored values are
+        not reused after they change.
+
+        Assumptions:
+        The fluid and planet objects are not modified in place other than their constants used here
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        key                                      <tuple>
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          planet.mean_radius                     [m]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+
+        gas    = self.fluid_properties
+        planet = self.planet
+        breaks = self.breaks
+
+        return (id(gas),id(planet),gas.gas_specific_constant,planet.sea_level_gravity,planet.mean_radius,
+                array_key(breaks.altitude),array_key(breaks.temperature),array_key(breaks.pressure))
+
+    def check_properties(self,name,properties):
+        """Warns if the atmosphere is not using air on Earth. The check is only repeated when the
+        properties change.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        name                                     <string>
+        properties                               <tuple> see properties_key
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.
+          fluid_properties
+          planet
+        """
+
+        if self._checked_properties == properties:
+            return
+
+        if not self.fluid_properties == Air():
+            warn(name + ' not using Air fluid properties')
+        if not self.planet == Earth():
+            warn(name + ' not using Earth planet properties')
+
+        self._checked_properties = properties
+
+    def cached_values(self,key):
+        """Returns a copy of the atmospheric values stored for a key, or None if there are none
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        key                                      <tuple>
+
+        Outputs:
+        atmo_data                                <Conditions> or None
+
+        Properties Used:
+        self._values_cache
+        """
+
+        if self._values_cache is None or key not in self._values_cache:
+            return None
+
+        self._values_cache.move_to_end(key)
+
+        return copy_values(self._values_cache[key])
+
+    def store_values(self,key,atmo_data):
+        """Stores a copy of the atmospheric values for a key, dropping the least recently used values
+        beyond the cache size
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        key                                      <tuple>
+        atmo_data                                <Conditions>
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.settings.cache_size                 [-]
+        """
+
+        size = int(self.settings.cache_size)
+        if size <= 0:
+            return
+
+        if self._values_cache is None:
+            self._values_cache = OrderedDict()
+
+        self._values_cache[key] = copy_values(atmo_data)
+
+        while len(self._values_cache) > size:
+            self._values_cache.popitem(last=False)
+
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+def array_key(values):
+    """Hashable form of an array, or of a scalar, for the keys of the stored values
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    values                                       [array] or scalar
+
+    Outputs:
+    key                                          <tuple>
+
+    Properties Used:
+    N/A
+    """
+
+    values = np.asarray(values)
+
+    return (values.dtype.str,values.shape,values.tobytes())
+
+def copy_values(atmo_data):
+    """Copies the arrays of a set of atmospheric values, so the stored values are never changed
+    through the returned ones
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    atmo_data                                    <Conditions>
+
+    Outputs:
+    atmo_data                                    <Conditions>
+
+    Properties Used:
+    N/A
+    """
+
+    copied = atmo_data.__class__()
+    copied.__dict__.update(atmo_data.__dict__) # the row count is an attribute, not an item
+    for key, value in atmo_data.items():
+        if isinstance(value,np.ndarray):
+            value = value.copy()
+        copied[key] = value
+
+    return copied
@@ -4,19 +4,17 @@
 # Created:  Mar 2014, SUAVE Team
 # Modified: Feb 2016, A. Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from warnings import warn
 
 import SUAVE
 
 from SUAVE.Analyses.Atmospheric import Atmospheric
-
-from SUAVE.Attributes.Gases import Air
-from SUAVE.Attributes.Planets import Earth
+from SUAVE.Analyses.Atmospheric.Atmospheric import array_key
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
@@ -90,24 +88,31 @@ class Constant_Temperature(Atmospheric):
           breaks.
             altitude                             [m]
             pressure                             [Pa]
+          settings.cache_size                    [-]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
         grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
         R         = gas.gas_specific_constant
         
+        # the breaks take the temperature
+        self.breaks.temperature[1:] = temperature
+        
         # check properties
-        if not gas == Air():
-            warn('Constant_Temperature Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('Constant_Temperature Atmosphere not using Earth planet properties')          
+        properties = self.properties_key()
+        self.check_properties('Constant_Temperature Atmosphere',properties)
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
+        
+        # the same inputs, as from a segment whose altitude does not change between iterations, are reused
+        key       = (properties,array_key(zs),array_key(temperature))
+        atmo_data = self.cached_values(key)
+        if atmo_data is not None:
+            return atmo_data
 
         # get model altitude bounds
         zmin = self.breaks.altitude[0]
@@ -124,32 +129,16 @@ class Constant_Temperature(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = temperature
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            self.breaks.temperature[i+1]=temperature
-            alpha[ i_inside ] = -(temperature - temperature)/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+        # find the layers, an altitude at a break uses the layer above it
+        z_b     = self.breaks.altitude
+        i_layer = np.searchsorted(z_b,zs,side='right') - 1
+        i_layer = np.minimum(np.maximum(i_layer,0),len(z_b)-2)
+        z0      = z_b[i_layer]
+        p0      = self.breaks.pressure[i_layer]
+        T0      = np.zeros_like(zs) + temperature
         
         # interpolate the breaks
         dz = zs-z0
-        i_isoth = (alpha == 0.)
 
         p = p0* np.exp(-1.*dz*grav/(R*T0))
        
@@ -168,4 +157,6 @@ class Constant_Temperature(Atmospheric):
         atmo_data.speed_of_sound    = a
         atmo_data.dynamic_viscosity = mu
         
+        self.store_values(key,atmo_data)
+        
         return atmo_data
\ No newline at end of file
@@ -4,24 +4,22 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from warnings import warn
 
 import SUAVE
 
 from SUAVE.Analyses.Atmospheric import Atmospheric
-
-from SUAVE.Attributes.Gases import Air
-from SUAVE.Attributes.Planets import Earth
+from SUAVE.Analyses.Atmospheric.Atmospheric import array_key
 
 from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
 from SUAVE.Core.Arrays import atleast_2d_col
 
 
@@ -62,6 +60,13 @@ class US_Standard_1976(Atmospheric):
         
         atmo_data = SUAVE.Attributes.Atmospheres.Earth.US_Standard_1976()
         self.update(atmo_data)        
+        
+        # interpolate a table of the standard atmosphere instead of evaluating the layers
+        self.settings.use_lookup_table        = False
+        self.settings.lookup_table_resolution = 10. # m, geopotential altitude
+    
+    # the table is kept out of the data of the analysis, like the stored values
+    _lookup_table = None
     
     def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
 
@@ -93,25 +98,32 @@ class US_Standard_1976(Atmospheric):
             altitude                             [m]
             temperature                          [K]
             pressure                             [Pa]
+          settings.
+            use_lookup_table                     <boolean>
+            lookup_table_resolution              [m]
+            cache_size                           [-]
         """
 
         # unpack
         zs        = altitude
         gas       = self.fluid_properties
-        planet    = self.planet
-        grav      = self.planet.sea_level_gravity        
         Rad       = self.planet.mean_radius
-        R         = gas.gas_specific_constant
         delta_isa = temperature_deviation
+        settings  = self.settings
         
         # check properties
-        if not gas == Air():
-            warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
-            warn('US Standard Atmosphere not using Earth planet properties')          
+        properties = self.properties_key()
+        self.check_properties('US Standard Atmosphere',properties)
         
         # convert input if necessary
         zs = atleast_2d_col(zs)
+        
+        # the same inputs, as from a segment whose altitude does not change between iterations, are reused
+        key = (properties,array_key(zs),array_key(delta_isa),var_gamma,
+               settings.use_lookup_table,settings.lookup_table_resolution)
+        atmo_data = self.cached_values(key)
+        if atmo_data is not None:
+            return atmo_data
 
         # get model altitude bounds
         zmin = self.breaks.altitude[0]
@@ -129,36 +141,15 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+        # pressure and standard temperature
+        if settings.use_lookup_table:
+            table = self.lookup_table(properties)
+            p     = np.exp(np.interp(zs,table.altitude,table.log_pressure))
+            T     = np.interp(zs,table.altitude,table.temperature) + delta_isa
+        else:
+            p, T = self.layer_values(zs)
+            T    = T + delta_isa
         
-        # interpolate the breaks
-        dz = zs-z0
-        i_isoth = (alpha == 0.)
-        i_adiab = (alpha != 0.)
-        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
-        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
-        
-        T   = T0 - dz*alpha + delta_isa
         rho = gas.compute_density(T,p)
         a   = gas.compute_speed_of_sound(T,p,var_gamma)
         mu  = gas.compute_absolute_viscosity(T)
@@ -171,7 +162,111 @@ class US_Standard_1976(Atmospheric):
         atmo_data.speed_of_sound    = a
         atmo_data.dynamic_viscosity = mu
         
+        self.store_values(key,atmo_data)
+        
         return atmo_data
+    
+    def layer_values(self,zs):
+        """Computes the standard pressure and temperature from the layer the altitude is in.
+
+        Assumptions:
+        US 1976 Standard Atmosphere, altitudes at a break use the layer above it
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        zs                                       [m] geopotential altitude within the breaks
+
+        Output:
+        p                                        [Pa]
+        T                                        [K] without the temperature deviation
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+        
+        # unpack
+        grav   = self.planet.sea_level_gravity        
+        R      = self.fluid_properties.gas_specific_constant
+        z_b    = self.breaks.altitude
+        T_b    = self.breaks.temperature
+        p_b    = self.breaks.pressure
+        
+        # lapse rate of each layer
+        lapse = -(T_b[1:] - T_b[:-1])/(z_b[1:] - z_b[:-1])
+        
+        # find the layers
+        i_layer = np.searchsorted(z_b,zs,side='right') - 1
+        i_layer = np.minimum(np.maximum(i_layer,0),len(z_b)-2)
+        z0      = z_b[i_layer]
+        T0      = T_b[i_layer]
+        p0      = p_b[i_layer]
+        alpha   = lapse[i_layer]
+        
+        # interpolate the breaks
+        dz = zs-z0
+        p  = np.zeros_like(zs)
+        i_isoth = (alpha == 0.)
+        i_adiab = (alpha != 0.)
+        p[i_isoth] = p0[i_isoth] * np.exp(-1.*dz[i_isoth]*grav/(R*T0[i_isoth]))
+        p[i_adiab] = p0[i_adiab] * ( (1.-alpha[i_adiab]*dz[i_adiab]/T0[i_adiab]) **(1.*grav/(alpha[i_adiab]*R)) )
+        
+        T = T0 - dz*alpha
+        
+        return p, T
+    
+    def lookup_table(self,properties):
+        """Builds, or returns the already built, table of standard pressure and temperature over the
+        geopotential altitude. The breaks are always in the table, so the temperature is exact and the
+        logarithm of the pressure is interpolated within each layer.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        properties                               <tuple> see properties_key
+
+        Output:
+        table.
+          altitude                               [m] geopotential
+          log_pressure                           [-] logarithm of the pressure in Pa
+          temperature                            [K]
+
+        Properties Used:
+        self.
+          breaks.altitude                        [m]
+          settings.lookup_table_resolution       [m]
+        """
+        
+        resolution = self.settings.lookup_table_resolution
+        table      = self._lookup_table
+        
+        if table is not None and table.key == (properties,resolution):
+            return table
+        
+        breaks   = self.breaks.altitude
+        altitude = np.union1d(np.arange(breaks[0],breaks[-1],resolution),breaks)
+        p, T     = self.layer_values(altitude)
+        
+        table = Data()
+        table.key          = (properties,resolution)
+        table.altitude     = altitude
+        table.log_pressure = np.log(p)
+        table.temperature  = T
+        
+        self._lookup_table = table
+        
+        return table
 
 
 # ----------------------------------------------------------------------
@@ -3,6 +3,7 @@
 #
 # Created:  Mar 2016, E. Botero 
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -35,6 +36,9 @@ class Optimized(Aerodynamic):
         This segment takes far longer to run than a normal segment. Wrapping this into a vehicle optimization
         has not yet been tested for robustness.
         
+        Setting state.numerics.solver_jacobian = 'block_sparse' runs the segment once per SLSQP point for the
+        objective and all constraints, and finds their gradients by colored finite differences.
+        
     
         Assumptions:
         Can use SNOPT if you have it installed through PyOpt. But defaults to SLSQP through 
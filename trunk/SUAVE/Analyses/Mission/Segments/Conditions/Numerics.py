@@ -54,8 +54,17 @@ class Numerics(Conditions):
         
         self.solver_jacobian                  = "none"
         self.tolerance_solution               = 1e-8
+        self.tolerance_residual               = 1e-5
         self.converged                        = None
         self.max_evaluations                  = 0.
+        self.incremental_evaluation           = False
+        self.contiguous_state                 = False
+        self.warm_start                       = None
+        self.adaptive_control_points          = False
+        self.tolerance_refinement             = 1e-4
+        self.max_control_points               = 32
+        self.initial_control_points           = None
+        self.needed_control_points            = None
         
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
@@ -68,6 +68,8 @@ class Segment(Analysis):
         
         self.conditions = self.state.conditions
         
+        self._last_evaluation = None
+        
         return
         
 
@@ -200,6 +202,34 @@ class Segment(Analysis):
         return self
     
     
+    def fingerprint(self):
+        """ Summarizes what an evaluation of this segment depends on that can change while a mission
+            converges: the unknowns and the numeric inputs of the segment
+    
+            Assumptions:
+            The initials are checked separately, by identity
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            fingerprint [tuple]
+    
+            Properties Used:
+            None
+        """
+        
+        inputs = [(key,np.atleast_1d(value).tobytes()) for key,value in self.items() \
+                  if isinstance(value,(int,float,array_type))]
+        
+        fingerprint = (self.state.unknowns.pack_array().tobytes(),) + tuple(inputs)
+        
+        return fingerprint
+    
+    
     def merged(self):
         """ Combines the states of multiple segments
     
@@ -2,7 +2,7 @@
 # Lift_Cruise_Optimized.py
 #
 # Created:  Apr 2018, M. Clarke
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -34,6 +34,9 @@ class Lift_Cruise_Optimized(Aerodynamic):
         This segment takes far longer to run than a normal segment. Wrapping this into a vehicle optimization
         has not yet been tested for robustness.
         
+        Setting state.numerics.solver_jacobian = 'block_sparse' runs the segment once per SLSQP point for the
+        objective and all constraints, and finds their gradients by colored finite differences.
+        
     
         Assumptions:
         Can use SNOPT if you have it installed through PyOpt. But defaults to SLSQP through 
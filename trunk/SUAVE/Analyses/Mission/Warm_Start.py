@@ -0,0 +1,72 @@
+## @ingroup Analyses-Mission
+# Warm_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+# ----------------------------------------------------------------------
+#  Warm Start
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Warm_Start(Data):
+    """ Keeps the converged unknowns of mission segments so that later solves start from them, and the
+        factors of the last Jacobian of fsolve so that they can take their first steps without one. It
+        is set on the numerics of a mission, which passes it on to its segments, and can be shared by
+        several missions or copies of one.
+
+        Assumptions:
+        Segments with the same tag fly similar conditions
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.tag       = 'warm_start'
+        self.solutions = Data()
+        self.jacobians = Data()
+
+    def number_of_solutions(self):
+        """ Counts the stored solutions
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            count [int]
+
+            Properties Used:
+            None
+        """
+
+        return sum([len(entries) for entries in self.solutions.values()])
@@ -20,7 +20,8 @@ from SUAVE.Methods.Aerodynamics.AVL.write_geometry           import write_geomet
 from SUAVE.Methods.Aerodynamics.AVL.write_mass_file          import write_mass_file
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases          import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck         import write_input_deck
-from SUAVE.Methods.Aerodynamics.AVL.run_analysis             import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.run_analysis             import run_analysis, run_analysis_jobs, batch_cache_keys
+from SUAVE.Core.result_cache                                 import load_result, save_result
 from SUAVE.Methods.Aerodynamics.AVL.translate_data           import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files              import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings            import Settings
@@ -238,6 +239,7 @@ class AVL(Stability):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.settings.training_cache_directory (optional - folder of previous AVL batches)
         """ 
         # Unpack
         run_folder    = os.path.abspath(self.settings.filenames.run_folder)
@@ -259,6 +261,7 @@ class AVL(Stability):
             if not self.regression_flag:
                 rmtree(run_folder)
                 
+        batches = []
         for i,_ in enumerate(Mach):
             # Set training conditions
             run_conditions = Aerodynamics()
@@ -269,15 +272,37 @@ class AVL(Stability):
             run_conditions.aerodynamics.side_slip_angle = 0.0
             run_conditions.freestream.velocity          = Mach[i] * run_conditions.freestream.speed_of_sound
             run_conditions.freestream.mach_number       = Mach[i] 
+            batches.append(run_conditions)
             
-            #Run Analysis at AoA[i] and Mach[i]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
+        # batches in the training cache are not run again
+        cache_directory = self.settings.training_cache_directory
+        keys            = batch_cache_keys(self, batches, trim_aircraft)
+        stored          = [load_result(cache_directory,key) for key in keys]
+        run             = [i for i,values in enumerate(stored) if values is None]
+        
+        # Run Analysis at AoA[:] and Mach[i], one AVL batch per Mach number
+        if self.settings.number_of_jobs > 1 and not self.regression_flag:
+            batch_results = run_analysis_jobs(self, [batches[i] for i in run], trim_aircraft)
+        else:
+            batch_results = [self.evaluate_conditions(batches[i], trim_aircraft) for i in run]
+            
+        for i,results in zip(run,batch_results):
 
             # Obtain CM Cm_alpha, Cn_beta and the Neutral Point 
             CM[:,i]       = results.aerodynamics.Cmtot[:,0]
             Cm_alpha[:,i] = results.stability.static.Cm_alpha[:,0]
             Cn_beta[:,i]  = results.stability.static.Cn_beta[:,0]
             NP[:,i]       = results.stability.static.neutral_point[:,0]
+            
+            save_result(cache_directory, keys[i], dict(CM=CM[:,i],Cm_alpha=Cm_alpha[:,i],Cn_beta=Cn_beta[:,i],NP=NP[:,i]),
+                        self.settings.training_cache_memory)
+            
+        for i,values in enumerate(stored):
+            if values is not None:
+                CM[:,i]       = values['CM']
+                Cm_alpha[:,i] = values['Cm_alpha']
+                Cn_beta[:,i]  = values['Cn_beta']
+                NP[:,i]       = values['NP']
         
         if self.training_file:
             # load data 
@@ -391,6 +416,53 @@ class AVL(Stability):
           cases
         """           
         
+        run_folder = os.path.abspath(self.settings.filenames.run_folder)
+        
+        # write the input files
+        with redirect.folder(run_folder,force=False):
+            cases = self.write_conditions(run_conditions, trim_aircraft)
+
+            # RUN AVL!
+            results_avl = run_analysis(self)
+    
+        # translate results
+        results = self.translate_results(run_conditions, cases, results_avl)
+        
+        if not self.keep_files:
+            rmtree( run_folder )
+            
+        return results
+        
+    def write_conditions(self,run_conditions, trim_aircraft):
+        """Writes the geometry, mass, run case and input deck files of one AVL batch in the working
+        directory.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        trim_aircraft  <boolean>
+
+        Outputs:
+        cases          <SUAVE data type> the run cases of the batch
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          output_template
+          batch_template
+          deck_template
+        self.current_status.
+          batch_index
+          batch_file
+          deck_file
+          cases
+        """           
+        
         # unpack
         run_folder                       = os.path.abspath(self.settings.filenames.run_folder)
         run_script_path                  = run_folder.rstrip('avl_files').rstrip('/')
@@ -453,17 +525,34 @@ class AVL(Stability):
             case.eigen_result_filename_1    = dynamic_results_template_1.format(case.tag)   # 'eigen_mode_{}.dat'
             case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)   # 'system_matrix_{}.dat'
         
-        # write the input files
-        with redirect.folder(run_folder,force=False):
-            write_geometry(self,run_script_path)
-            write_mass_file(self,run_conditions)
-            write_run_cases(self,trim_aircraft)
-            write_input_deck(self, trim_aircraft)
+        write_geometry(self,run_script_path)
+        write_mass_file(self,run_conditions)
+        write_run_cases(self,trim_aircraft)
+        write_input_deck(self, trim_aircraft)
+            
+        return cases
+        
+    def translate_results(self,run_conditions, cases, results_avl):
+        """Translates the results read from the AVL output files of one batch to conditions.
 
-            # RUN AVL!
-            results_avl = run_analysis(self)
-    
-        # translate results
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        cases          <SUAVE data type> the run cases of the batch
+        results_avl    <SUAVE data type>
+
+        Outputs:
+        results        <SUAVE data type>
+
+        Properties Used:
+        N/A
+        """           
+        
         results = translate_results_to_conditions(cases,results_avl)
         
         # -----------------------------------------------------------------------------------------------------------------------                     
@@ -472,8 +561,5 @@ class AVL(Stability):
         # Dynamic Stability
         if np.count_nonzero(self.geometry.mass_properties.moments_of_inertia.tensor) > 0:  
                 results = compute_dynamic_flight_modes(results,self.geometry,run_conditions,cases)        
-             
-        if not self.keep_files:
-            rmtree( run_folder )           
- 
+            
         return results
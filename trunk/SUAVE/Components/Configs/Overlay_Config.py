@@ -0,0 +1,49 @@
+## @ingroup Components-Configs
+# Overlay_Config.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core    import Overlay_Data
+from SUAVE.Vehicle import Vehicle
+
+# ----------------------------------------------------------------------
+#  Overlay Config
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Configs
+class Overlay_Config(Overlay_Data,Vehicle):
+    """ SUAVE.Components.Configs.Overlay_Config()
+    
+        A configuration that shares the unchanged values of its base instead of copying them.
+        It is used like Config, through store_diff, pull_base and finalize.
+        
+            Assumptions:
+            Arrays and lists shared with the base are copied the first time they are taken
+            
+            Source:
+            N/A
+    """
+    
+    def __defaults__(self):
+        """ This sets the default values for the configuration.
+        
+                Assumptions:
+                None
+                
+                Source:
+                N/A
+                
+                Inputs:
+                None
+                
+                Outputs:
+                None
+                
+                Properties Used:
+                N/A
+        """
+        self.tag    = 'config'
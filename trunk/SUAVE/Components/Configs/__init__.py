@@ -7,5 +7,7 @@
 #
 # Created:  Oct 2014, T. Lukacyzk
 # Modified: Jan 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
-from .Config import Config
\ No newline at end of file
+from .Config         import Config
+from .Overlay_Config import Overlay_Config
\ No newline at end of file
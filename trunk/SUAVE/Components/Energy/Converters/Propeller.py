@@ -12,6 +12,8 @@ from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars \
      import compute_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.interpolate_airfoil_polars \
+     import interpolate_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
 
@@ -76,7 +78,6 @@ class Propeller(Energy_Component):
         self.profile_drag_coefficient = .03        
         self.tag                      = 'Propeller'
 
-        
     def spin(self,conditions):
         """Analyzes a propeller given geometry and operating conditions.
 
@@ -175,15 +176,16 @@ class Propeller(Energy_Component):
         N       = len(c) # Number of stations     
         
         if  a_pol != None and a_loc != None:
-            airfoil_polars = Data() 
             # check dimension of section
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on propeller')
-            # compute airfoil polars for airfoils 
+            # compute airfoil polars for airfoils, the tables are kept by compute_airfoil_polars
             airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
-            airfoil_cl     = airfoil_polars.lift_coefficients
-            airfoil_cd     = airfoil_polars.drag_coefficients
+            airfoil_cl     = airfoil_polars.lift_coefficients[a_loc]
             AoA_sweep      = airfoil_polars.angle_of_attacks
+        else:
+            airfoil_cl     = None
+            AoA_sweep      = None
         
         if self.radius_distribution is None:
             chi0    = Rh/R   # Where the propeller blade actually starts
@@ -205,93 +207,25 @@ class Propeller(Energy_Component):
         
         #Things that will change with iteration
         size = (len(a),N)
-        Cl = np.zeros((1,N))  
         
         #Setup a Newton iteration
-        psi    = np.ones(size)
-        psiold = np.zeros(size)
-        diff   = 1.
+        psi      = np.ones(size)
+        psi_last = np.ones(size)
+        
+        # rows that have not converged, converged rows stop iterating
+        active = np.arange(len(a))
         
         ii = 0
         broke = False   
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound 
-            
-            lamdaw = r*Wa/(R*Wt)
-            
-            # Limiter to keep from Nan-ing
-            lamdaw[lamdaw<0.] = 0.
-            
-            f            = (B/2.)*(1.-r/R)/lamdaw
-            piece        = np.exp(-f)
-            arccos_piece = np.arccos(piece)
-            F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
-                              
-            
-            # Estimate Cl max
-            Re         = (W*c)/nu 
-            Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
-            Re_ref     = 9.*10**6      
-            Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
-            
-            # Compute blade CL distribution from the airfoil data 
-            if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
-            else:
-                # If not airfoil polar provided, use 2*pi as lift curve slope
-                Cl = 2.*pi*alpha
-            
-            # By 90 deg, it's totally stalled.
-            Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
-            Cl[alpha>=pi/2] = 0.
-                
-            # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
-        
-            # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
-        
-            Rsquiggly = Gamma - 0.5*W*c*Cl
-            
-            #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
-            #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
-            
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
-            
-            utpUcospsi2 = utpUcospsi*utpUcospsi
-            UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-            
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
-                       Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
-            
-            dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+        while len(active):
+            rows   = active
+            state  = blade_element_residual(psi[rows],Ua[rows],Ut[rows],U[rows],beta,r,c,R,B,a[rows],nu[rows],tc,airfoil_cl,AoA_sweep)
                       
-            dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
+            dpsi           = -state.Rsquiggly/state.dR_dpsi
+            psi_last[rows] = psi[rows]
+            psi[rows]      = psi[rows] + dpsi
+            diff           = np.max(abs(dpsi),axis=1)
+            active         = rows[diff>tol]
             
             # If its really not going to converge
             if np.any(psi>pi/2) and np.any(dpsi>0.0):
@@ -302,6 +236,18 @@ class Propeller(Energy_Component):
             if ii>2000:
                 broke = True
                 break
+            
+        # the state of every row at its last iterate
+        state   = blade_element_residual(psi_last,Ua,Ut,U,beta,r,c,R,B,a,nu,tc,airfoil_cl,AoA_sweep)
+        va      = state.va
+        vt      = state.vt
+        Wa      = state.Wa
+        Wt      = state.Wt
+        alpha   = state.alpha
+        Ma      = state.Ma
+        Re      = state.Re
+        Gamma   = state.Gamma
+        Cl      = state.Cl
         
         #There is also RE scaling
         #This is an atrocious fit of DAE51 data at RE=50k for Cd
@@ -485,14 +431,12 @@ class Propeller(Energy_Component):
         N       = len(c) # Number of stations     
         
         if  a_pol != None and a_loc != None:
-            airfoil_polars = Data()
             # check dimension of section   
             if len(a_loc) != N:
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on propeller')            
-            # compute airfoil polars for airfoils 
-            airfoil_polars = compute_airfoil_polars(self,conditions, a_pol)
-            airfoil_cl     = airfoil_polars.lift_coefficients
-            airfoil_cd     = airfoil_polars.drag_coefficients
+            # compute airfoil polars for airfoils, the tables are kept by compute_airfoil_polars
+            airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
+            airfoil_cl     = airfoil_polars.lift_coefficients[a_loc]
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
         if self.radius_distribution is None:
@@ -515,7 +459,6 @@ class Propeller(Energy_Component):
                 
         #Things that will change with iteration
         size = (len(a),N)
-        Cl = np.zeros((1,N))  
     
         #Setup a Newton iteration
         psi    = np.ones(size)
@@ -554,8 +497,7 @@ class Propeller(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -702,6 +644,135 @@ class Propeller(Energy_Component):
             mid_chord_aligment               = self.mid_chord_aligment     
         ) 
         
-        return thrust, torque, power, Cp, outputs  , etap  
+        return thrust, torque, power, Cp, outputs  , etap
+    
+## @ingroup Components-Energy-Converters
+def blade_element_residual(psi,Ua,Ut,U,beta,r,c,R,B,a,nu,tc,airfoil_cl=None,AoA_sweep=None):
+    """Evaluates the blade element state and the residual of the circulation equation for a
+    guess of the inflow angle psi, with one row per flight condition.
+
+    Assumptions:
+    per source
+
+    Source:
+    Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
+    http://web.mit.edu/drela/Public/web/qprop/qprop_theory.pdf
 
- 
+    Inputs:
+    psi                          [radians]
+    Ua, Ut, U                    [m/s]
+    beta                         [radians]
+    r, c, R                      [m]
+    B                            [-]
+    a                            [m/s]
+    nu                           [m^2/s]
+    tc                           [-]
+    airfoil_cl                   [-] lift coefficients of the airfoil of each station
+    AoA_sweep                    [-] angles of attack of the polars
+
+    Outputs:
+    state.
+      Wa, Wt, va, vt, W          [m/s]
+      alpha                      [radians]
+      Ma                         [-]
+      Re                         [-]
+      Gamma                      [m^2/s]
+      Cl                         [-]
+      Rsquiggly                  [m^2/s]
+      dR_dpsi                    [m^2/s]
+
+    Properties Used:
+    N/A
+    """
+    
+    pi      = np.pi
+    pi2     = pi*pi
+    BB      = B*B
+    BBB     = BB*B
+    
+    sin_psi = np.sin(psi)
+    cos_psi = np.cos(psi)
+    Wa      = 0.5*Ua + 0.5*U*sin_psi
+    Wt      = 0.5*Ut + 0.5*U*cos_psi   
+    va      = Wa - Ua
+    vt      = Ut - Wt
+    alpha   = beta - np.arctan2(Wa,Wt)
+    W       = (Wa*Wa + Wt*Wt)**0.5
+    Ma      = (W)/a #a is the speed of sound 
+    
+    lamdaw = r*Wa/(R*Wt)
+    
+    # Limiter to keep from Nan-ing
+    lamdaw[lamdaw<0.] = 0.
+    
+    f            = (B/2.)*(1.-r/R)/lamdaw
+    piece        = np.exp(-f)
+    arccos_piece = np.arccos(piece)
+    F            = 2.*arccos_piece/pi
+    Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+    
+    # Estimate Cl max
+    Re         = (W*c)/nu 
+    Cl_max_ref = -0.0009*tc**3 + 0.0217*tc**2 - 0.0442*tc + 0.7005
+    Re_ref     = 9.*10**6      
+    Cl1maxp    = Cl_max_ref * ( Re / Re_ref ) **0.1
+    
+    # Compute blade CL distribution from the airfoil data 
+    if airfoil_cl is not None:
+        Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl)
+    else:
+        # If not airfoil polar provided, use 2*pi as lift curve slope
+        Cl = 2.*pi*alpha
+    
+    # By 90 deg, it's totally stalled.
+    Cl[Cl>Cl1maxp]  = Cl1maxp[Cl>Cl1maxp] # This line of code is what changed the regression testing
+    Cl[alpha>=pi/2] = 0.
+        
+    # Scale for Mach, this is Karmen_Tsien
+    sub     = Ma<1.
+    Ma2     = Ma[sub]*Ma[sub]
+    Cl[sub] = Cl[sub]/((1-Ma2)**0.5+(Ma2/(1+(1-Ma2)**0.5))*Cl[sub]/2)
+    
+    # If the blade segments are supersonic, don't scale
+    Rsquiggly = Gamma - 0.5*W*c*Cl
+    
+    #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
+    #This was solved symbolically in Matlab and exported        
+    f_wt_2 = 4*Wt*Wt
+    f_wa_2 = 4*Wa*Wa
+    Ucospsi  = U*cos_psi
+    Usinpsi  = U*sin_psi
+    Utcospsi = Ut*cos_psi
+    Uasinpsi = Ua*sin_psi
+    
+    UapUsinpsi = (Ua + Usinpsi)
+    utpUcospsi = (Ut + Ucospsi)
+    
+    utpUcospsi2 = utpUcospsi*utpUcospsi
+    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
+    
+    dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
+               (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+               + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+               - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
+              (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
+               r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
+               Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
+    
+    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
+    
+    state = Data()
+    state.Wa        = Wa
+    state.Wt        = Wt
+    state.va        = va
+    state.vt        = vt
+    state.W         = W
+    state.alpha     = alpha
+    state.Ma        = Ma
+    state.Re        = Re
+    state.Gamma     = Gamma
+    state.Cl        = Cl
+    state.Rsquiggly = Rsquiggly
+    state.dR_dpsi   = dR_dpsi
+    
+    return state
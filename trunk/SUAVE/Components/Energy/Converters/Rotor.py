@@ -17,6 +17,7 @@ from SUAVE.Core import Data, Units
 import scipy.optimize as opt
 from scipy.optimize import fsolve
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_airfoil_polars import compute_airfoil_polars
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.interpolate_airfoil_polars import interpolate_airfoil_polars
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
 
@@ -219,7 +220,7 @@ class Rotor(Energy_Component):
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on rotor')
             # compute airfoil polars for airfoils 
             airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
-            airfoil_cl     = airfoil_polars.lift_coefficients
+            airfoil_cl     = airfoil_polars.lift_coefficients[a_loc]
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
@@ -244,7 +245,6 @@ class Rotor(Energy_Component):
         
         #Things that will change with iteration
         size = (len(a),N)
-        Cl = np.zeros((1,N)) 
         
         #Setup a Newton iteration
         psi    = np.ones(size)
@@ -282,8 +282,7 @@ class Rotor(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -563,7 +562,7 @@ class Rotor(Energy_Component):
                 raise AssertionError('Dimension of airfoil sections must be equal to number of stations on rotor')
             # compute airfoil polars for airfoils 
             airfoil_polars = compute_airfoil_polars(self, a_geo, a_pol)
-            airfoil_cl     = airfoil_polars.lift_coefficients
+            airfoil_cl     = airfoil_polars.lift_coefficients[a_loc]
             airfoil_cd     = airfoil_polars.drag_coefficients
             AoA_sweep      = airfoil_polars.angle_of_attacks
         
@@ -589,7 +588,6 @@ class Rotor(Energy_Component):
         
         #Things that will change with iteration
         size = (len(a),N)
-        Cl   = np.zeros((1,N))  
         
         #Setup a Newton iteration
         psi    = np.ones(size)*0.5
@@ -628,8 +626,7 @@ class Rotor(Energy_Component):
             
             # Compute blade CL distribution from the airfoil data 
             if  a_pol != None and a_loc != None: 
-                for k in range(N):
-                    Cl[0,k] = np.interp(alpha[0,k],AoA_sweep,airfoil_cl[a_loc[k]])
+                Cl = interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl)
             else:
                 # If not airfoil polar provided, use 2*pi as lift curve slope
                 Cl = 2.*pi*alpha
@@ -595,6 +595,14 @@ class Data(dict):
         if not output in ('vector','array'): raise Exception('output type must be "vector" or "array"')        
         vector = output == 'vector'
         
+        # a bound layout packs without the recursive walk
+        layout = objgetattrib(self,'__dict__').get('_layout')
+        if vector and layout is not None:
+            M = layout.pack()
+            if M is not None:
+                return M
+            del objgetattrib(self,'__dict__')['_layout']
+        
         # list to pre-dump array elements
         M = []
         
@@ -681,6 +689,13 @@ class Data(dict):
         # check input type
         vector = M.ndim  == 1
         
+        # a bound layout unpacks without the recursive walk
+        layout = objgetattrib(self,'__dict__').get('_layout')
+        if vector and layout is not None:
+            if layout.unpack(M):
+                return self
+            del objgetattrib(self,'__dict__')['_layout']
+        
         # valid types for output
         valid_types = ( int, float,
                         array_type,
@@ -0,0 +1,223 @@
+## @ingroup Core
+# Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from .Arrays import array_type, matrix_type
+
+# ----------------------------------------------------------------------
+#   Layout
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Layout(object):
+    """ A fixed map from the numeric values of a Data() to slices of one contiguous float64 buffer.
+        The arrays in the Data() are replaced by views into the buffer, so packing and unpacking
+        walk a flat list of entries instead of recursing through the Data() and stacking its arrays.
+
+        The buffer has the same ordering as Data.pack_array(output='vector'). The layout is kept
+        as an attribute of the Data(), not as one of its items, and is not copied or saved with it.
+
+        Assumptions:
+        The structure of the Data() does not change once the layout is built. Values that are
+        reassigned, rather than written in place, are copied back into the buffer when packing,
+        so packing still visits each entry once to find them, and returns a copy of the buffer.
+        Only unknowns and residuals are bound. The conditions are rebuilt by expand_state on every
+        initialize of a sub segment, and the merged state of a mission is still stacked from the
+        sub segments once, then copied into row by row, rather than being a view of their arrays.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data):
+        """ Builds the index map and binds the arrays of data to the buffer
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data   [Data()]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        entries = []
+        offset  = [0]
+
+        valid_types = ( int, float,
+                        array_type,
+                        matrix_type )
+
+        # same walk as Data.pack_array
+        def do_map(D):
+            for k,v in D.items():
+                try:
+                    rank = v.ndim
+                except:
+                    rank = 0
+                if isinstance(v, dict):
+                    do_map(v) # recursion!
+                    continue
+                elif not isinstance(v,valid_types): continue
+                elif rank > 2: continue
+
+                shape = np.shape(v)
+                size  = int(np.prod(shape)) if rank else 1
+                entries.append([D,k,offset[0],size,shape,None])
+                offset[0] += size
+
+        do_map(data)
+
+        self.entries = entries
+        self.buffer  = np.zeros(offset[0])
+
+        for entry in entries:
+            D,k,start,size,shape,_ = entry
+            if len(shape):
+                view = self.buffer[start:start+size].reshape(shape,order='F')
+                view[...] = D[k]
+                D[k]      = view
+                entry[5]  = view
+            else:
+                self.buffer[start] = D[k]
+
+        object.__setattr__(data,'_layout',self)
+
+    def pack(self):
+        """ Returns a copy of the buffer, after copying in any value that was reassigned
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            M      [array] or None if the data no longer fits the layout
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+
+        for entry in self.entries:
+            D,k,start,size,shape,view = entry
+            value = D[k]
+            if value is view:
+                continue
+            elif view is None:
+                if np.ndim(value):
+                    return None
+                buffer[start] = value
+            elif np.shape(value) == shape:
+                view[...] = value
+                D[k]      = view
+            else:
+                return None
+
+        return buffer.copy()
+
+    def unpack(self,M):
+        """ Copies a packed vector into the buffer, which all the bound arrays are views of
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            M      [array]
+
+            Outputs:
+            success [boolean]
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+
+        if np.shape(M) != buffer.shape:
+            return False
+
+        for entry in self.entries:
+            D,k,start,size,shape,view = entry
+            value = D[k]
+            if value is view:
+                continue
+            elif view is None:
+                if np.ndim(value):
+                    return False
+            elif np.shape(value) == shape:
+                D[k] = view
+            else:
+                return False
+
+        buffer[:] = M
+
+        for entry in self.entries:
+            D,k,start,size,shape,view = entry
+            if view is None:
+                D[k] = buffer[start]
+
+        return True
+
+    def __deepcopy__(self,memo):
+        """ Copies of the data are not bound to this buffer, so the layout is not copied with them
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            memo   [dict]
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+        return None
+
+    def __reduce__(self):
+        """ A layout is not saved, the data falls back to recursive packing when loaded
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            reduction [tuple]
+
+            Properties Used:
+            N/A
+        """
+        return (type(None),())
@@ -0,0 +1,763 @@
+## @ingroup Core
+# Overlay_Data.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from copy import deepcopy
+from collections import OrderedDict
+from .Data import Data
+from .DataOrdered import DataOrdered
+from .Diffed_Data import Container
+import numpy as np
+
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#  Overlay Node
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Overlay_Node(object):
+    """ Records every key set on a node of an overlay, so only the changed keys need to be diffed
+        against the base or passed on to the overlays built on this one.
+
+        Assumptions:
+        Values are set through item or attribute assignment
+
+        Source:
+        N/A
+    """
+
+    def __getattribute__(self,k):
+        """ Retrieves an attribute or value, copying a value shared with the base the first time
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            k
+
+            Outputs:
+            whatever is found by k
+
+            Properties Used:
+            N/A
+        """
+        try:
+            shared = objgetattrib(self,'_overlay_shared')
+        except AttributeError:
+            shared = ()
+        if k in shared:
+            return copy_shared(self,k)
+        return super(Overlay_Node,self).__getattribute__(k)
+
+    def __getitem__(self,key):
+        """ Retrieves a value, copying it the first time if it is shared with the base
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            key
+
+            Outputs:
+            value
+
+            Properties Used:
+            N/A
+        """
+        try:
+            shared = objgetattrib(self,'_overlay_shared')
+        except AttributeError:
+            shared = ()
+        if key in shared:
+            return copy_shared(self,key)
+        return super(Overlay_Node,self).__getitem__(key)
+
+    def __setitem__(self,key,value):
+        """ Sets a value and records the key as changed
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            key
+            value
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        super(Overlay_Node,self).__setitem__(key,value)
+        try:
+            root = objgetattrib(self,'_overlay_root')
+        except AttributeError:
+            return
+        objgetattrib(self,'_overlay_shared').discard(key)
+        root.record_change(objgetattrib(self,'_overlay_path'),key)
+
+    def __delitem__(self,key):
+        """ Deletes a value and records the key as changed
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            key
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        super(Overlay_Node,self).__delitem__(key)
+        try:
+            root = objgetattrib(self,'_overlay_root')
+        except AttributeError:
+            return
+        objgetattrib(self,'_overlay_shared').discard(key)
+        root.record_change(objgetattrib(self,'_overlay_path'),key)
+
+    def __reduce__(self):
+        """ Copies and pickles the node with its items and bookkeeping, without recording them as changes
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        klass = objgetattrib(self,'__class__')
+        node  = '_overlay_class' in klass.__dict__
+        if node:
+            klass = klass._overlay_class
+        state = (dict(dict.items(self)),dict(objgetattrib(self,'__dict__')))
+
+        return (new_overlay_node,(klass,node),state)
+
+    def __setstate__(self,state):
+        """ Restores a copied or pickled node
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            state
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        items, attributes = state
+        dict.update(self,items)
+        objgetattrib(self,'__dict__').update(attributes)
+
+# ----------------------------------------------------------------------
+#  Overlay Data
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Overlay_Data(Overlay_Node,Data):
+    """ A copy-on-write alternative to Diffed_Data. The overlay shares every value that is not a
+        Data() with its base, arrays included, and gives each Data() of the base a node of its own.
+        Arrays, lists, sets and dictionaries are copied the first time they are taken from the
+        overlay, so they can be changed in place. Only the keys that are set or copied on the overlay
+        are diffed by store_diff, and only the keys changed on the base since the last pull_base are
+        brought in when the base is an overlay too.
+
+        Assumptions:
+        Values are taken by key or attribute, items() hands out the shared values. Ordered data is
+        copied like in Diffed_Data.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,base=None):
+        """ Builds the overlay on a base
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            base
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if base is None: base = Data()
+
+        attributes = objgetattrib(self,'__dict__')
+        attributes['_overlay_root']    = self
+        attributes['_overlay_path']    = ()
+        attributes['_overlay_source']  = base
+        attributes['_base']            = base
+        attributes['_diff']            = Data()
+        attributes['_overrides']       = OrderedDict()
+        attributes['_pending']         = OrderedDict()
+        attributes['_changes']         = OrderedDict()
+        attributes['_version']         = 0
+        attributes['_synced']          = base_version(base)
+        attributes['_ordered_paths']   = OrderedDict()
+        attributes['_copied_paths']    = OrderedDict()
+        attributes['_overlay_shared']  = set()
+        attributes['_pulling']         = False
+
+        # the bookkeeping of a diffed base is not part of its values
+        dict.clear(self)
+        for key, value in dict.items(base):
+            if isinstance(base,Data) and key in ['_base','_diff'] and hasattr(base,'store_diff'):
+                continue
+            set_shared(self,key,self.overlay_value(value,(key,)))
+
+    def record_change(self,path,key):
+        """ Records a changed key, as one set on the overlay unless it is brought in from the base
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            path              <tuple> keys of the node
+            key
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        attributes = objgetattrib(self,'__dict__')
+        change     = (path,key)
+        if not attributes['_pulling']:
+            attributes['_pending'][change] = True
+
+        attributes['_version'] += 1
+        changes = attributes['_changes']
+        changes.pop(change,None)
+        changes[change] = attributes['_version']
+
+    def changes_since(self,version):
+        """ Returns the keys changed after a version, oldest first
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            version           [int]
+
+            Outputs:
+            changes           <list> of (path, key)
+
+            Properties Used:
+            N/A
+        """
+        recorded = objgetattrib(self,'_changes')
+        changes  = []
+        for change in reversed(recorded):
+            if recorded[change] <= version:
+                break
+            changes.append(change)
+
+        return changes[::-1]
+
+    def overlay_value(self,value,path):
+        """ Makes the value an overlay holds for a value of its base. Data() gets a node, ordered data
+            a copy, and anything else is shared.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            value
+            path              <tuple>
+
+            Outputs:
+            value
+
+            Properties Used:
+            N/A
+        """
+        if isinstance(value,Data):
+            klass = objgetattrib(value,'__class__')
+            klass = klass.__dict__.get('_overlay_class',klass)
+            node  = new_overlay_node(klass,True)
+
+            attributes = objgetattrib(node,'__dict__')
+            for name, attribute in objgetattrib(value,'__dict__').items():
+                if not name.startswith('_overlay'):
+                    attributes[name] = attribute
+            attributes['_overlay_root']   = self
+            attributes['_overlay_path']   = path
+            attributes['_overlay_source'] = value
+            attributes['_overlay_shared'] = set()
+
+            for key, item in dict.items(value):
+                set_shared(node,key,self.overlay_value(item,path + (key,)))
+            return node
+
+        elif isinstance(value,DataOrdered):
+            objgetattrib(self,'_ordered_paths')[path] = True
+            return deepcopy(value)
+
+        return value
+
+    def store_diff(self):
+        """ Diffs the keys set on the overlay since the last diff against the base. The ones that differ
+            are kept through pull_base.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        attributes = objgetattrib(self,'__dict__')
+        base       = attributes['_base']
+        overrides  = attributes['_overrides']
+        pending    = attributes['_pending']
+
+        changes = list(overrides.keys()) + [change for change in pending if change not in overrides]
+        changes = changes + [(path[:-1],path[-1]) for path in attributes['_ordered_paths'] if (path[:-1],path[-1]) not in overrides]
+        changes = changes + [change for change in attributes['_copied_paths'] if change not in overrides and change not in pending]
+
+        for change in changes:
+            path, key = change
+            node      = find_node(self,path)
+            if node is None or not dict.__contains__(node,key):
+                overrides.pop(change,None)
+                continue
+
+            value     = dict.__getitem__(node,key)
+            base_node = find_node(base,path)
+            if base_node is not None and dict.__contains__(base_node,key) and \
+               same_value(value,dict.__getitem__(base_node,key)):
+                overrides.pop(change,None)
+            else:
+                overrides[change] = value
+
+        pending.clear()
+
+        # keep a readable diff like Diffed_Data
+        delta = Data()
+        for (path,key), value in overrides.items():
+            node = delta
+            for name in path:
+                if not isinstance(node.get(name,None),Data):
+                    node[name] = Data()
+                node = node[name]
+            node[key] = value
+        attributes['_diff'] = delta
+
+    def pull_base(self):
+        """ Brings in the values of the base, except for the diffed ones, and discards the values set on
+            the overlay since the last store_diff
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        attributes = objgetattrib(self,'__dict__')
+        base       = attributes['_base']
+        overrides  = attributes['_overrides']
+        pending    = attributes['_pending']
+        try: base.pull_base()
+        except AttributeError: pass
+
+        attributes['_pulling'] = True
+        try:
+            if isinstance(base,Overlay_Data) and attributes['_synced'] is not None:
+                for path, key in base.changes_since(attributes['_synced']):
+                    self.pull_value(path,key)
+            else:
+                self.pull_node(self,base,())
+
+            # values set since the last diff go back to the diffed or base values
+            for path, key in list(pending.keys()):
+                if (path,key) in overrides:
+                    node = find_node(self,path)
+                    if node is not None:
+                        node[key] = overrides[(path,key)]
+                else:
+                    self.pull_value(path,key)
+            pending.clear()
+
+            # ordered data is not tracked, so it is updated as a whole
+            for path in list(attributes['_ordered_paths'].keys()):
+                self.pull_value(path[:-1],path[-1])
+
+            # as are the copied values, which may have been changed in place
+            for path, key in list(attributes['_copied_paths'].keys()):
+                self.pull_value(path,key)
+            attributes['_copied_paths'].clear()
+        finally:
+            attributes['_pulling'] = False
+            attributes['_synced']  = base_version(base)
+
+    def pull_value(self,path,key):
+        """ Brings in one value of the base
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            path              <tuple>
+            key
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        if (path,key) in objgetattrib(self,'_overrides'):
+            return
+
+        node      = find_node(self,path)
+        base_node = find_node(objgetattrib(self,'_base'),path)
+        if node is None or base_node is None or not dict.__contains__(base_node,key):
+            return
+
+        base_value = dict.__getitem__(base_node,key)
+        value      = dict.get(node,key,None)
+
+        if value is base_value:
+            return
+        elif isinstance(value,Overlay_Node) and objgetattrib(value,'_overlay_source') is base_value:
+            return
+        elif isinstance(value,DataOrdered) and isinstance(base_value,DataOrdered):
+            value.update(base_value)
+            return
+
+        node[key] = self.overlay_value(base_value,path + (key,))
+        set_shared(node,key,dict.__getitem__(node,key))
+
+    def pull_node(self,node,base_node,path):
+        """ Brings in every value of a base that does not record its changes, the way Data.update
+            would
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            node
+            base_node
+            path              <tuple>
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        overrides = objgetattrib(self,'_overrides')
+        for key, base_value in dict.items(base_node):
+            if key.startswith('_') or (path,key) in overrides:
+                continue
+
+            value = dict.get(node,key,None)
+            if value is base_value:
+                continue
+            elif isinstance(value,Overlay_Node) and isinstance(base_value,Data) and \
+               objgetattrib(value,'_overlay_source') is base_value:
+                self.pull_node(value,base_value,path + (key,))
+            else:
+                self.pull_value(path,key)
+
+    def __str__(self,indent=''):
+        """ This function is used for printing the class.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        try:
+            base  = objgetattrib(self,'_base')
+            args  = objgetattrib(self,'_diff').__str__(indent)
+            args += indent + '_base : ' + base.__repr__() + '\n'
+            args += indent + '  tag : ' + base.tag + '\n'
+            return args
+        except AttributeError:
+            return Data.__str__(self,indent)
+
+    def finalize(self):
+        """ This just does a pull_base()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.pull_base()
+
+Overlay_Data.Container = Container
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+_overlay_classes = dict()
+
+def new_overlay_node(klass,node):
+    """ Makes an empty overlay node of a class, without its defaults
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        klass             the class of the base value, or of the root
+        node              <boolean> False for the root
+
+        Outputs:
+        node
+
+        Properties Used:
+        N/A
+    """
+    if node:
+        if klass not in _overlay_classes:
+            _overlay_classes[klass] = type(klass.__name__,(Overlay_Node,klass),{'_overlay_class':klass,
+                                                                                 '__module__':klass.__module__})
+        klass = _overlay_classes[klass]
+
+    return dict.__new__(klass)
+
+def set_shared(node,key,value):
+    """ Sets a value of a node without recording it as changed, and marks whether it is shared with
+        the base and has to be copied before it is handed out
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        node
+        key
+        value
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+    dict.__setitem__(node,key,value)
+
+    shared = objgetattrib(node,'_overlay_shared')
+    if isinstance(value,(np.ndarray,list,set,dict)) and not isinstance(value,(Data,DataOrdered)):
+        shared.add(key)
+    else:
+        shared.discard(key)
+
+def copy_shared(node,key):
+    """ Replaces a value shared with the base by a copy the first time it is taken from the overlay.
+        The copy is recorded as a change, and diffed and pulled as a whole like ordered data.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        node
+        key
+
+        Outputs:
+        value
+
+        Properties Used:
+        N/A
+    """
+    value = deepcopy(dict.__getitem__(node,key))
+    dict.__setitem__(node,key,value)
+    objgetattrib(node,'_overlay_shared').discard(key)
+
+    root = objgetattrib(node,'_overlay_root')
+    path = objgetattrib(node,'_overlay_path')
+    objgetattrib(root,'_copied_paths')[(path,key)] = True
+    root.record_change(path,key)
+
+    return value
+
+def find_node(data,path):
+    """ Finds the value at a path of keys, or None if it is not there
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        data
+        path              <tuple>
+
+        Outputs:
+        value
+
+        Properties Used:
+        N/A
+    """
+    for key in path:
+        try:
+            data = dict.__getitem__(data,key)
+        except (KeyError,TypeError):
+            return None
+
+    return data
+
+def base_version(base):
+    """ The number of changes recorded by a base, or None if it does not record them
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        base
+
+        Outputs:
+        version           [int] or None
+
+        Properties Used:
+        N/A
+    """
+    if isinstance(base,Overlay_Data):
+        return base._version
+
+    return None
+
+def same_value(a,b):
+    """ Whether an overlay value is the same as the base value, the way diff compares them
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        a
+        b
+
+        Outputs:
+        same              <boolean>
+
+        Properties Used:
+        N/A
+    """
+    if a is b:
+        return True
+    if isinstance(a,Overlay_Node) and objgetattrib(a,'_overlay_source') is b:
+        return True
+    if isinstance(a,(Data,DataOrdered)) or isinstance(b,(Data,DataOrdered)):
+        if isinstance(a,DataOrdered) and isinstance(b,DataOrdered):
+            from .Diffed_Data import diff
+            return not diff(a,b)
+        return False
+    try:
+        return bool(np.all(a == b))
+    except Exception:
+        return False
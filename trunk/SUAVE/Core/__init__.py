@@ -6,7 +6,9 @@ from .Arrays import *
 from .Data             import Data
 from .DataOrdered      import DataOrdered
 from .Diffed_Data      import Diffed_Data, diff
+from .Overlay_Data     import Overlay_Data
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
+from .Layout           import Layout
 
 from .Units import Units
\ No newline at end of file
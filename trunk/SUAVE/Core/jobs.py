@@ -0,0 +1,266 @@
+## @ingroup Core
+# jobs.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+import pickle
+import shutil
+import tempfile
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from .Data     import Data
+from .redirect import folder
+
+# ----------------------------------------------------------------------
+#  Job Runner
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def run_jobs(jobs,number_of_workers=1,timeout=None,retries=0,scratch_folder=None,keep_files=False):
+    """ Runs external solver jobs concurrently and returns their results in the order of the jobs.
+        See iterate_jobs for the description of a job.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        jobs              [list of Data]
+        number_of_workers [-]
+        timeout           [s] or None for no limit
+        retries           [-] number of times a failed job is run again
+        scratch_folder    <string> where the job folders are made, the system temporary folder if None
+        keep_files        <boolean> keep the job folders after the results are collected
+
+        Outputs:
+        results           [list of Data] see iterate_jobs
+
+        Properties Used:
+        N/A
+    """
+
+    results = [None] * len(jobs)
+    for index, result in iterate_jobs(jobs,number_of_workers,timeout,retries,scratch_folder,keep_files):
+        results[index] = result
+
+    return results
+
+## @ingroup Core
+def iterate_jobs(jobs,number_of_workers=1,timeout=None,retries=0,scratch_folder=None,keep_files=False):
+    """ Runs external solver jobs concurrently and yields each result as soon as it is collected.
+
+        Every job runs in its own folder. The input files are written there by job.prepare, in the
+        calling thread, and the command is run by a pool of at most number_of_workers threads.
+        The outputs are read back by job.collect, again in the calling thread, so both functions
+        may use the working directory. A job that exits with an error, runs out of time or fails
+        to collect is prepared and run again in a clean folder, up to retries times.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        jobs              [list of Data]
+          tag             <string>
+          command         [list of strings] the executable and its arguments
+          stdin           <string> (optional) file in the job folder that is piped to the command
+          prepare         function() (optional) writes the input files into the working directory,
+                          it may also set the command and stdin of the job
+          collect         function() reads the results from the working directory
+          pull, link      [list of strings] (optional) files copied or linked into the job folder
+          timeout         [s] (optional) overrides the timeout of the runner
+        number_of_workers [-]
+        timeout           [s] or None for no limit
+        retries           [-] number of times a failed job is run again
+        scratch_folder    <string> where the job folders are made, the system temporary folder if None
+        keep_files        <boolean> keep the job folders after the results are collected
+
+        Outputs:
+        index             [-] position of the job in jobs
+        result.
+          value           output of job.collect, None if the job failed
+          success         <boolean>
+          attempts        [-]
+          returncode      [-] None if the command timed out
+          message         <string> why the last attempt failed
+          folder          <string> the job folder, if it was kept
+          elapsed_time    [s]
+
+        Properties Used:
+        N/A
+    """
+
+    if scratch_folder is not None:
+        scratch_folder = os.path.abspath(scratch_folder)
+        if not os.path.exists(scratch_folder):
+            os.makedirs(scratch_folder)
+
+    number_of_workers = max(1,min(int(number_of_workers),len(jobs)))
+
+    results = []
+    for job in jobs:
+        result              = Data()
+        result.value        = None
+        result.success      = False
+        result.attempts     = 0
+        result.returncode   = None
+        result.message      = ''
+        result.folder       = None
+        result.elapsed_time = 0.
+        results.append(result)
+
+    with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+
+        pending = {}
+
+        def submit(index):
+            job    = jobs[index]
+            result = results[index]
+            result.attempts += 1
+
+            if result.folder is not None:
+                shutil.rmtree(result.folder,ignore_errors=True)
+            result.folder = tempfile.mkdtemp(prefix=str(job.get('tag','job'))+'_',dir=scratch_folder)
+
+            with folder(result.folder,job.get('pull',None),job.get('link',None)):
+                if job.get('prepare',None) is not None:
+                    job.prepare()
+
+            job_timeout = job.get('timeout',None)
+            if job_timeout is None:
+                job_timeout = timeout
+
+            # a relative executable is found from the calling directory, not the job folder
+            command    = list(job.command)
+            executable = shutil.which(command[0])
+            if executable is not None:
+                command[0] = os.path.abspath(executable)
+
+            future = executor.submit(execute_job,command,result.folder,job.get('stdin',None),job_timeout)
+            pending[future] = index
+
+        for index in range(len(jobs)):
+            submit(index)
+
+        while pending:
+            done, _ = wait(list(pending.keys()),return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index  = pending.pop(future)
+                job    = jobs[index]
+                result = results[index]
+
+                returncode, elapsed_time = future.result()
+                result.returncode    = returncode
+                result.elapsed_time += elapsed_time
+
+                if returncode is None:
+                    result.message = 'timed out'
+                elif returncode != 0:
+                    result.message = 'exited with code ' + str(returncode)
+                else:
+                    try:
+                        with folder(result.folder):
+                            result.value = job.collect()
+                        result.success = True
+                        result.message = ''
+                    except Exception as error:
+                        result.message = 'collect failed: ' + repr(error)
+
+                if not result.success and result.attempts <= retries:
+                    submit(index)
+                    continue
+
+                if not keep_files:
+                    shutil.rmtree(result.folder,ignore_errors=True)
+                    result.folder = None
+
+                yield index, result
+
+    return
+
+## @ingroup Core
+def execute_job(command,job_folder,stdin=None,timeout=None):
+    """ Runs one command in its job folder. The output of the command is written to job_log.txt.
+        The command is run with the job folder as its working directory, so the working directory
+        of the process is never changed and the executable has to be found before.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        command           [list of strings] with the path of the executable
+        job_folder        <string> absolute path
+        stdin             <string> file in the job folder that is piped to the command, or None
+        timeout           [s] or None
+
+        Outputs:
+        returncode        [-] None if the command timed out
+        elapsed_time      [s]
+
+        Properties Used:
+        N/A
+    """
+
+    time0 = time.time()
+    with open(os.path.join(job_folder,'job_log.txt'),'w') as log:
+        if stdin is None:
+            stdin_file = subprocess.DEVNULL
+        else:
+            stdin_file = open(os.path.join(job_folder,stdin),'r')
+        try:
+            returncode = subprocess.run(command,cwd=job_folder,stdin=stdin_file,stdout=log,
+                                        stderr=subprocess.STDOUT,timeout=timeout).returncode
+        except subprocess.TimeoutExpired:
+            returncode = None
+        except OSError as error:
+            log.write(repr(error))
+            returncode = -1
+        finally:
+            if stdin is not None:
+                stdin_file.close()
+
+    return returncode, time.time() - time0
+
+## @ingroup Core
+def picklable(*objects):
+    """ Checks that objects can be sent to worker processes. This is done before a pool of
+        processes is started, so that the only errors that come back from the workers are those
+        of the work itself.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        objects           [any]
+
+        Outputs:
+        success           <boolean>
+
+        Properties Used:
+        N/A
+    """
+
+    try:
+        pickle.dumps(objects,pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError,AttributeError,TypeError):
+        return False
+
+    return True
@@ -0,0 +1,148 @@
+## @ingroup Core
+# result_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import hashlib
+import tempfile
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Result Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+def hash_files(filenames,extra=''):
+    """ Hashes the contents of a list of files, so results computed from these files can be stored
+        under a key that changes whenever one of the files does.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        filenames         [list of strings]
+        extra             <string> anything else the results depend on
+
+        Outputs:
+        key               <string>
+
+        Properties Used:
+        N/A
+    """
+
+    digest = hashlib.sha1()
+    digest.update(str(extra).encode('utf-8'))
+
+    for filename in filenames:
+        digest.update(os.path.basename(filename).encode('utf-8'))
+        with open(filename,'rb') as f:
+            for block in iter(lambda: f.read(2**20),b''):
+                digest.update(block)
+
+    return digest.hexdigest()
+
+## @ingroup Core
+def load_result(directory,key):
+    """ Loads the arrays stored under a key, or returns None if there are none. A loaded result is
+        marked as recently used.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        directory         <string> or None for no cache
+        key               <string> or None
+
+        Outputs:
+        values            dict of arrays or None
+
+        Properties Used:
+        N/A
+    """
+
+    if directory is None or key is None:
+        return None
+
+    filename = os.path.join(directory,key + '.npz')
+    try:
+        with np.load(filename) as stored:
+            values = dict((name,stored[name]) for name in stored.files)
+    except (IOError,OSError,ValueError):
+        return None
+
+    os.utime(filename,None)
+
+    return values
+
+## @ingroup Core
+def save_result(directory,key,values,maximum_size=None):
+    """ Stores arrays under a key. The least recently used results are removed while the cache is
+        larger than maximum_size.
+
+        Assumptions:
+        Only this module writes .npz files into the directory
+
+        Source:
+        N/A
+
+        Inputs:
+        directory         <string> or None for no cache
+        key               <string> or None
+        values            dict of arrays
+        maximum_size      [bytes] or None for no limit
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+
+    if directory is None or key is None:
+        return
+
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # written to a temporary file first so a concurrent reader never sees half a result
+    handle, temporary = tempfile.mkstemp(suffix='.tmp',dir=directory)
+    with os.fdopen(handle,'wb') as f:
+        np.savez(f,**values)
+    os.replace(temporary,os.path.join(directory,key + '.npz'))
+
+    if maximum_size is None:
+        return
+
+    stored = []
+    for name in os.listdir(directory):
+        if not name.endswith('.npz'):
+            continue
+        try:
+            stat = os.stat(os.path.join(directory,name))
+        except OSError:
+            continue
+        stored.append((stat.st_mtime,stat.st_size,name))
+
+    stored.sort()
+    size = sum([entry[1] for entry in stored])
+    for mtime,file_size,name in stored:
+        if size <= maximum_size:
+            break
+        try:
+            os.remove(os.path.join(directory,name))
+        except OSError:
+            pass
+        size -= file_size
+
+    return
@@ -2,4 +2,5 @@
 # Functions needed to interface with SU2
 # @ingroup Input_Output
 from .call_SU2_CFD import call_SU2_CFD
-from .write_SU2_cfg import write_SU2_cfg
\ No newline at end of file
+from .write_SU2_cfg import write_SU2_cfg
+from .read_SU2_history import read_SU2_history
\ No newline at end of file
@@ -4,13 +4,15 @@
 # Created:  Oct 2016, T. MacDonald
 # Modified: Jan 2017, T. MacDonald
 #           Mar 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 import subprocess
 from SUAVE.Core import Data
+from .read_SU2_history import read_SU2_history
 import sys, os
 
 ## @ingroup Input_Output-SU2
-def call_SU2_CFD(tag,parallel=False,processors=1):
+def call_SU2_CFD(tag,parallel=False,processors=1,executable='SU2_CFD'):
     """This calls SU2 to perform an analysis according to the related .cfg file.
 
     Assumptions:
@@ -23,6 +25,7 @@ def call_SU2_CFD(tag,parallel=False,processors=1):
     tag                          <string>  This determines what .cfg is used and what the output file is called.
     parallel   (optional)        <boolean> This determines if SU2 will be run in parallel. This setting requires that SU2 has been built to allow this.
     processors (optional)        [-]       The number of processors used for a parallel computation.
+    executable (optional)        <string>  The SU2 solver, if it is not SU2_CFD on the system path.
 
     Outputs:
     <tag>_history.dat            This file has the SU2 convergence history.
@@ -39,41 +42,12 @@ def call_SU2_CFD(tag,parallel=False,processors=1):
         parallel_computation( tag+'.cfg', processors )
         pass
     else:
-        subprocess.call(['SU2_CFD',tag+'.cfg'])
+        subprocess.call([executable,tag+'.cfg'])
         
-    f = open(tag + '_history.dat')
-        
-    SU2_results = Data()    
-    
-    lines = f.readlines()
-    final_state = lines[-1].split(',')
-    
-    # Lift and Drag
-    
-    CL  = float(final_state[9])
-    CD  = float(final_state[8])
-    
-    SU2_results.coefficient_of_lift  = CL
-    SU2_results.coefficient_of_drag  = CD
+    CL, CD = read_SU2_history(tag + '_history.dat')
     
     print('CL:',CL)
     print('CD:',CD)
-    
-    # Moments
-    # Moments are currently not recorded since no
-    # reasonable reference length has been chosen
-    
-    #CMx = float(final_state[4])
-    #CMy = float(final_state[5])
-    #CMz = float(final_state[6])   
-    
-    #SU2_results.moment_coefficient_x = CMx
-    #SU2_results.moment_coefficient_y = CMy
-    #SU2_results.moment_coefficient_z = CMz
-    
-    #print 'CMx:',CMx
-    #print 'CMy:',CMy
-    #print 'CMz:',CMz    
             
     return CL,CD
 
@@ -0,0 +1,44 @@
+## @ingroup Input_Output-SU2
+# read_SU2_history.py
+# 
+# Created:  Oct 2026, SUAVE Team
+
+## @ingroup Input_Output-SU2
+def read_SU2_history(filename):
+    """This reads the final lift and drag coefficients from an SU2 convergence history.
+
+    Assumptions:
+    The history is written in the comma separated format set by write_SU2_cfg.
+
+    Source:
+    N/A
+
+    Inputs:
+    filename                     <string>  Usually <tag>_history.dat
+
+    Outputs:
+    CL                           [-]
+    CD                           [-]
+
+    Properties Used:
+    N/A
+    """       
+    
+    with open(filename) as f:
+        lines = f.readlines()
+        
+    final_state = lines[-1].split(',')
+    
+    # Lift and Drag
+    CL  = float(final_state[9])
+    CD  = float(final_state[8])
+    
+    # Moments
+    # Moments are currently not recorded since no
+    # reasonable reference length has been chosen
+    
+    #CMx = float(final_state[4])
+    #CMy = float(final_state[5])
+    #CMz = float(final_state[6])   
+            
+    return CL,CD
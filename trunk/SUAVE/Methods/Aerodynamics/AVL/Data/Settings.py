@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Oct 2018, M. Clarke
 #           Aug 2019, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -62,6 +63,20 @@ class Settings(Data):
                 self.discretization                      = Data()
                 self.number_control_surfaces             = 0
                 
+                # concurrent batches, each in its own folder next to the run folder
+                self.number_of_jobs                      = 1
+                self.job_timeout                         = None
+                self.job_retries                         = 0
+                
+                # batches already run for the same input files are loaded from here
+                self.training_cache_directory            = None
+                self.training_cache_memory               = 256. * 2**20
+                
+                # the training grid is refined from the conditions table until the leave-one-out
+                # error of the coefficients is below the tolerance, None to run the table as it is
+                self.adaptive_training_tolerance         = None
+                self.adaptive_training_samples           = 36
+                
                 self.filenames.avl_bin_name              = 'avl' # to call avl from command line. If avl is not on the system path, include absolute path to the avl binary i.e. '/your/path/to/avl'
                 self.filenames.run_folder                = 'avl_files'  
                 self.filenames.features                  = 'aircraft.avl'
@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Jul 2017, M. Clarke
 #           Aug 2019, M. Clarke
+#           Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -13,9 +14,13 @@ import sys
 import time
 import subprocess
 import os
+import tempfile
+from shutil import rmtree
 from SUAVE.Methods.Aerodynamics.AVL.read_results import read_results
 from SUAVE.Methods.Aerodynamics.AVL.purge_files  import purge_files
-from SUAVE.Core                                  import redirect
+from SUAVE.Core                                  import redirect, Data
+from SUAVE.Core.jobs                             import iterate_jobs
+from SUAVE.Core.result_cache                     import hash_files
 
 ## @ingroup Methods-Aerodynamics-AVL
 def run_analysis(avl_object):
@@ -99,3 +104,154 @@ def call_avl(avl_object):
 
     return exit_status
 
+## @ingroup Methods-Aerodynamics-AVL
+def run_analysis_jobs(avl_object,batches,trim_aircraft):
+    """ This runs one AVL batch per set of run conditions concurrently, each in its own folder
+    next to the run folder
+
+    Assumptions:
+        avl_object has write_conditions and translate_results methods
+        
+    Source:
+        None
+
+    Inputs:
+        avl_object.settings.
+          number_of_jobs            [-]
+          job_timeout               [s]
+          job_retries               [-]
+          filenames.avl_bin_name    <string>
+          filenames.run_folder      <string>
+        batches                     [list of run conditions]
+        trim_aircraft               <boolean>
+        
+    Outputs:
+        results                     [list] translated results of each batch
+
+    Properties Used:
+        N/A
+    """    
+    settings = avl_object.settings
+    
+    jobs = []
+    for run_conditions in batches:
+        job         = Data()
+        job.tag     = 'batch_{0:02d}'.format(len(jobs)+1)
+        job.batch   = Data()
+        job.prepare = lambda job=job, run_conditions=run_conditions: prepare_batch(avl_object,job,run_conditions,trim_aircraft)
+        job.collect = lambda job=job: read_batch(avl_object,job)
+        jobs.append(job)
+        
+    # the batch folders sit next to the run folder, airfoil files are found from the parent folder
+    scratch_folder = os.path.dirname(os.path.abspath(settings.filenames.run_folder))
+    
+    results = [None] * len(jobs)
+    for index, result in iterate_jobs(jobs,settings.number_of_jobs,settings.job_timeout,settings.job_retries,
+                                      scratch_folder,avl_object.keep_files):
+        if not result.success:
+            raise RuntimeError('AVL ' + jobs[index].tag + ' ' + result.message)
+        results[index] = avl_object.translate_results(batches[index],jobs[index].batch.cases,result.value)
+        
+    return results
+
+def prepare_batch(avl_object,job,run_conditions,trim_aircraft):
+    """ This writes the AVL input files of one batch in the working directory and sets the command
+    that runs it
+
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        job
+        run_conditions
+        trim_aircraft
+        
+    Outputs:
+        job.
+          command
+          stdin
+          batch.cases
+
+    Properties Used:
+        N/A
+    """    
+    job.batch.cases = avl_object.write_conditions(run_conditions,trim_aircraft)
+    job.command     = [avl_object.settings.filenames.avl_bin_name,avl_object.settings.filenames.features]
+    job.stdin       = avl_object.current_status.deck_file
+    
+    return
+
+def read_batch(avl_object,job):
+    """ This reads the AVL results of one batch from the working directory
+
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Inputs:
+        avl_object
+        job.batch.cases
+        
+    Outputs:
+        results
+
+    Properties Used:
+        N/A
+    """    
+    avl_object.current_status.cases = job.batch.cases
+    
+    return read_results(avl_object)
+
+## @ingroup Methods-Aerodynamics-AVL
+def batch_cache_keys(avl_object,batches,trim_aircraft):
+    """ This finds the keys of the AVL batches in the training cache by writing the geometry, mass,
+    run case and input deck files of every batch into a temporary folder and hashing them. The same
+    conditions have the same key wherever the batch comes in a run
+
+    Assumptions:
+        avl_object has a write_conditions method
+        
+    Source:
+        None
+
+    Inputs:
+        avl_object.settings.training_cache_directory <string> or None
+        batches                     [list of run conditions]
+        trim_aircraft               <boolean>
+        
+    Outputs:
+        keys                        [list of strings] None for each batch if there is no cache
+
+    Properties Used:
+        N/A
+    """    
+    settings = avl_object.settings
+    
+    if settings.training_cache_directory is None:
+        return [None] * len(batches)
+    
+    # every batch is written as the first one, the names of the files and cases depend on where
+    # the batch comes in the run, the key should only depend on the conditions
+    batch_index = avl_object.current_status.batch_index
+    folder      = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(settings.filenames.run_folder)))
+    
+    keys = []
+    try:
+        with redirect.folder(folder):
+            for run_conditions in batches:
+                avl_object.current_status.batch_index = 0
+                avl_object.write_conditions(run_conditions,trim_aircraft)
+                filenames = [settings.filenames.features,settings.filenames.mass_file,
+                             avl_object.current_status.batch_file,avl_object.current_status.deck_file]
+                keys.append(hash_files(filenames,avl_object.__class__.__name__))
+    finally:
+        avl_object.current_status.batch_index = batch_index
+        rmtree(folder,ignore_errors=True)
+    
+    return keys
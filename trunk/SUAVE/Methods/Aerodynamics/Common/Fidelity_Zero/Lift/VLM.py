@@ -15,6 +15,12 @@ from SUAVE.Core import Units
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_induced_velocity_matrix import compute_induced_velocity_matrix
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_vortex_distribution     import compute_vortex_distribution
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix              import compute_RHS_matrix
+
+from scipy.linalg import lu_factor, lu_solve
+
+import hashlib
+from collections import OrderedDict
+
 # ----------------------------------------------------------------------
 #  Vortex Lattice
 # ----------------------------------------------------------------------
@@ -69,6 +75,10 @@ def VLM(conditions,settings,geometry):
        settings.number_panels_chordwise        [Unitless]
        settings.use_surrogate                  [Unitless]
        settings.include_slipstream_effect      [Unitless]
+       settings.influence_cache_memory         [bytes]
+       settings.memory_budget                  [bytes]
+       settings.align_wake_to_freestream       [Boolean]
+       settings.vortex_distribution            [Unitless]
        conditions.aerodynamics.angle_of_attack [radians]
        conditions.freestream.mach_number       [Unitless]
        
@@ -113,45 +123,91 @@ def VLM(conditions,settings,geometry):
     mach = conditions.freestream.mach_number         # mach number
     ones = np.atleast_2d(np.ones_like(aoa)) 
    
-    # generate vortex distribution
-    VD = compute_vortex_distribution(geometry,settings)  
-    
-    # Build induced velocity matrix, C_mn
-    C_mn, DW_mn  = compute_induced_velocity_matrix(VD,n_sw,n_cw,aoa,mach)
-    MCM = VD.MCM 
-    
-    # Compute flow tangency conditions   
-    inv_root_beta = np.zeros_like(mach)
-    inv_root_beta[mach<1] = 1/np.sqrt(1-mach[mach<1]**2)     
-    inv_root_beta[mach>1] = 1/np.sqrt(mach[mach>1]**2-1) 
-    if np.any(mach==1):
-        raise('Mach of 1 cannot be used in building compressibility corrections.')
+    # generate vortex distribution, or reuse it if the geometry is unchanged
+    VD = get_vortex_distribution(geometry,settings)  
+    
+    # Compute flow tangency conditions, a Mach of 1 is moved to 1.001 as in the induced velocities
+    mach_tc       = np.where(mach==1,1.001,mach)
+    inv_root_beta = np.zeros_like(mach_tc)
+    inv_root_beta[mach_tc<1] = 1/np.sqrt(1-mach_tc[mach_tc<1]**2)     
+    inv_root_beta[mach_tc>1] = 1/np.sqrt(mach_tc[mach_tc>1]**2-1) 
     inv_root_beta = np.atleast_2d(inv_root_beta)
     
     phi   = np.arctan((VD.ZBC - VD.ZAC)/(VD.YBC - VD.YAC))*ones          # dihedral angle 
     delta = np.arctan((VD.ZC - VD.ZCH)/((VD.XC - VD.XCH)*inv_root_beta)) # mean camber surface angle 
    
-    # Build Aerodynamic Influence Coefficient Matrix
-    A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42 
-    
-    B =   np.multiply(DW_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-        + np.multiply(DW_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-        - np.multiply(DW_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # valdiated from book eqn 7.42     
-   
-   
     # Build the vector
     RHS = compute_RHS_matrix(n_sw,n_cw,delta,phi,conditions,geometry,sur_flag,slipstream)
-
-    # Compute vortex strength  
-    n_cp  = VD.n_cp  
-    gamma = np.linalg.solve(A,RHS)
-    gamma_3d = np.repeat(np.atleast_3d(gamma), n_cp ,axis = 2 )
-    u = np.sum(C_mn[:,:,:,0]*MCM[:,:,:,0]*gamma_3d, axis = 2) 
-    v = np.sum(C_mn[:,:,:,1]*MCM[:,:,:,1]*gamma_3d, axis = 2) 
-    w = np.sum(C_mn[:,:,:,2]*MCM[:,:,:,2]*gamma_3d, axis = 2) 
-    w_ind = -np.sum(B*MCM[:,:,:,2]*gamma_3d, axis = 2) 
+    
+    # wake model, the semi-infinite legs follow the freestream or the chord line
+    if settings.align_wake_to_freestream:
+        theta_w = aoa
+    else:
+        theta_w = np.zeros_like(aoa)
+    
+    # flight conditions with the same Mach number and wake angle share one influence matrix
+    n_cp      = VD.n_cp  
+    n_points  = len(aoa)
+    _, first, group = np.unique(np.hstack([mach,theta_w]),axis=0,return_index=True,return_inverse=True)
+    group     = np.ravel(group)
+    n_groups  = len(first)
+    order     = np.argsort(group,kind='stable')
+    bounds    = np.searchsorted(group[order],np.arange(n_groups+1))
+    
+    # the influence matrices are built for blocks of groups that fit in the memory budget
+    chunk_size = compute_chunk_size(n_cp,n_groups,settings.memory_budget)
+    
+    gamma = np.zeros((n_points,n_cp))
+    u     = np.zeros_like(gamma)
+    v     = np.zeros_like(gamma)
+    w     = np.zeros_like(gamma)
+    w_ind = np.zeros_like(gamma)
+    
+    for start in range(0,n_groups,chunk_size):
+        groups = np.arange(start,min(start+chunk_size,n_groups))
+        rows   = first[groups]
+        
+        # Build induced velocity matrix, C_mn
+        C_mn, DW_mn  = compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w[rows],mach[rows],settings.influence_cache_memory,
+                                                       settings.influence_cache)
+        MCM = VD.MCM 
+        
+        sin_delta = np.sin(delta[rows])
+        cos_delta = np.cos(delta[rows])
+        sin_phi   = np.sin(phi[rows])
+        cos_phi   = np.cos(phi[rows])
+       
+        # Build Aerodynamic Influence Coefficient Matrix
+        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(sin_delta*cos_phi)) \
+            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(cos_delta*sin_phi)) \
+            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(cos_phi*cos_delta))   # valdiated from book eqn 7.42 
+        
+        B =   np.multiply(DW_mn[:,:,:,0],np.atleast_3d(sin_delta*cos_phi)) \
+            + np.multiply(DW_mn[:,:,:,1],np.atleast_3d(cos_delta*sin_phi)) \
+            - np.multiply(DW_mn[:,:,:,2],np.atleast_3d(cos_phi*cos_delta))   # valdiated from book eqn 7.42     
+        
+        # the induced velocities are the vortex strengths scaled by the summed influences
+        u_sum     = np.sum(C_mn[:,:,:,0]*MCM[:,:,:,0], axis = 2) 
+        v_sum     = np.sum(C_mn[:,:,:,1]*MCM[:,:,:,1], axis = 2) 
+        w_sum     = np.sum(C_mn[:,:,:,2]*MCM[:,:,:,2], axis = 2) 
+        w_ind_sum = -np.sum(B*MCM[:,:,:,2], axis = 2) 
+    
+        # Compute vortex strength, factoring each influence matrix once for all of its right hand sides
+        for i,g in enumerate(groups):
+            members        = order[bounds[g]:bounds[g+1]]
+            lu             = lu_factor(A[i])
+            gamma[members] = lu_solve(lu,RHS[members].T).T
+            u[members]     = gamma[members]*u_sum[i]
+            v[members]     = gamma[members]*v_sum[i]
+            w[members]     = gamma[members]*w_sum[i]
+            w_ind[members] = gamma[members]*w_ind_sum[i]
+        
+        # delete MCM from VD data structure since it consumes memory
+        delattr(VD, 'MCM')   
+        del C_mn, DW_mn, MCM, A, B
+        
+    # a Mach of 1 is moved to 1.001, as the induced velocities did before they were grouped
+    mach[mach==1] = 1.001
      
     # ---------------------------------------------------------------------------------------
     # STEP 10: Compute aerodynamic coefficients 
@@ -207,7 +263,120 @@ def VLM(conditions,settings,geometry):
     # moment coefficient
     CM          = np.atleast_2d(np.sum(np.multiply((X_M - VD.XCH*ones),Del_Y*gamma),axis=1)/(Sref*c_bar)).T     
     
-    # delete MCM from VD data structure since it consumes memory
-    delattr(VD, 'MCM')   
+    return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP
+
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def get_vortex_distribution(geometry,settings):
+    """Returns the vortex distribution in the settings if it was built from the same geometry
+    and number of panels, otherwise computes a new one with an empty cache of induced velocities.
+    The cache is kept in the settings rather than in the vortex distribution, which is attached to
+    the geometry and would otherwise be copied and diffed with the configs.
+
+    Assumptions:
+    The vortex distribution only depends on the wings, the fuselages and the number of panels
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.wings                             
+    geometry.fuselages                         
+    settings.number_panels_spanwise            [Unitless]
+    settings.number_panels_chordwise           [Unitless]
+    settings.vortex_distribution               [Unitless]
+    settings.influence_cache                   [OrderedDict]
+
+    Outputs:
+    VD - vehicle vortex distribution           [Unitless]
+    settings.influence_cache                   [OrderedDict]
+
+    Properties Used:
+    N/A
+    """
+    
+    key = vortex_distribution_key(geometry,settings)
+    VD  = settings.get('vortex_distribution')
+    
+    if VD is None or VD.get('_geometry_key') is None:
+        VD = None
+    elif VD._geometry_key != key:
+        VD = None
+    
+    if VD is None:
+        VD = compute_vortex_distribution(geometry,settings)
+        VD._geometry_key = key
+        settings.vortex_distribution = VD
+        settings.influence_cache     = OrderedDict()
+    elif settings.get('influence_cache') is None:
+        settings.influence_cache     = OrderedDict()
+        
+    # the RHS reads the distribution from the geometry
+    geometry.vortex_distribution = VD
+        
+    return VD
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_distribution_key(geometry,settings):
+    """Hashes the numeric values of the wings and fuselages along with the number of panels
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.wings                             
+    geometry.fuselages                         
+    settings.number_panels_spanwise            [Unitless]
+    settings.number_panels_chordwise           [Unitless]
+
+    Outputs:
+    key                                        [string]
+
+    Properties Used:
+    N/A
+    """    
+    
+    digest = hashlib.sha1()
+    digest.update(str((settings.number_panels_spanwise,settings.number_panels_chordwise)).encode())
+    
+    for components in [geometry.wings,geometry.fuselages]:
+        for component in components:
+            digest.update(component.tag.encode())
+            digest.update(np.ascontiguousarray(component.pack_array(),dtype=float).tobytes())
+    
+    return digest.hexdigest()
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_chunk_size(n_cp,n_points,memory_budget):
+    """Finds how many flight conditions can be evaluated at once within a memory budget
+
+    Assumptions:
+    About 16 arrays of shape (n_cp,n_cp,3) are held at once for each flight condition
+    while the induced velocities and the influence matrices are built. At least one 
+    flight condition is always evaluated.
+
+    Source:
+    N/A
+
+    Inputs:
+    n_cp          - number of control points            [Unitless]
+    n_points      - number of flight conditions         [Unitless]
+    memory_budget - 0 or None for no limit              [bytes]
+
+    Outputs:
+    chunk_size                                          [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    if not memory_budget:
+        return max(n_points,1)
+    
+    bytes_per_point = 16 * 3 * 8 * n_cp**2
+    chunk_size      = int(memory_budget // bytes_per_point)
     
-    return CL, CDi, CM, CL_wing, CDi_wing, cl_y , cdi_y , CP 
\ No newline at end of file
+    return min(max(chunk_size,1),max(n_points,1))
@@ -11,24 +11,34 @@
 
 # package imports 
 import numpy as np 
+from collections import OrderedDict
 
 ## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
-def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
+def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach,cache_memory=0.,cache=None):
     """ This computes the induced velocitys are each control point 
     of the vehicle vortex lattice 
 
     Assumptions: 
     Trailing vortex legs infinity are alligned to freestream
 
+    The bound vortices and the trailing legs on the wing only depend on the
+    geometry and the Mach number, so they are computed once for each unique
+    Mach number. With a cache_memory they are kept in the cache for later 
+    calls, which belongs to the vortex distribution it was built from.
+    The semi-infinite legs depend on the wake angle and are computed for 
+    every flight condition.
+
     Source:  
     None
 
     Inputs: 
-    VD       - vehicle vortex distribution      [Unitless] 
-    n_sw     - number_panels_spanwise           [Unitless]
-    n_cw     - number_panels_chordwise          [Unitless] 
-    mach                                        [Unitless] 
-    theta_w  - freestream wake angle            [radians]
+    VD           - vehicle vortex distribution      [Unitless] 
+    n_sw         - number_panels_spanwise           [Unitless]
+    n_cw         - number_panels_chordwise          [Unitless] 
+    mach                                            [Unitless] 
+    theta_w      - freestream wake angle            [radians]
+    cache_memory - size of the Mach number cache    [bytes]
+    cache        - induced velocities per Mach      [OrderedDict]
     
     Outputs:                                
     C_mn     - total induced velocity matrix    [Unitless] 
@@ -44,11 +54,132 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     inv_root_beta = np.zeros_like(mach)
     inv_root_beta[mach<1] = 1/np.sqrt(1-mach[mach<1]**2)     
     inv_root_beta[mach>1] = 1/np.sqrt(mach[mach>1]**2-1) 
+    
+    # the Mach independent influences, one for each unique Mach number
+    mach_values, mach_index = np.unique(np.ravel(mach),return_inverse=True)
+    C_AB, DW_AB, MCM = compute_wing_induced_velocity(VD,n_sw,n_cw,mach_values,cache_memory,cache)
+    
     mach[mach==1]         = 1.001
     
     if np.any(mach==1):
         raise('Mach of 1 cannot be used in building compressibiliy corrections.')
     inv_root_beta = np.atleast_3d(inv_root_beta)
+    
+    YBH   = np.atleast_3d(VD.YBH*ones) 
+    
+    XA_TE   = np.atleast_3d(VD.XA_TE*inv_root_beta)
+    YA_TE   = np.atleast_3d(VD.YA_TE*ones)
+    ZA_TE   = np.atleast_3d(VD.ZA_TE*ones)
+    XB_TE   = np.atleast_3d(VD.XB_TE*inv_root_beta)
+    YB_TE   = np.atleast_3d(VD.YB_TE*ones)
+    ZB_TE   = np.atleast_3d(VD.ZB_TE*ones) 
+    
+    XC    = np.atleast_3d(VD.XC*inv_root_beta)
+    YC    = np.atleast_3d(VD.YC*ones) 
+    ZC    = np.atleast_3d(VD.ZC*ones)  
+
+    theta_w = np.atleast_3d(theta_w)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
+    
+    # -------------------------------------------------------------------------------------------
+    # Compute velocity induced by the semi-infinite trailing legs on every control point by every panel
+    # ------------------------------------------------------------------------------------------- 
+    ## If YBH is negative, flip A and B, ie negative side of the airplane. Vortex order flips
+    boolean = YBH<0.
+    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
+    YA_TE[boolean], YB_TE[boolean] = YB_TE[boolean], YA_TE[boolean]
+    ZA_TE[boolean], ZB_TE[boolean] = ZB_TE[boolean], ZA_TE[boolean]
+
+    # Transpose thing
+    XC = np.swapaxes(XC,1,2) 
+    YC = np.swapaxes(YC,1,2) 
+    ZC = np.swapaxes(ZC,1,2)  
+
+    # velocity induced by left leg of vortex (A to inf)
+    C_Ainf  = np.transpose(vortex_leg_from_A_to_inf(XC, YC, ZC, XA_TE, YA_TE, ZA_TE,theta_w),axes=[1,2,3,0])
+
+    # velocity induced by right leg of vortex (B to inf)
+    C_Binf  = np.transpose(vortex_leg_from_B_to_inf(XC, YC, ZC, XB_TE, YB_TE, ZB_TE,theta_w),axes=[1,2,3,0])
+
+    # expand the Mach cone Matrix to the flight conditions, the same for all three components
+    MCM    = MCM[mach_index]
+    VD.MCM = np.broadcast_to(MCM,MCM.shape[:3]+(3,))
+    
+    # multiply by mach cone 
+    C_inf  = C_Ainf + C_Binf
+    C_inf *= MCM
+    
+    # Add all the influences together
+    C_mn   = C_AB[mach_index]  + C_inf    # verified from book using example 7.4 pg 399-404
+    DW_mn  = DW_AB[mach_index] + 2*C_inf  # summation of trailing vortices for semi infinite
+    
+    return C_mn, DW_mn 
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def compute_wing_induced_velocity(VD,n_sw,n_cw,mach,cache_memory=0.,cache=None):
+    """ This computes the velocities induced by the bound vortices and the 
+    trailing legs on the wing, which do not depend on the wake angle, and the
+    mach cone matrix. Previously computed Mach numbers are taken from the cache.
+
+    Assumptions: 
+    The vortex distribution is not changed once it is computed
+
+    Source:  
+    None
+
+    Inputs: 
+    VD           - vehicle vortex distribution         [Unitless] 
+    n_sw         - number_panels_spanwise              [Unitless]
+    n_cw         - number_panels_chordwise             [Unitless] 
+    mach         - unique Mach numbers                 [Unitless] 
+    cache_memory - size of the Mach number cache       [bytes]
+    cache        - induced velocities per Mach         [OrderedDict]
+    
+    Outputs:                                
+    C_AB     - induced velocity matrix, no semi-infinite legs  [Unitless] 
+    DW_AB    - induced downwash matrix, no semi-infinite legs  [Unitless] 
+    MCM      - mach cone matrix, one shared component          [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    if cache is None or cache_memory <= 0:
+        cache = OrderedDict()
+    
+    # compute the Mach numbers that are not stored
+    keys    = [float(m) for m in mach]
+    missing = sorted(set([k for k in keys if not k in cache]))
+    
+    if len(missing):
+        results = compute_wing_influence(VD,n_sw,n_cw,np.atleast_2d(missing).T)
+        for i,key in enumerate(missing):
+            cache[key] = (results[0][i],results[1][i],results[2][i])
+            
+    C_AB  = np.array([cache[k][0] for k in keys])
+    DW_AB = np.array([cache[k][1] for k in keys])
+    MCM   = np.array([cache[k][2] for k in keys])
+    
+    # keep the most recently used Mach numbers that fit
+    if cache_memory > 0:
+        for key in keys:
+            cache.move_to_end(key)
+        size = sum([sum([a.nbytes for a in v]) for v in cache.values()])
+        while len(cache) and size > cache_memory:
+            _, value = cache.popitem(last=False)
+            size    -= sum([a.nbytes for a in value])
+            
+    return C_AB, DW_AB, MCM
+
+def compute_wing_influence(VD,n_sw,n_cw,mach):
+    # the mach independent part of the induced velocity matrix for a column of Mach numbers
+    ones     = np.atleast_3d(np.ones_like(mach))
+ 
+    # Prandtl Glauret Transformation for subsonic
+    inv_root_beta = np.zeros_like(mach)
+    inv_root_beta[mach<1] = 1/np.sqrt(1-mach[mach<1]**2)     
+    inv_root_beta[mach>1] = 1/np.sqrt(mach[mach>1]**2-1) 
+    mach[mach==1]         = 1.001
+    inv_root_beta = np.atleast_3d(inv_root_beta)
      
     XAH   = np.atleast_3d(VD.XAH*inv_root_beta) 
     YAH   = np.atleast_3d(VD.YAH*ones) 
@@ -71,19 +202,9 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     YB2   = np.atleast_3d(VD.YB2*ones)
     ZB2   = np.atleast_3d(VD.ZB2*ones) 
     
-    XA_TE   = np.atleast_3d(VD.XA_TE*inv_root_beta)
-    YA_TE   = np.atleast_3d(VD.YA_TE*ones)
-    ZA_TE   = np.atleast_3d(VD.ZA_TE*ones)
-    XB_TE   = np.atleast_3d(VD.XB_TE*inv_root_beta)
-    YB_TE   = np.atleast_3d(VD.YB_TE*ones)
-    ZB_TE   = np.atleast_3d(VD.ZB_TE*ones) 
-    
     XC    = np.atleast_3d(VD.XC*inv_root_beta)
     YC    = np.atleast_3d(VD.YC*ones) 
     ZC    = np.atleast_3d(VD.ZC*ones)  
-    n_w   = VD.n_w
-
-    theta_w = np.atleast_3d(theta_w)   # wake model, use theta_w if setting to freestream, use 0 if setting to airfoil chord like
     
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
@@ -100,72 +221,52 @@ def compute_induced_velocity_matrix(VD,n_sw,n_cw,theta_w,mach):
     YAH[boolean], YBH[boolean] = YBH[boolean], YAH[boolean] 
     ZAH[boolean], ZBH[boolean] = ZBH[boolean], ZAH[boolean]
 
-    XA_TE[boolean], XB_TE[boolean] = XB_TE[boolean], XA_TE[boolean]
-    YA_TE[boolean], YB_TE[boolean] = YB_TE[boolean], YA_TE[boolean]
-    ZA_TE[boolean], ZB_TE[boolean] = ZB_TE[boolean], ZA_TE[boolean]
-
     # Transpose thing
     XC = np.swapaxes(XC,1,2) 
     YC = np.swapaxes(YC,1,2) 
     ZC = np.swapaxes(ZC,1,2)  
     
+    # compute Mach Cone Matrix, one column shared by the three components
+    MCM      = np.ones(XC.shape[:2]+(XAH.shape[2],1))
+    MCM      = compute_mach_cone_matrix(XC,YC,ZC,MCM,mach)
+    
     # compute influence of bound vortices 
-    C_AB_bv = np.transpose(vortex(XC, YC, ZC, XAH, YAH, ZAH, XBH, YBH, ZBH),axes=[1,2,3,0])
+    C_AB_bv  = np.transpose(vortex(XC, YC, ZC, XAH, YAH, ZAH, XBH, YBH, ZBH),axes=[1,2,3,0])
+    C_AB_bv *= MCM
     
-    # compute influence of 3/4 left legs 
-    C_AB_34_ll = np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH),axes=[1,2,3,0]) # original
-
-    # compute influence of whole panel left legs  
-    C_AB_ll   =  np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1),axes=[1,2,3,0]) # original
-
-    # compute influence of 3/4 right legs  
-    C_AB_34_rl = np.transpose(vortex(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
-
-    # compute influence of whole right legs   
-    C_AB_rl = np.transpose(vortex(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
-
-    # velocity induced by left leg of vortex (A to inf)
-    C_Ainf  = np.transpose(vortex_leg_from_A_to_inf(XC, YC, ZC, XA_TE, YA_TE, ZA_TE,theta_w),axes=[1,2,3,0])
-
-    # velocity induced by right leg of vortex (B to inf)
-    C_Binf  = np.transpose(vortex_leg_from_B_to_inf(XC, YC, ZC, XB_TE, YB_TE, ZB_TE,theta_w),axes=[1,2,3,0])
-
-    # compute Mach Cone Matrix
-    MCM      = np.ones_like(C_AB_bv)
-    MCM      = compute_mach_cone_matrix(XC,YC,ZC,MCM,mach)
-    VD.MCM = MCM 
-    n_cp     = n_w*n_cw*n_sw 
+    # compute influence of 3/4 left and right legs 
+    C_AB_34  = np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XAH, YAH, ZAH),axes=[1,2,3,0]) # original
+    C_AB_34 += np.transpose(vortex(XC, YC, ZC, XBH, YBH, ZBH, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
+    C_AB_34 *= MCM
+
+    # compute influence of whole panel left and right legs  
+    C_AB_legs  = np.transpose(vortex(XC, YC, ZC, XA2, YA2, ZA2, XA1, YA1, ZA1),axes=[1,2,3,0]) # original
+    C_AB_legs += np.transpose(vortex(XC, YC, ZC, XB1, YB1, ZB1, XB2, YB2, ZB2),axes=[1,2,3,0]) # original 
+    C_AB_legs *= MCM
     
-    # multiply by mach cone 
-    C_AB_bv     = C_AB_bv    * MCM
-    C_AB_34_ll  = C_AB_34_ll * MCM
-    C_AB_ll     = C_AB_ll    * MCM
-    C_AB_34_rl  = C_AB_34_rl * MCM
-    C_AB_rl     = C_AB_rl    * MCM
-    C_Ainf      = C_Ainf     * MCM
-    C_Binf      = C_Binf     * MCM  
+    # adds up all the trailing legs of the vortices which are on the wing for the downwind panels   
+    C_AB_on_wing = sum_downwind_panels(C_AB_legs,n_cw)
+
+    # Add all the influences together, except the semi-infinite legs
+    C_AB_tot = C_AB_on_wing + C_AB_34  # verified from book using example 7.4 pg 399-404
+    C_AB     = C_AB_bv + C_AB_tot      # verified from book using example 7.4 pg 399-404
     
-    # the follow block of text adds up all the trailing legs of the vortices which are on the wing for the downwind panels   
-    C_AB_ll_on_wing = np.zeros_like(C_AB_ll)
-    C_AB_rl_on_wing = np.zeros_like(C_AB_ll)
+    DW_AB = 2*C_AB_tot # summation of trailing vortices for semi infinite
     
-    # original 
-    for n in range(n_cp):
-        n_te_p = (n_cw-(n+1)%n_cw)
-        if (n+1)%n_cw != 0:
-            start = n+1
-            end   = n+n_te_p
-            C_AB_ll_on_wing[:,:,n,:] = np.sum(C_AB_ll[:,:,start:end,:],axis=2) 
-            C_AB_rl_on_wing[:,:,n,:] = np.sum(C_AB_rl[:,:,start:end,:],axis=2)                
+    return C_AB, DW_AB, MCM
 
-    # Add all the influences together
-    C_AB_ll_tot = C_AB_ll_on_wing + C_AB_34_ll + C_Ainf  # verified from book using example 7.4 pg 399-404
-    C_AB_rl_tot = C_AB_rl_on_wing + C_AB_34_rl + C_Binf  # verified from book using example 7.4 pg 399-404
-    C_mn        = C_AB_bv +  C_AB_ll_tot  + C_AB_rl_tot  # verified from book using example 7.4 pg 399-404
+def sum_downwind_panels(C_AB,n_cw):
+    # for every panel, the sum over the panels behind it in the same chordwise strip, leaving
+    # out the last panel of the strip. a reversed cumulative sum over the chordwise axis
+    shape   = C_AB.shape
+    strips  = C_AB.reshape(shape[:2]+(shape[2]//n_cw,n_cw,shape[3]))
     
-    DW_mn = 2*(C_AB_ll_tot + C_AB_rl_tot) # summation of trailing vortices for semi infinite
+    on_wing = np.zeros_like(strips)
+    if n_cw > 2:
+        behind = np.cumsum(strips[:,:,:,n_cw-2:0:-1,:],axis=3)[:,:,:,::-1,:]
+        on_wing[:,:,:,:n_cw-2,:] = behind
     
-    return C_mn, DW_mn 
+    return on_wing.reshape(shape)
 
 # -------------------------------------------------------------------------------
 # vortex strength computation
@@ -195,7 +296,7 @@ def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2):
     R0R1   = X2_X1*X_X1 + Y2_Y1*Y_Y1 + Z2_Z1*Z_Z1
     R0R2   = X2_X1*X_X2 + Y2_Y1*Y_Y2 + Z2_Z1*Z_Z2
     RVEC   = np.array([R1R2X,R1R2Y,R1R2Z])
-    COEF   = (1/(4*np.pi))*(RVEC/SQUARE) * (R0R1/R1 - R0R2/R2)    
+    COEF   = RVEC * ((R0R1/R1 - R0R2/R2)/(4*np.pi*SQUARE))    
 
     return COEF
 
@@ -238,26 +339,15 @@ def vortex_leg_from_B_to_inf(X,Y,Z,X1,Y1,Z1,tw):
     return COEF
 
 def compute_mach_cone_matrix(XC,YC,ZC,MCM,mach):
- 
-    for m_idx in range(len(mach)):
-        
-        # Prep new vectors
-        XC_sub = XC[m_idx,:]
-        YC_sub = YC[m_idx,:]
-        ZC_sub = ZC[m_idx,:]
-        length = len(XC[m_idx,:])
-        ones   = np.ones((1,length))
-        
-        # Take differences
-        del_x = XC_sub*ones - XC_sub.T
-        del_y = YC_sub*ones - YC_sub.T
-        del_z = ZC_sub*ones - ZC_sub.T
-        
-        # Flag certain indices
-        c     = np.arcsin(1/mach[m_idx])
-        flag  = -c*del_x**2 + del_y**2 + del_z**2
-        idxs  = np.where(flag > 0.0)
-        MCM[m_idx,idxs[0],idxs[1]]  = [0.0, 0.0, 0.0]      
     
+    # Take differences, for all Mach numbers at once
+    del_x = XC - np.swapaxes(XC,1,2)
+    del_y = YC - np.swapaxes(YC,1,2)
+    del_z = ZC - np.swapaxes(ZC,1,2)
+    
+    # Flag certain indices
+    c     = np.atleast_3d(np.arcsin(1/mach))
+    flag  = -c*del_x**2 + del_y**2 + del_z**2
+    MCM[flag > 0.0] = 0.0
     
-    return MCM
\ No newline at end of file
+    return MCM
@@ -0,0 +1,45 @@
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+# interpolate_airfoil_polars.py
+# 
+# Created:  Oct 2026, SUAVE Team
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+import numpy as np
+
+## @ingroup Methods-Geometry-Two_Dimensional-Cross_Section-Airfoil
+def interpolate_airfoil_polars(alpha,AoA_sweep,airfoil_cl):
+    """Linearly interpolates the lift coefficient of every station at every flight condition at
+    once. This is np.interp applied along each station, values outside of the sweep are held at
+    the end points.
+
+    Assumptions:
+    AoA_sweep is increasing
+
+    Source:
+    N/A
+
+    Inputs:
+    alpha                        [-] (number of conditions, number of stations)
+    AoA_sweep                    [-] (number of angles)
+    airfoil_cl                   [-] (number of stations, number of angles)
+
+    Outputs:
+    Cl                           [-] (number of conditions, number of stations)
+
+    Properties Used:
+    N/A
+    """
+    
+    n_aoa   = len(AoA_sweep)
+    station = np.arange(airfoil_cl.shape[0])
+    
+    idx  = np.clip(np.searchsorted(AoA_sweep,alpha,side='right')-1,0,n_aoa-2)
+    x0   = AoA_sweep[idx]
+    x1   = AoA_sweep[idx+1]
+    t    = np.clip((alpha-x0)/(x1-x0),0.,1.)
+    
+    cl0  = airfoil_cl[station,idx]
+    cl1  = airfoil_cl[station,idx+1]
+    
+    return cl0 + t*(cl1-cl0)
@@ -11,7 +11,8 @@
 # ----------------------------------------------------------------------
 
 from SUAVE.Analyses import Process
-from SUAVE.Core import Data
+from SUAVE.Core import Data, Layout
+from SUAVE.Core.Arrays import array_type
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -25,7 +26,7 @@ def expand_sub_segments(segment):
         N/A
         
         Inputs:
-        N/A
+        state.numerics.warm_start [Warm_Start]
             
         Outputs:
         N/A
@@ -37,6 +38,11 @@ def expand_sub_segments(segment):
 
     last_tag = None
     
+    # the merged state will be rebuilt
+    segment._merge_map = None
+    
+    warm_start = segment.state.numerics.warm_start
+    
     for tag,sub_segment in segment.segments.items():
         
         if Process.verbose:
@@ -46,6 +52,13 @@ def expand_sub_segments(segment):
             sub_segment.state.initials = segment.segments[last_tag].state
         last_tag = tag        
         
+        # nothing is reused from an earlier solve
+        sub_segment._last_evaluation = None
+        
+        # the sub segments share the warm start store
+        if warm_start is not None and sub_segment.state.numerics.warm_start is None:
+            sub_segment.state.numerics.warm_start = warm_start
+        
         sub_segment.process.initialize.expand_state(sub_segment)
                
         if Process.verbose:
@@ -58,13 +71,15 @@ def expand_sub_segments(segment):
 
 ## @ingroup Methods-Missions-Segments-Common
 def update_sub_segments(segment):
-    """ Loops through the segments and fills them in
+    """ Loops through the segments and fills them in. With incremental evaluation, a sub segment is
+        skipped when its unknowns, initials and inputs and those of every sub segment before it are
+        unchanged since the last call, so its conditions and residuals are reused.
     
         Assumptions:
         N/A
         
         Inputs:
-        N/A
+        state.numerics.incremental_evaluation [boolean]
             
         Outputs:
         N/A
@@ -73,7 +88,20 @@ def update_sub_segments(segment):
         N/A
                                 
     """      
+    incremental      = segment.state.numerics.incremental_evaluation
+    upstream_changed = False
+    
     for tag,sub_segment in segment.segments.items():
+        
+        if incremental:
+            fingerprint = sub_segment.fingerprint()
+            initials    = sub_segment.state.initials
+            last        = sub_segment._last_evaluation
+            if not upstream_changed and last is not None and last[1] is initials and last[0] == fingerprint:
+                continue
+            upstream_changed = True
+            sub_segment._last_evaluation = (fingerprint, initials)
+        
         sub_segment.initialize()
         sub_segment.iterate()
         sub_segment.finalize()
@@ -138,13 +166,15 @@ def sequential_sub_segments(segment):
 ## @ingroup Methods-Missions-Segments-Common
 def merge_sub_segment_states(segment):
     
-    """ Merges all of the sub segment states back into the main state
+    """ Merges all of the sub segment states back into the main state. With a contiguous state the
+        unknowns and residuals of the main state are bound to one buffer each, and later merges copy
+        the sub segment arrays into the preallocated main state arrays.
     
         Assumptions:
         N/A
         
         Inputs:
-        N/A
+        state.numerics.contiguous_state [boolean]
             
         Outputs:
         N/A
@@ -153,8 +183,115 @@ def merge_sub_segment_states(segment):
         N/A
                                 
     """       
+    
+    contiguous = segment.state.numerics.contiguous_state
+    
+    if contiguous:
+        merge_map = segment.get('_merge_map')
+        if merge_map is not None and merge_in_place(merge_map):
+            return
+
+    merged = segment.merged()
+
+    # only the stacked arrays, so the numerics of the top segment are kept
+    for key in ['unknowns','conditions','residuals']:
+        segment.state[key].update(merged[key])
+        
+    if contiguous:
+        Layout(segment.state.unknowns)
+        Layout(segment.state.residuals)
+        segment._merge_map = build_merge_map(segment)
+        
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def build_merge_map(segment):
+    
+    """ Finds the rows of the merged state arrays that each sub segment array is stacked into
+    
+        Assumptions:
+        The merged state was just built by Segment.merged()
+        
+        Inputs:
+        segment.segments                [Data]
+        segment.state                   [Data]
+            
+        Outputs:
+        merge_map                       [list] or None if the layout can't be matched
+
+        Properties Used:
+        N/A
+                                
+    """    
+    
+    entries    = []
+    containers = []
+    rows       = {}
+    
+    def do_map(sub_D,D):
+        containers.append((sub_D,len(sub_D)))
+        for k,v in sub_D.items():
+            if not k in D: continue
+            if isinstance(v,dict) and isinstance(D[k],dict):
+                do_map(v,D[k]) # recursion!
+            elif isinstance(v,array_type) and isinstance(D[k],array_type) and v.ndim == 2:
+                leaf  = D[k]
+                start = rows.get((id(leaf),k),0)
+                stop  = start + v.shape[0]
+                if stop > leaf.shape[0] or leaf.ndim != 2 or leaf.shape[1] != v.shape[1]:
+                    raise ValueError
+                entries.append((sub_D,k,D,leaf,leaf[start:stop]))
+                rows[(id(leaf),k)] = stop
+    
+    try:
+        for sub_segment in segment.segments:
+            for key in ['unknowns','conditions','residuals']:
+                do_map(sub_segment.state[key],segment.state[key])
+    except ValueError:
+        return None
+    
+    # every merged row has to come from a sub segment
+    for sub_D,k,D,leaf,slot in entries:
+        if rows[(id(leaf),k)] != leaf.shape[0]:
+            return None
+    
+    merge_map = Data()
+    merge_map.entries    = entries
+    merge_map.containers = containers
+    
+    return merge_map
 
-    segment.state.update(segment.merged())
+## @ingroup Methods-Missions-Segments-Common
+def merge_in_place(merge_map):
+    
+    """ Copies the sub segment arrays into the preallocated rows of the merged state
+    
+        Assumptions:
+        N/A
+        
+        Inputs:
+        merge_map                       [Data]
+            
+        Outputs:
+        success                         [boolean]
+
+        Properties Used:
+        N/A
+                                
+    """    
+    
+    # a new or removed value means the map is out of date
+    for sub_D,n in merge_map.containers:
+        if len(sub_D) != n:
+            return False
+    
+    for sub_D,k,D,leaf,slot in merge_map.entries:
+        value = sub_D[k]
+        if D[k] is not leaf or getattr(value,'shape',None) != slot.shape:
+            return False
+        slot[...] = value
+            
+    return True
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
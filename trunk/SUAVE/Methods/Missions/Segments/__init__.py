@@ -3,8 +3,13 @@
 # @ingroup Methods-Missions
 
 from .converge_root import converge_root
+from .converge_sparse import converge_sparse
+from .converge_ensemble import converge_ensemble, evaluate_ensemble
 from .expand_state  import expand_state
 from .optimize      import converge_opt
+from .optimize_sparse import converge_opt_sparse
+from .refine_control_points import refine_control_points
+from .warm_start    import seed_unknowns, record_unknowns
 
 from . import Common
 from . import Cruise
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +14,9 @@ import numpy as np
 
 from SUAVE.Core.Arrays import array_type
 
+from .warm_start import seed_unknowns, record_unknowns, record_jacobian, chord_steps
+from .refine_control_points import refine_control_points, adapt_control_points
+
 # ----------------------------------------------------------------------
 #  Converge Root
 # ----------------------------------------------------------------------
@@ -22,7 +26,8 @@ def converge_root(segment):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
 
     Assumptions:
-    N/A
+    A segment seeded from the warm start store first takes steps with the Jacobian stored with it,
+    and is only passed to the solver when those do not converge.
 
     Source:
     N/A
@@ -31,23 +36,55 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]
+    state.numerics.warm_start          [Warm_Start]
+    state.numerics.adaptive_control_points [boolean]
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    state.numerics.number_control_points [int]
 
     Properties Used:
     N/A
     """       
     
+    # adaptive segments start from the points their last solution needed
+    if adapt_control_points(segment):
+        segment.process.initialize(segment)
+    
+    # start from the nearest converged solution, which leaves the segment evaluated there
+    seeded = seed_unknowns(segment)
+    
+    # a block sparse Jacobian uses its own Newton solver
+    if segment.state.numerics.solver_jacobian == 'block_sparse':
+        from .converge_sparse import converge_sparse
+        converge_sparse(segment, seeded)
+        record_unknowns(segment)
+        refine_control_points(segment)
+        return
+    
     unknowns = segment.state.unknowns.pack_array()
+    function = iterate
+    
+    # a seeded start takes its first steps with the Jacobian stored with the solution
+    if seeded:
+        residuals = segment.state.residuals.pack_array()
+        unknowns, residuals, converged = chord_steps(segment, unknowns, residuals)
+        if converged:
+            segment.state.numerics.converged = True
+            segment.converged = True
+            record_unknowns(segment)
+            refine_control_points(segment)
+            return
+        function = reuse_residuals(unknowns, residuals)
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
+    unknowns,infodict,ier,msg = root_finder( function,
                                          unknowns,
                                          args = segment,
                                          xtol = segment.state.numerics.tolerance_solution,
@@ -62,6 +99,12 @@ def converge_root(segment):
     else:
         segment.state.numerics.converged = True
         segment.converged = True
+        
+    record_unknowns(segment)
+    record_jacobian(segment, infodict)
+    
+    # solve again with more points where the solution is not resolved
+    refine_control_points(segment)
                             
     return
     
@@ -99,4 +142,36 @@ def iterate(unknowns, segment):
     
     residuals = segment.state.residuals.pack_array()
         
-    return residuals 
\ No newline at end of file
+    return residuals 
+
+## @ingroup Methods-Missions-Segments
+def reuse_residuals(unknowns, residuals):
+    """Wraps iterate so the unknowns the residuals are known for are not evaluated again. The solver
+    evaluates its starting point first, which the seed has already done.
+
+    Assumptions:
+    The residuals are those of the unknowns. They are only reused until other unknowns are evaluated.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    residuals                     [array]
+
+    Outputs:
+    function                      [function] function(unknowns, segment)
+
+    Properties Used:
+    N/A
+    """
+
+    last = [unknowns.copy(), residuals]
+
+    def function(x, segment):
+        if last[0] is not None and np.array_equal(x, last[0]):
+            return last[1].copy()
+        last[0] = None
+        return iterate(x, segment)
+
+    return function
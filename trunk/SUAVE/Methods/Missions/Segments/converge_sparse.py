@@ -0,0 +1,458 @@
+## @ingroup Methods-Missions-Segments
+# converge_sparse.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import copy
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+
+# ----------------------------------------------------------------------
+#  Converge Sparse
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def converge_sparse(segment, evaluated=False):
+    """Solves the mission with a damped Newton method using a block sparse Jacobian. The Jacobian
+    is built by colored finite differences, where columns that do not share any residual are
+    perturbed together in a single evaluation of the mission.
+
+    Assumptions:
+    The residuals of a sub segment depend only on its own unknowns and on the initials passed
+    from the sub segment before it. The coupling through the initials is held fixed while the
+    Jacobian is built, so the Jacobian is block diagonal. The full coupled residuals are always
+    used to accept a step, so the converged solution is unaffected.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian
+    Matrices", IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    segment                            [Data]
+    evaluated                          [boolean] the segment was just evaluated at its unknowns
+    state.numerics.tolerance_solution  [Unitless]
+    state.numerics.max_evaluations     [Unitless]
+
+    Outputs:
+    state.unknowns                     [Any]
+    segment.state.numerics.converged   [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    from .converge_root import iterate
+
+    numerics  = segment.state.numerics
+    unknowns  = segment.state.unknowns.pack_array()
+    tolerance = numerics.tolerance_solution
+    max_evals = int(numerics.max_evaluations)
+    if max_evals <= 0:
+        max_evals = 200*(len(unknowns)+1)
+
+    # find the structure once, it does not change while converging
+    sparsity = block_sparsity_pattern(segment)
+    groups   = color_columns(sparsity)
+
+    # a seeded segment was just evaluated at its unknowns
+    if evaluated:
+        residuals = segment.state.residuals.pack_array()
+    else:
+        residuals = iterate(unknowns, segment)
+    last_x    = unknowns
+    n_evals   = 1
+    converged = False
+    msg       = 'The number of calls to function has reached maxfev = ' + str(max_evals) + '.'
+
+    jacobian  = None
+    while n_evals < max_evals:
+
+        # build the Jacobian with the initials held fixed, it is reused while Newton converges quickly
+        fresh = jacobian is None
+        if fresh:
+            if n_evals + len(groups) >= max_evals:
+                break
+            frozen   = freeze_initials(segment)
+            jacobian = colored_jacobian(iterate, unknowns, residuals, segment, sparsity, groups)
+            restore_initials(segment, frozen)
+            n_evals += len(groups)
+
+        step = newton_step(jacobian, residuals)
+        if not np.all(np.isfinite(step)):
+            msg = 'The Jacobian is singular.'
+            break
+
+        # a start at the solution can not reduce the residual any further
+        if np.linalg.norm(step) <= tolerance*(tolerance + np.linalg.norm(unknowns)):
+            converged = True
+            break
+
+        # backtrack along the Newton direction until the residual drops
+        norm_0   = np.linalg.norm(residuals)
+        alpha    = 1.
+        accepted = False
+        while n_evals < max_evals and alpha > 1e-3:
+            trial    = unknowns + alpha*step
+            trial_r  = iterate(trial, segment)
+            last_x   = trial
+            n_evals += 1
+            if np.all(np.isfinite(trial_r)) and np.linalg.norm(trial_r) < (1. - 1e-4*alpha)*norm_0:
+                accepted = True
+                break
+            alpha = alpha/2.
+
+        if not accepted:
+            if not fresh:
+                jacobian = None
+                continue
+            msg = 'The iteration is not making good progress.'
+            break
+
+        # a slow reduction means the Jacobian is out of date
+        if np.linalg.norm(trial_r) > 0.5*norm_0:
+            jacobian = None
+
+        unknowns  = trial
+        residuals = trial_r
+
+        if np.linalg.norm(alpha*step) <= tolerance*(tolerance + np.linalg.norm(unknowns)):
+            converged = True
+            break
+
+    # leave the state at the last accepted point
+    if last_x is not unknowns:
+        iterate(unknowns, segment)
+
+    if not converged:
+        print("Segment did not converge. Segment Tag: " + segment.tag)
+        print("Error Message:\n" + msg)
+        segment.state.numerics.converged = False
+        segment.converged = False
+    else:
+        segment.state.numerics.converged = True
+        segment.converged = True
+
+    return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def block_sparsity_pattern(segment):
+    """Finds which packed residuals belong to which packed unknowns. Each sub segment makes one dense
+    block. Unknowns of the top segment itself, such as a cruise distance, may change every residual.
+    A segment without sub segments is a single dense block.
+
+    Assumptions:
+    The merged unknowns and residuals are stacked in the same way as Segment.merged()
+    Residuals of the top segment are only linked to the unknowns of the top segment
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.segments                   [Data]
+    state.unknowns                     [Data]
+    state.residuals                    [Data]
+
+    Outputs:
+    sparsity                           [scipy.sparse.csc_matrix]
+
+    Properties Used:
+    N/A
+    """
+
+    n_unknowns  = len(segment.state.unknowns.pack_array())
+    n_residuals = len(segment.state.residuals.pack_array())
+
+    dense = scipy.sparse.csc_matrix(np.ones([n_residuals,n_unknowns]))
+
+    if not 'segments' in segment or len(segment.segments) < 2:
+        return dense
+
+    unknown_ids  = segment_ids(segment,'unknowns')
+    residual_ids = segment_ids(segment,'residuals')
+
+    # fall back to a dense pattern if the layout can't be matched
+    if len(unknown_ids) != n_unknowns or len(residual_ids) != n_residuals:
+        return dense
+
+    pattern = residual_ids[:,None] == unknown_ids[None,:]
+    pattern[:,unknown_ids == -1] = True
+
+    sparsity = scipy.sparse.csc_matrix(pattern.astype(float))
+
+    return sparsity
+
+## @ingroup Methods-Missions-Segments
+def segment_ids(segment,key):
+    """Labels every entry of a packed state vector with the index of the sub segment it came from.
+    Entries that belong to the top segment itself are labelled -1.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.segments                   [Data]
+    key                                [string]
+
+    Outputs:
+    ids                                [array]
+
+    Properties Used:
+    N/A
+    """
+
+    merged = None
+    for i, sub_segment in enumerate(segment.segments):
+        marker = sub_segment.state[key].do_recursive(lambda a,i=i: mark_array(a,i))
+        if merged is None:
+            merged = marker
+        else:
+            merged = merged.do_recursive(stack_array,marker)
+
+    # keep the key order of the top segment
+    ids = segment.state[key].do_recursive(lambda a: mark_array(a,-1))
+    ids.update(merged)
+
+    return ids.pack_array()
+
+## @ingroup Methods-Missions-Segments
+def color_columns(sparsity):
+    """Groups the columns of a sparse Jacobian so that no two columns in a group share a row. The
+    columns in one group can be found with a single function evaluation.
+
+    Assumptions:
+    Greedy coloring in the natural column order
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian
+    Matrices", IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    sparsity                           [scipy.sparse matrix]
+
+    Outputs:
+    groups                             [list of arrays]
+
+    Properties Used:
+    N/A
+    """
+
+    csc = scipy.sparse.csc_matrix(sparsity)
+    csr = scipy.sparse.csr_matrix(sparsity)
+
+    n_cols = csc.shape[1]
+    colors = -np.ones(n_cols,dtype=int)
+
+    for j in range(n_cols):
+        rows       = csc.indices[csc.indptr[j]:csc.indptr[j+1]]
+        neighbours = np.concatenate([csr.indices[csr.indptr[r]:csr.indptr[r+1]] for r in rows] + [np.array([],dtype=int)])
+        used       = np.unique(colors[neighbours])
+        color      = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+
+    groups = [np.where(colors == c)[0] for c in range(colors.max()+1)] if n_cols else []
+
+    return groups
+
+## @ingroup Methods-Missions-Segments
+def colored_jacobian(function, unknowns, residuals, segment, sparsity, groups):
+    """Builds a sparse Jacobian by forward finite differences, one function evaluation per group.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    function                           [function]
+    unknowns                           [array]
+    residuals                          [array]
+    segment                            [Data]
+    sparsity                           [scipy.sparse matrix]
+    groups                             [list of arrays]
+
+    Outputs:
+    jacobian                           [scipy.sparse.csc_matrix]
+
+    Properties Used:
+    N/A
+    """
+
+    jacobian = scipy.sparse.csc_matrix(sparsity,dtype=float,copy=True)
+    indptr   = jacobian.indptr
+    indices  = jacobian.indices
+
+    h = np.sqrt(np.finfo(float).eps)*np.maximum(np.abs(unknowns),1.)
+
+    for group in groups:
+        x         = unknowns.copy()
+        x[group] += h[group]
+        dr        = function(x, segment) - residuals
+        for j in group:
+            rows = indices[indptr[j]:indptr[j+1]]
+            jacobian.data[indptr[j]:indptr[j+1]] = dr[rows]/h[j]
+
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def newton_step(jacobian, residuals):
+    """Solves the sparse Newton system, falling back to least squares if the Jacobian is singular.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    jacobian                           [scipy.sparse matrix]
+    residuals                          [array]
+
+    Outputs:
+    step                               [array]
+
+    Properties Used:
+    N/A
+    """
+
+    try:
+        step = -scipy.sparse.linalg.splu(scipy.sparse.csc_matrix(jacobian)).solve(residuals)
+    except (RuntimeError, ValueError):
+        step = -scipy.sparse.linalg.lsqr(jacobian, residuals)[0]
+
+    return step
+
+## @ingroup Methods-Missions-Segments
+def freeze_initials(segment):
+    """Replaces the initials of every sub segment with a copy, so that perturbing one sub segment
+    does not change the ones after it.
+
+    Assumptions:
+    Sub segments only read initials.conditions
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.segments                   [Data]
+
+    Outputs:
+    originals                          [list]
+
+    Properties Used:
+    N/A
+    """
+
+    originals = []
+    if not 'segments' in segment:
+        return originals
+
+    for sub_segment in segment.segments:
+        initials = sub_segment.state.initials
+        originals.append(initials)
+        if initials:
+            frozen = Data()
+            frozen.conditions = copy.deepcopy(initials.conditions)
+            sub_segment.state.initials = frozen
+
+    return originals
+
+## @ingroup Methods-Missions-Segments
+def restore_initials(segment, originals):
+    """Puts back the initials replaced by freeze_initials.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.segments                   [Data]
+    originals                          [list]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    if not 'segments' in segment:
+        return
+
+    for sub_segment, initials in zip(segment.segments, originals):
+        sub_segment.state.initials = initials
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def mark_array(A,i):
+    """Returns an array the shape of A filled with i, or i for a scalar, used to label a state.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    A                                  [array]
+    i                                  [int]
+
+    Outputs:
+    array or float
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(A,array_type):
+        return np.full(np.shape(A),i,dtype=float)
+    elif isinstance(A,(int,float)) and not isinstance(A,bool):
+        return float(i)
+    else:
+        return None
+
+## @ingroup Methods-Missions-Segments
+def stack_array(A,B=None):
+    """A stacking operation to put together labelled data structures, matching Segment.merged()
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    A                                  [array]
+    B                                  [array]
+
+    Outputs:
+    array
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(A,array_type) and isinstance(B,array_type):
+        return np.vstack([A,B])
+    else:
+        return None
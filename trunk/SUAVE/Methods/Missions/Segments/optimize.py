@@ -5,6 +5,7 @@
 # Modified: Jun 2017, E. Botero
 #           Mar 2020, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,8 @@ import numpy as np
 from SUAVE.Core.Arrays import array_type
 from SUAVE.Core import Units
 
+from .warm_start import seed_unknowns, record_unknowns
+
 # ----------------------------------------------------------------------
 #  Converge Root
 # ----------------------------------------------------------------------
@@ -34,6 +37,8 @@ def converge_opt(segment):
     state.unknowns                     [Data]
     segment                            [Data]
     segment.algorithm                  [string]
+    state.numerics.solver_jacobian     [string]
+    state.numerics.warm_start          [Warm_Start]
 
     Outputs:
     state.unknowns                     [Any]
@@ -42,6 +47,16 @@ def converge_opt(segment):
     N/A
     """     
     
+    # start from the nearest converged solution
+    seed_unknowns(segment)
+    
+    # a sparse gradient evaluates the segment once per point for the objective and all constraints
+    if segment.state.numerics.solver_jacobian == 'block_sparse' and segment.algorithm == 'SLSQP':
+        from .optimize_sparse import converge_opt_sparse
+        converge_opt_sparse(segment)
+        record_unknowns(segment)
+        return
+    
     # pack up the array
     unknowns = segment.state.unknowns.pack_array()
     
@@ -122,7 +137,7 @@ def get_objective(unknowns, segment):
     if not np.all(segment.state.inputs_last == segment.state.unknowns):       
         segment.process.iterate(segment)
         
-    objective = segment.objective_value
+    objective = segment.state.objective_value
     
     return objective
 
@@ -166,7 +181,7 @@ def make_bnds(unknowns, segment):
         Restricts flight path angle from 0 to pi/2 radians
         
         Inputs:
-        none
+        state.unknowns      [Data]
             
         Outputs:
         bnds
@@ -189,7 +204,9 @@ def make_bnds(unknowns, segment):
     elif segment.air_speed_end is not None:    
         vels      = ones_m2*(0.,2000.)
     
-    bnds = np.vstack([vels,throttle_bnds,gamma,body_angle])
+    # in the order the unknowns are packed, the tag is not packed
+    bounds = dict(throttle=throttle_bnds,body_angle=body_angle,flight_path_angle=gamma,velocity=vels)
+    bnds   = np.vstack([bounds[key] for key in segment.state.unknowns.keys() if key in bounds])
     
     bnds = list(map(tuple, bnds))
     
@@ -220,19 +237,50 @@ def get_ieconstraints(unknowns, segment):
     else:
         segment.state.unknowns = unknowns
         
-    if not np.all(state.inputs_last == segment.state.unknowns):
+    if not np.all(segment.state.inputs_last == segment.state.unknowns):
         segment.process.iterate(segment)
     
+    constraints = inequality_constraints(segment)
+    
+    return constraints
+
+## @ingroup Methods-Missions-Segments
+def inequality_constraints(segment):
+    """ Finds the inequality constraint values of the segment as it was last evaluated
+    
+        Assumptions:
+        Time only goes forward
+        CL is less than a specified limit
+        All altitudes are greater than zero
+        
+        Inputs:
+        state.conditions                    [Data]
+        segment.lift_coefficient_limit      [Unitless] or segment.CL_limit
+        segment.altitude_end                [meters]
+            
+        Outputs:
+        constraints          [array]
+
+        Properties Used:
+        N/A
+                                
+    """      
+    
+    conditions = segment.state.conditions
+    
     # Time goes forward, not backward
-    t_final = segment.state.conditions.frames.inertial.time[-1,0]
-    time_con = (segment.state.conditions.frames.inertial.time[1:,0] - segment.state.conditions.frames.inertial.time[0:-1,0])/t_final
+    t_final  = conditions.frames.inertial.time[-1,0]
+    time_con = (conditions.frames.inertial.time[1:,0] - conditions.frames.inertial.time[0:-1,0])/t_final
     
     # Less than a specified CL limit
-    lift_coefficient_limit = segment.lift_coefficient_limit 
-    CL_con = (lift_coefficient_limit  - segment.state.conditions.aerodynamics.lift_coefficient[:,0])/lift_coefficient_limit
+    if 'lift_coefficient_limit' in segment:
+        lift_coefficient_limit = segment.lift_coefficient_limit 
+    else:
+        lift_coefficient_limit = segment.CL_limit
+    CL_con = (lift_coefficient_limit  - conditions.aerodynamics.lift_coefficient[:,0])/lift_coefficient_limit
     
     # Altitudes are greater than 0
-    alt_con = segment.state.conditions.freestream.altitude[:,0]/segment.altitude_end
+    alt_con = conditions.freestream.altitude[:,0]/segment.altitude_end
     
     constraints = np.concatenate((time_con,CL_con,alt_con))
     
@@ -265,24 +313,11 @@ def get_problem_pyopt(unknowns, segment):
     else:
         segment.state.unknowns = unknowns
         
-    if not np.all(state.inputs_last == segment.state.unknowns):
+    if not np.all(segment.state.inputs_last == segment.state.unknowns):
         segment.process.iterate(segment)
         
-    obj      = segment.state.objective_value
-    
-    # Time goes forward, not backward
-    t_final  = segment.state.conditions.frames.inertial.time[-1,0]
-    time_con = (segment.state.conditions.frames.inertial.time[1:,0] - segment.state.conditions.frames.inertial.time[0:-1,0])/t_final
-    
-    # Less than a specified CL limit
-    lift_coefficient_limit = segment.lift_coefficient_limit 
-    CL_con   = (lift_coefficient_limit  - state.conditions.aerodynamics.lift_coefficient[:,0])/lift_coefficient_limit
-    
-    # Altitudes are greater than 0
-    alt_con = segment.state.conditions.freestream.altitude[:,0]/segment.altitude_end
-    
     # Put the equality and inequality constraints together
-    constraints = np.concatenate((segment.state.constraint_values,time_con,CL_con,alt_con))
+    constraints = np.concatenate((segment.state.constraint_values,inequality_constraints(segment)))
     
     obj   = segment.state.objective_value
     const = constraints.tolist()
@@ -0,0 +1,220 @@
+## @ingroup Methods-Missions-Segments
+# optimize_sparse.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.optimize as opt
+import scipy.sparse
+
+from SUAVE.Core import Data
+
+from .optimize        import make_bnds, inequality_constraints
+from .converge_sparse import color_columns, colored_jacobian
+
+# ----------------------------------------------------------------------
+#  Converge Optimization Sparse
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def converge_opt_sparse(segment):
+    """Interfaces an optimized segment to SLSQP, evaluating the segment once per point for the
+    objective and both sets of constraints. The gradients are found together by colored finite
+    differences, where unknowns that do not change any of the same outputs are perturbed together in
+    a single evaluation of the segment.
+
+    Assumptions:
+    The sparsity of the Jacobian holds for the whole optimization. It is found from the Jacobians at
+    the first point and at a point near it, outputs that are exactly unchanged by an unknown at both
+    are taken as independent of it.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian
+    Matrices", IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    state.unknowns                     [Data]
+    segment                            [Data]
+
+    Outputs:
+    state.unknowns                     [Any]
+    segment.state.numerics.converged   [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    # pack up the array
+    unknowns = segment.state.unknowns.pack_array()
+
+    # Setup the bnds of the problem
+    bnds = make_bnds(unknowns, segment)
+
+    # values and gradients are shared between the callbacks
+    problem = Data()
+    problem.unknowns          = None
+    problem.outputs           = None
+    problem.jacobian_unknowns = None
+    problem.jacobian          = None
+    problem.sparsity          = None
+    problem.groups            = None
+    problem.state_unknowns    = None
+
+    # the number of equality constraints is known once the segment has run
+    problem_values(unknowns, segment, problem)
+    n_eq = len(np.atleast_1d(segment.state.constraint_values))
+
+    # SLSQP may work on the arrays it is given, so the stored ones are copied
+    obj     = lambda x: problem_values(x, segment, problem)[0]
+    econ    = lambda x: problem_values(x, segment, problem)[1:n_eq+1].copy()
+    iecon   = lambda x: problem_values(x, segment, problem)[n_eq+1:].copy()
+    d_obj   = lambda x: problem_jacobian(x, segment, problem)[0].copy()
+    d_econ  = lambda x: problem_jacobian(x, segment, problem)[1:n_eq+1].copy()
+    d_iecon = lambda x: problem_jacobian(x, segment, problem)[n_eq+1:].copy()
+
+    unknowns, fx, its, imode, msg = opt.fmin_slsqp(obj,unknowns,f_eqcons=econ,f_ieqcons=iecon,bounds=bnds,
+                                                   fprime=d_obj,fprime_eqcons=d_econ,fprime_ieqcons=d_iecon,
+                                                   iter=2000,full_output=1,iprint=0)
+
+    # leave the state at the solution
+    if not np.array_equal(problem.state_unknowns, unknowns):
+        evaluate_problem(unknowns, segment, problem)
+
+    if imode != 0:
+        print("Segment did not converge. Segment Tag: " + segment.tag)
+        print("Error Message:\n" + msg)
+        segment.state.numerics.converged = False
+        segment.converged = False
+    else:
+        segment.state.numerics.converged = True
+        segment.converged = True
+
+    return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def evaluate_problem(unknowns, segment, problem):
+    """Runs the segment and stacks the objective, the equality and the inequality constraints
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                           [array]
+    segment                            [Data]
+    problem                            [Data]
+
+    Outputs:
+    values                             [array]
+    problem.state_unknowns             [array]
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns = np.array(unknowns,dtype=float)
+
+    segment.state.unknowns.unpack_array(unknowns.copy())
+    segment.process.iterate(segment)
+    problem.state_unknowns = unknowns
+
+    objective   = np.atleast_1d(np.squeeze(segment.state.objective_value)).astype(float)
+    econstraint = np.atleast_1d(segment.state.constraint_values).astype(float)
+    iconstraint = inequality_constraints(segment)
+
+    values = np.concatenate((objective,econstraint,iconstraint))
+
+    return values
+
+## @ingroup Methods-Missions-Segments
+def problem_values(unknowns, segment, problem):
+    """Returns the stacked objective and constraints, only running the segment for a new point
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                           [array]
+    segment                            [Data]
+    problem.unknowns                   [array]
+    problem.outputs                    [array]
+
+    Outputs:
+    values                             [array]
+
+    Properties Used:
+    N/A
+    """
+
+    if not np.array_equal(problem.unknowns, unknowns):
+        problem.outputs  = evaluate_problem(unknowns, segment, problem)
+        problem.unknowns = np.array(unknowns,dtype=float)
+
+    return problem.outputs
+
+## @ingroup Methods-Missions-Segments
+def problem_jacobian(unknowns, segment, problem):
+    """Returns the Jacobian of the stacked objective and constraints, only building it for a new
+    point. The first Jacobian is built one unknown at a time and, with one more at a point near it,
+    sets the sparsity used afterwards. The second point keeps entries that happen to vanish at the
+    first one, such as those multiplying a difference between equal unknowns.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                           [array]
+    segment                            [Data]
+    problem.jacobian_unknowns          [array]
+    problem.jacobian                   [array]
+    problem.sparsity                   [scipy.sparse.csc_matrix]
+    problem.groups                     [list of arrays]
+
+    Outputs:
+    jacobian                           [array]
+
+    Properties Used:
+    N/A
+    """
+
+    if np.array_equal(problem.jacobian_unknowns, unknowns):
+        return problem.jacobian
+
+    unknowns = np.array(unknowns,dtype=float)
+    values   = problem_values(unknowns, segment, problem)
+    function = lambda x, segment: evaluate_problem(x, segment, problem)
+
+    if problem.sparsity is None:
+        dense    = scipy.sparse.csc_matrix(np.ones([len(values),len(unknowns)]))
+        columns  = [np.array([j]) for j in range(len(unknowns))]
+        jacobian = colored_jacobian(function, unknowns, values, segment, dense, columns).toarray()
+
+        near     = unknowns + 1e-3*np.maximum(np.abs(unknowns),1.)*np.random.RandomState(0).uniform(-1.,1.,len(unknowns))
+        near_jac = colored_jacobian(function, near, function(near, segment), segment, dense, columns).toarray()
+
+        problem.sparsity = scipy.sparse.csc_matrix(((jacobian != 0.) | (near_jac != 0.)).astype(float))
+        problem.groups   = color_columns(problem.sparsity)
+    else:
+        jacobian = colored_jacobian(function, unknowns, values, segment, problem.sparsity, problem.groups).toarray()
+
+    problem.jacobian_unknowns = unknowns
+    problem.jacobian          = jacobian
+
+    return jacobian
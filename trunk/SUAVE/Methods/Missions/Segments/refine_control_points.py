@@ -0,0 +1,321 @@
+## @ingroup Methods-Missions-Segments
+# refine_control_points.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import array_type
+
+from .warm_start import record_segment, merged_sub_segments
+
+# ----------------------------------------------------------------------
+#  Refine Control Points
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def refine_control_points(segment):
+    """Adapts the number of control points of the segments to how well their solution is resolved. A
+    converged segment with adaptive control points is checked by how fast the Chebyshev coefficients of
+    its unknowns, mass rate and velocity decay. The segments that need more points get them and are
+    solved again, starting from the coarse solution interpolated to the new points. This is repeated
+    until every segment is resolved or has the maximum number of points. The segments that are resolved
+    with points to spare keep their solution, and the next evaluation starts them from fewer points.
+
+    Assumptions:
+    The segments solved together with this one are refined with it. A warm start store is set up for
+    the solve when the segment does not have one.
+
+    The number of points at most doubles in each pass and is never more than max_control_points, so a
+    solution that is not resolved with the maximum is kept as it is. Points are only removed for the
+    next evaluation, never fewer than the number the segment started with, which is kept in
+    initial_control_points. A solution with a kink, such as a throttle reaching its limit, does not
+    decay geometrically and may be given the maximum. To start over from another number of points,
+    set number_control_points and clear initial_control_points and needed_control_points.
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013
+
+    Inputs:
+    state.numerics.converged               [boolean]
+    state.numerics.warm_start              [Warm_Start]
+    state.numerics.adaptive_control_points [boolean]
+    state.numerics.number_control_points   [int]
+    state.numerics.initial_control_points  [int]
+
+    Outputs:
+    state.numerics.number_control_points   [int]
+    state.numerics.initial_control_points  [int]
+    state.numerics.needed_control_points   [int]
+    refined                                [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics = segment.state.numerics
+    if numerics.converged is not True:
+        return False
+
+    adaptive = []
+    for sub_segment in solved_segments(segment):
+        sub_numerics = sub_segment.state.numerics
+        if not sub_numerics.adaptive_control_points:
+            continue
+        if sub_numerics.initial_control_points is None:
+            sub_numerics.initial_control_points = sub_numerics.number_control_points
+        sub_numerics.needed_control_points = refined_number_control_points(sub_segment)
+        adaptive.append(sub_numerics)
+
+    refined = [sub_numerics for sub_numerics in adaptive \
+               if sub_numerics.needed_control_points > sub_numerics.number_control_points]
+    if not len(refined):
+        return False
+
+    # the resolved segments keep their points until the solve after this one
+    for sub_numerics in adaptive:
+        sub_numerics.needed_control_points = max(sub_numerics.needed_control_points,sub_numerics.number_control_points)
+
+    from .converge_root import converge_root
+
+    # the coarse solution is the starting point
+    store = numerics.warm_start
+    if store is None:
+        from SUAVE.Analyses.Mission.Warm_Start import Warm_Start
+        store = numerics.warm_start = Warm_Start()
+        record_segment(store, segment)
+        temporary = True
+    else:
+        temporary = False
+
+    # the needed points are taken when solving again
+    converge_root(segment)
+
+    if temporary:
+        clear_store(segment, store)
+
+    return True
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def adapt_control_points(segment):
+    """Gives the segments with adaptive control points the number their last solution needed, but not
+    fewer than they started with
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.adaptive_control_points [boolean]
+    state.numerics.initial_control_points  [int]
+    state.numerics.needed_control_points   [int]
+
+    Outputs:
+    state.numerics.number_control_points   [int]
+    adapted                                [boolean] the number of some segment changed
+
+    Properties Used:
+    N/A
+    """
+
+    adapted = False
+    for sub_segment in solved_segments(segment):
+        numerics = sub_segment.state.numerics
+        if not numerics.adaptive_control_points or numerics.needed_control_points is None:
+            continue
+        N = max(numerics.initial_control_points, numerics.needed_control_points)
+        if N != numerics.number_control_points:
+            numerics.number_control_points = N
+            adapted = True
+
+    return adapted
+
+## @ingroup Methods-Missions-Segments
+def refined_number_control_points(segment):
+    """Estimates the number of control points a segment needs. The coefficients are assumed to keep
+    decaying at the rate fitted to them, which gives the points needed to bring the last ones below the
+    tolerance. At most twice the current number of points is asked for at a time, and when the segment
+    is resolved at most half of them are removed, down to the number it started with.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.number_control_points   [int]
+    state.numerics.initial_control_points  [int]
+    state.numerics.tolerance_refinement    [Unitless]
+    state.numerics.max_control_points      [int]
+
+    Outputs:
+    N                                      [int]
+
+    Properties Used:
+    N/A
+    """
+
+    numerics  = segment.state.numerics
+    N         = int(numerics.number_control_points)
+    tolerance = numerics.tolerance_refinement
+
+    if numerics.initial_control_points is None:
+        initial = N
+    else:
+        initial = int(numerics.initial_control_points)
+
+    error, decay = resolution_error(segment)
+
+    if error > 0. and decay < 1.:
+        extra = int(np.ceil(np.log(tolerance/error)/np.log(decay)))
+    elif error > tolerance:
+        extra = N
+    else:
+        extra = 0
+
+    # resolved, fewer points may do
+    if error <= tolerance:
+        return int(min(N, max(N + extra, (N + 1)//2, initial)))
+
+    return int(max(N, min(N + max(extra,2), 2*N, numerics.max_control_points)))
+
+## @ingroup Methods-Missions-Segments
+def resolution_error(segment):
+    """Estimates the relative error of a segment from the Chebyshev coefficients of the polynomials
+    through its unknowns and the integrands of its mass and position. The error of each column is the
+    larger of the last two coefficients over the largest value of the column.
+
+    Assumptions:
+    Columns that are zero everywhere are resolved
+
+    Source:
+    Trefethen, L. N., "Approximation Theory and Approximation Practice", SIAM, 2013
+
+    Inputs:
+    state.numerics.dimensionless.control_points     [Unitless]
+    state.unknowns                                  [Data]
+    state.conditions:
+        weights.vehicle_mass_rate                   [kilograms/second]
+        frames.inertial.velocity_vector             [meters/second]
+
+    Outputs:
+    error                                           [Unitless]
+    decay                                           [Unitless] ratio of successive coefficients
+
+    Properties Used:
+    N/A
+    """
+
+    state = segment.state
+    x     = np.ravel(state.numerics.dimensionless.control_points)
+    N     = len(x)
+    if N < 3:
+        return 0., 0.
+
+    values = [value for value in state.unknowns.values() if isinstance(value,array_type)]
+    for keys in ['weights.vehicle_mass_rate','frames.inertial.velocity_vector']:
+        try:
+            values.append(state.conditions.deep_get(keys))
+        except (KeyError,AttributeError):
+            pass
+
+    error = 0.
+    decay = 0.
+    for value in values:
+        if value.ndim != 2 or value.shape[0] != N:
+            continue
+        coefficients = np.polynomial.chebyshev.chebfit(2.*x - 1., value, N - 1)
+        if coefficients.ndim == 1:
+            coefficients = coefficients[:,None]
+
+        for column, a in zip(value.T, np.abs(coefficients.T)):
+            scale = np.max(np.abs(column))
+            if not scale > 0.:
+                continue
+            column_error = max(a[-1],a[-2])/scale
+            if column_error <= error:
+                continue
+
+            # the geometric rate of decay after the mean
+            k     = np.arange(1,N)
+            slope = np.polyfit(k, np.log(np.maximum(a[1:],1e-16*scale)), 1)[0]
+            error = column_error
+            decay = np.exp(slope)
+
+    return error, decay
+
+## @ingroup Methods-Missions-Segments
+def solved_segments(segment):
+    """Finds the segments whose control points are solved for with this one, the segment itself or
+    the sub segments merged into it
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                                [Data]
+
+    Outputs:
+    segments                               [list]
+
+    Properties Used:
+    N/A
+    """
+
+    sub_segments = merged_sub_segments(segment)
+    if not len(sub_segments):
+        return [segment]
+
+    segments = []
+    for sub_segment in sub_segments:
+        segments.extend(solved_segments(sub_segment))
+
+    return segments
+
+## @ingroup Methods-Missions-Segments
+def clear_store(segment, store):
+    """Removes a warm start store from a segment and its sub segments
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment                                [Data]
+    store                                  [Warm_Start]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    if segment.state.numerics.warm_start is store:
+        segment.state.numerics.warm_start = None
+
+    segments = segment.get('segments')
+    if segments is None:
+        return
+
+    for sub_segment in segments.values():
+        clear_store(sub_segment, store)
+
+    return
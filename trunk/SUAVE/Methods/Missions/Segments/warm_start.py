@@ -0,0 +1,481 @@
+## @ingroup Methods-Missions-Segments
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy.interpolate
+import scipy.linalg
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data
+
+from .Common.Sub_Segments import merge_sub_segment_states
+
+# ----------------------------------------------------------------------
+#  Seed Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def seed_unknowns(segment):
+    """Starts a solve from the nearest converged solution in the warm start store. A stored solution
+    with the same number of control points is copied, otherwise the one with the closest number is
+    interpolated over the dimensionless control points. The sub segments solved together with this
+    segment are seeded as well and merged back in. The first guesses are kept instead if their
+    residuals are smaller than those of the stored solution. The stored solution is evaluated last,
+    so a seeded segment is left evaluated at its unknowns and the solver can start from those
+    residuals. Seeding then costs one evaluation more than a cold start.
+
+    Assumptions:
+    Unknowns that are not sized by the control points are only copied when their size is unchanged.
+    A start closer to the solution saves iterations, and a Jacobian when the solver does not step
+    away from it, so converge_root bounds the first steps of fsolve from a seeded start.
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.warm_start          [Warm_Start]
+
+    Outputs:
+    state.unknowns                     [Data]
+    state.residuals                    [Data] when seeded
+    seeded                             [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    store = segment.state.numerics.warm_start
+    if store is None:
+        return False
+
+    cold = segment.state.unknowns.pack_array()
+    if not seed_segment(store, segment):
+        return False
+    warm = segment.state.unknowns.pack_array()
+
+    # a stored solution of a segment that flies differently can be a worse start
+    if residual_norm(segment, cold) < residual_norm(segment, warm):
+        segment.state.unknowns.unpack_array(cold)
+        return False
+
+    return True
+
+## @ingroup Methods-Missions-Segments
+def record_unknowns(segment):
+    """Stores the unknowns of a converged segment, and of the sub segments solved with it, in the
+    warm start store. A solution replaces the one stored for the same segment tag and number of
+    control points.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.warm_start          [Warm_Start]
+    state.numerics.converged           [boolean]
+    state.unknowns                     [Data]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    store = segment.state.numerics.warm_start
+    if store is None or segment.state.numerics.converged is not True:
+        return
+
+    record_segment(store, segment)
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def record_jacobian(segment, infodict):
+    """Stores the factors of the last Jacobian of fsolve for a converged segment in the warm start
+    store. They replace those stored for the same segment tag and number of unknowns.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.warm_start          [Warm_Start]
+    state.numerics.converged           [boolean]
+    infodict:
+        fjac                           [array] orthogonal factor, the Jacobian is fjac.T r
+        r                              [array] triangular factor, packed by rows
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    store = segment.state.numerics.warm_start
+    if store is None or segment.state.numerics.converged is not True:
+        return
+    if not 'fjac' in infodict or not 'r' in infodict:
+        return
+
+    n = len(infodict['fjac'])
+    r = np.zeros((n,n))
+    r[np.triu_indices(n)] = infodict['r']
+
+    jacobian = Data()
+    jacobian.number_of_unknowns = n
+    jacobian.q                  = np.array(infodict['fjac'])
+    jacobian.r                  = r
+
+    jacobians = [entry for entry in store.jacobians.get(segment.tag,[]) if entry.number_of_unknowns != n]
+    jacobians.append(jacobian)
+    store.jacobians[segment.tag] = jacobians
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def chord_steps(segment, unknowns, residuals, max_steps=10):
+    """Takes Newton steps from a seeded start with the stored factors of the Jacobian of an earlier
+    solve, which costs one evaluation a step instead of a finite difference Jacobian. The steps go on
+    while each one at least halves the residuals.
+
+    Assumptions:
+    The Jacobian changes little between the stored solution and this one. The residuals are those of
+    the unknowns, which the segment is left evaluated at when it is converged. A segment is converged
+    when the next step is as small as fsolve asks for and the residuals are below the residual
+    tolerance.
+
+    Source:
+    Kelley, C. T., "Solving Nonlinear Equations with Newton's Method", SIAM, 2003
+
+    Inputs:
+    unknowns                           [array]
+    residuals                          [array]
+    state.numerics.warm_start          [Warm_Start]
+    state.numerics.tolerance_solution  [Unitless]
+    state.numerics.tolerance_residual  [Unitless]
+
+    Outputs:
+    unknowns                           [array]
+    residuals                          [array]
+    converged                          [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    from .converge_root import iterate
+
+    numerics = segment.state.numerics
+    store    = numerics.warm_start
+    if store is None:
+        return unknowns, residuals, False
+
+    jacobians = [entry for entry in store.jacobians.get(segment.tag,[]) \
+                 if entry.number_of_unknowns == len(unknowns)]
+    if not len(jacobians):
+        return unknowns, residuals, False
+    q = jacobians[0].q
+    r = jacobians[0].r
+
+    tolerance = numerics.tolerance_solution
+    for step_number in range(max_steps):
+        step = -scipy.linalg.solve_triangular(r, q.dot(residuals))
+        if not np.all(np.isfinite(step)):
+            break
+
+        # the start or the last step may already be the solution
+        if np.linalg.norm(step) <= tolerance*(tolerance + np.linalg.norm(unknowns)) and \
+           np.linalg.norm(residuals) <= numerics.tolerance_residual:
+            return unknowns, residuals, True
+
+        trial   = unknowns + step
+        trial_r = iterate(trial, segment)
+        if not np.linalg.norm(trial_r) < 0.5*np.linalg.norm(residuals):
+            break
+
+        unknowns  = trial
+        residuals = trial_r
+
+    return unknowns, residuals, False
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def seed_segment(store, segment):
+    """Seeds a segment and the sub segments merged into it from the store
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    store                              [Warm_Start]
+    segment                            [Data]
+
+    Outputs:
+    seeded                             [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    seeded = False
+    for sub_segment in merged_sub_segments(segment):
+        seeded = seed_segment(store, sub_segment) or seeded
+    if seeded:
+        merge_sub_segment_states(segment)
+
+    numerics = segment.state.numerics
+    solution = nearest_solution(store, segment.tag, numerics.number_control_points)
+    if solution is None:
+        return seeded
+
+    if solution.number_control_points == numerics.number_control_points:
+        interpolate = None
+    else:
+        # sub segments solved together are only initialized once they are iterated
+        x = numerics.dimensionless.control_points
+        if np.size(x) != numerics.number_control_points:
+            x = numerics.discretization_method(numerics.number_control_points,**numerics)[0]
+        interpolate = interpolation(solution.control_points, x, numerics.discretization_method)
+
+    return seed_arrays(solution.unknowns, segment.state.unknowns, interpolate) or seeded
+
+## @ingroup Methods-Missions-Segments
+def record_segment(store, segment):
+    """Records a segment and the sub segments merged into it in the store. A segment only keeps the
+    unknowns that are not merged from its sub segments.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    store                              [Warm_Start]
+    segment                            [Data]
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    merged_keys = []
+    for sub_segment in merged_sub_segments(segment):
+        record_segment(store, sub_segment)
+        merged_keys.extend(sub_segment.state.unknowns.keys())
+
+    unknowns = Data()
+    for key, value in segment.state.unknowns.items():
+        if not key in merged_keys:
+            unknowns[key] = deepcopy(value)
+    if not len(unknowns):
+        return
+
+    numerics = segment.state.numerics
+
+    solution = Data()
+    solution.number_control_points = numerics.number_control_points
+    solution.control_points        = np.array(numerics.dimensionless.control_points)
+    solution.unknowns              = unknowns
+
+    solutions = [entry for entry in store.solutions.get(segment.tag,[]) \
+                 if entry.number_control_points != solution.number_control_points]
+    solutions.append(solution)
+    store.solutions[segment.tag] = solutions
+
+    return
+
+## @ingroup Methods-Missions-Segments
+def nearest_solution(store, tag, number_control_points):
+    """Finds the stored solution of a segment with the closest number of control points, preferring
+    the finer one of two equally close
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    store                              [Warm_Start]
+    tag                                [string]
+    number_control_points              [int]
+
+    Outputs:
+    solution                           [Data] or None if nothing is stored
+
+    Properties Used:
+    N/A
+    """
+
+    solutions = store.solutions.get(tag,[])
+    if not len(solutions):
+        return None
+
+    distance = lambda entry: (abs(entry.number_control_points - number_control_points),-entry.number_control_points)
+
+    return min(solutions, key=distance)
+
+## @ingroup Methods-Missions-Segments
+def residual_norm(segment, unknowns):
+    """Evaluates the size of the residuals of a segment for a set of unknowns
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                           [array]
+    segment.process.iterate            [Data]
+
+    Outputs:
+    norm                               [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    segment.state.unknowns.unpack_array(unknowns)
+    segment.process.iterate(segment)
+
+    return np.linalg.norm(segment.state.residuals.pack_array())
+
+## @ingroup Methods-Missions-Segments
+def merged_sub_segments(segment):
+    """Finds the sub segments whose unknowns are stacked into those of the segment, which are solved
+    together with it rather than on their own
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    segment.segments                   [Data]
+    segment.state.unknowns             [Data]
+
+    Outputs:
+    sub_segments                       [list]
+
+    Properties Used:
+    N/A
+    """
+
+    segments = segment.get('segments')
+    if segments is None:
+        return []
+
+    keys = segment.state.unknowns.keys()
+
+    return [sub_segment for sub_segment in segments.values() if len(sub_segment.state.unknowns) \
+            and all([key in keys for key in sub_segment.state.unknowns.keys()])]
+
+## @ingroup Methods-Missions-Segments
+def interpolation(x_stored, x_new, discretization_method):
+    """Builds the interpolation of stored unknowns to new control points. Values on Chebyshev points
+    are interpolated with the polynomial through them, others linearly.
+
+    Assumptions:
+    Both sets of control points span the same dimensionless range
+
+    Source:
+    Berrut, J.-P., and Trefethen, L. N., "Barycentric Lagrange Interpolation", SIAM Review, 2004
+
+    Inputs:
+    x_stored                           [array]
+    x_new                              [array]
+    discretization_method              [function]
+
+    Outputs:
+    interpolate                        [function]
+
+    Properties Used:
+    N/A
+    """
+
+    x_stored = np.ravel(x_stored)
+    x_new    = np.ravel(x_new)
+
+    def interpolate(value):
+        if not isinstance(value,array_type) or value.ndim != 2 or value.shape[0] != len(x_stored):
+            return None
+        if discretization_method is chebyshev_data:
+            return scipy.interpolate.barycentric_interpolate(x_stored, value, x_new, axis=0)
+        return np.column_stack([np.interp(x_new, x_stored, column) for column in value.T])
+
+    return interpolate
+
+## @ingroup Methods-Missions-Segments
+def seed_arrays(stored, current, interpolate):
+    """Copies, or interpolates, the stored unknowns into the current ones where the sizes agree
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    stored                             [Data]
+    current                            [Data]
+    interpolate                        [function] or None if the control points are unchanged
+
+    Outputs:
+    seeded                             [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    seeded = False
+
+    for key, value in stored.items():
+        if not key in current:
+            continue
+        target = current[key]
+        if isinstance(value,dict) and isinstance(target,dict):
+            seeded = seed_arrays(value, target, interpolate) or seeded
+            continue
+        if isinstance(target,float) and np.size(value) == 1:
+            current[key] = float(np.squeeze(value))
+            seeded = True
+            continue
+        if not isinstance(target,array_type):
+            continue
+        value = np.asarray(value,dtype=float)
+        if interpolate is not None and value.shape != target.shape:
+            value = interpolate(value)
+            if value is None:
+                continue
+        if value.shape != target.shape:
+            continue
+        target[...] = value
+        seeded = True
+
+    return seeded
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -26,6 +27,7 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_geometric
 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_counterplot
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_observer_history
 
 import numpy as np
 
@@ -68,6 +70,7 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
                     distance_vector             - distance from the source location to observer
                     angle                       - polar angle from the source to the observer
                     phi                         - azimuthal angle from the source to the observer
+                    each with a column for each observer, or a single observer
 
 
             Outputs: One Third Octave Band SPL [dB]
@@ -79,8 +82,11 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
                 SPL_main_landing_gear            - Sound Pressure Level og the main landing gear
                 SPL_nose_landing_gear            - Sound Pressure Level of the nose landing gear
 
+                EPNL, SENEL and the SPL history of [time steps,frequencies] are returned for each observer as arrays
+                over a first dimension, unless there is a single observer
+
             Assumptions:
-                Correlation based."""
+                Correlation based. All time steps, frequencies and observers are evaluated together."""
 
 
     # ==============================================
@@ -107,7 +113,7 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     nose_wheels    =   config.landing_gear.nose_wheels                           #Number of wheels   
     main_wheels    =   config.landing_gear.main_wheels                           #Number of wheels   
     main_units     =   config.landing_gear.main_units                            #Number of main units   
-    velocity       =   np.float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
+    velocity       =   float(noise_segment.conditions.freestream.velocity[0,0]) #aircraft velocity 
     altitude       =   noise_segment.conditions.freestream.altitude[:,0]           #aircraft altitude
     time           =   noise_segment.conditions.frames.inertial.time[:,0]          #time discretization
 
@@ -122,44 +128,37 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     elif wing.main_wing.control_surfaces.flap.configuration_type == 'triple_slotted':
         slots = 3  
 
-    # Geometric information from the source to observer position
+    # Geometric information from the source to observer position, with a column for each observer
     distance_vector = noise_segment.dist    
     angle = noise_segment.theta 
     phi   = noise_segment.phi
+    single_observer = np.ndim(distance_vector) == 1
     
-    distance_vector = np.interp(noise_time,time,distance_vector)
-    angle = np.interp(noise_time,time,angle)
-    phi   = np.interp(noise_time,time,phi)
+    distance_vector = noise_observer_history(noise_time,time,distance_vector)
+    angle = noise_observer_history(noise_time,time,angle)
+    phi   = noise_observer_history(noise_time,time,phi)
         
     # Number of points on the discretize segment   
     nsteps=len(noise_time)
-    
-    # Preparing matrix for noise calculation
-    sound_speed = np.zeros(nsteps)
-    density     = np.zeros(nsteps)
-    viscosity   = np.zeros(nsteps)
-    temperature = np.zeros(nsteps)
-    M           = np.zeros(nsteps)
-    deltaw      = np.zeros(nsteps)
+    n_observers = len(distance_vector)
     
     # ==============================================
     #         Computing atmospheric conditions
     # ==============================================
     
-    for id in range (0,nsteps):
-        atmo_data = analyses.atmosphere.compute_values(altitude[id])
-        
-        #unpack    
-        sound_speed[id] =    np.float(atmo_data.speed_of_sound)
-        density[id]     =    np.float(atmo_data.density)
-        viscosity[id]   =    np.float(atmo_data.dynamic_viscosity*10.7639) #units converstion - m2 to ft2
-        temperature[id] =    np.float(atmo_data.temperature)
-        
-        #Mach number
-        M[id] = velocity/np.sqrt(1.4*287*temperature[id])
+    # the time steps are the rows and the frequencies the columns
+    atmo_data = analyses.atmosphere.compute_values(altitude)
+    ones      = np.ones((nsteps,1))
+    
+    #unpack    
+    viscosity   =    atmo_data.dynamic_viscosity*10.7639 * ones #units converstion - m2 to ft2
+    temperature =    atmo_data.temperature * ones
     
-        #Wing Turbulent Boundary Layer thickness, ft
-        deltaw[id] = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity[id]))**(-0.2)
+    #Mach number
+    M = velocity/np.sqrt(1.4*287*temperature)
+
+    #Wing Turbulent Boundary Layer thickness, ft
+    deltaw = 0.37*(Sw/bw)*((velocity/Units.ft)*Sw/(bw*viscosity))**(-0.2)
     
 
     #Units conversion - knots to ft/s
@@ -174,75 +173,64 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     velocity_fst = velocity * Units.knot
     
     #number of positions of the aircraft to calculate the noise
-    nrange = len(angle) 
-    i=0
-    SPL_wing_history = np.zeros((nrange,24))
-    SPLht_history    = np.zeros((nrange,24))
-    SPLvt_history    = np.zeros((nrange,24))
-    SPL_flap_history = np.zeros((nrange,24))
-    SPL_slat_history = np.zeros((nrange,24))
-    SPL_main_landing_gear_history = np.zeros((nrange,24))
-    SPL_nose_landing_gear_history = np.zeros((nrange,24))
-    SPL_total_history = np.zeros((nrange,24))
-    
-    #Noise history in dBA
-    SPLt_dBA_history = np.zeros((nrange,24))  
-    SPLt_dBA_max = np.zeros(nrange)    
+    nrange = nsteps
     
-    #START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(0,nrange-1):
-        #Emission angle theta   
-        theta = angle[i] 
-        #Distance from airplane to observer, evaluated at retarded time
-        distance = distance_vector[i]    
-       
-         #Atmospheric attenuation
-        delta_atmo=atmospheric_attenuation(distance)
-
-        #Call each noise source model
-        SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency) - delta_atmo    #Wing Noise
-        SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-        SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw[i],velocity,viscosity[i],M[i],phi[i],theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
- 
-        SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw[i],viscosity[i],M[i],phi[i],theta,distance,frequency) -delta_atmo        #Slat leading edge
- 
-        if (deltaf==0):
-            SPL_flap = np.zeros(24)
-        else:
-            SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M[i],phi[i],theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
- 
-        if gear=='up': #0
-            SPL_main_landing_gear = np.zeros(24)
-            SPL_nose_landing_gear = np.zeros(24)
-        else:
-            SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-            SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M[i],velocity,phi[i],theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-        if main_units>1: #Incoherent summation of each main landing gear unit
-            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
- 
- 
-         #Total Airframe Noise
-        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
-            
-        SPL_total_history[i][:] = SPL_total[:]
-        SPL_wing_history[i][:]  = SPL_wing[:]
-        SPLvt_history[i][:]     = SPLvt[:]
-        SPLht_history[i][:]     = SPLht[:]
-        SPL_flap_history[i][:]  = SPL_flap[:]
-        SPL_slat_history[i][:]  = SPL_slat[:]
-        SPL_nose_landing_gear_history[i][:] = SPL_nose_landing_gear[:]
-        SPL_main_landing_gear_history[i][:] = SPL_main_landing_gear[:]
-        
+    #ALL POSITIONS OF THE AIRCRAFT AND OBSERVERS AT ONCE
+    #Emission angle theta   
+    theta = angle
+    #Distance from airplane to observer, evaluated at retarded time
+    distance = distance_vector
+   
+     #Atmospheric attenuation
+    delta_atmo=atmospheric_attenuation(distance)
+
+    #Call each noise source model
+    SPL_wing = noise_clean_wing(Sw,bw,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency) - delta_atmo    #Wing Noise
+    SPLht    = noise_clean_wing(Sht,bht,0,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
+    SPLvt    = noise_clean_wing(Svt,bvt,0,0,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
+
+    SPL_slat = noise_leading_edge_slat(SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,theta,distance,frequency) -delta_atmo        #Slat leading edge
+
+    if (deltaf==0):
+        SPL_flap = np.zeros(np.shape(SPL_wing))
+    else:
+        SPL_flap = noise_trailing_edge_flap(Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+
+    if gear=='up': #0
+        SPL_main_landing_gear = np.zeros(np.shape(SPL_wing))
+        SPL_nose_landing_gear = np.zeros(np.shape(SPL_wing))
+    else:
+        SPL_main_landing_gear = noise_landing_gear(Dp,Hp,main_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
+        SPL_nose_landing_gear = noise_landing_gear(Dn,Hn,nose_wheels,M,velocity,phi,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
+    if main_units>1: #Incoherent summation of each main landing gear unit
+        SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1)
+
+
+     #Total Airframe Noise
+    SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+         10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
         
-        #Calculation of dBA based on the sound pressure time history
-        SPLt_dBA = dbA_noise(SPL_total)
-        SPLt_dBA_history[i][:] = SPLt_dBA[:]
-        SPLt_dBA_max[i] = max(SPLt_dBA)        
-       
+    SPL_total_history = SPL_total
+    SPL_wing_history  = SPL_wing
+    SPLvt_history     = SPLvt
+    SPLht_history     = SPLht
+    SPL_flap_history  = SPL_flap
+    SPL_slat_history  = SPL_slat
+    SPL_nose_landing_gear_history = SPL_nose_landing_gear
+    SPL_main_landing_gear_history = SPL_main_landing_gear
+    
+    
+    #Calculation of dBA based on the sound pressure time history
+    SPLt_dBA_history = dbA_noise(SPL_total)
+    SPLt_dBA_max = np.max(SPLt_dBA_history,axis=-1)        
+   
+    #The noise at the last position of the aircraft is not evaluated
+    for history in [SPL_total_history,SPL_wing_history,SPLvt_history,SPLht_history,SPL_flap_history,SPL_slat_history, \
+                    SPL_nose_landing_gear_history,SPL_main_landing_gear_history,SPLt_dBA_history,SPLt_dBA_max]:
+        history[:,nrange-1] = 0.
        
    #Calculation of dBA based on the sound pressure time history
-    dbA_total               =       np.max(SPLt_dBA_history)    #(Not used to certification point)
+    dbA_total               =       np.max(SPLt_dBA_history,axis=(1,2))    #(Not used to certification point)
           
    #Calculation of the Perceived Noise Level EPNL based on the sound time history
     PNL_total               =       pnl_noise(SPL_total_history)
@@ -275,18 +263,18 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
     PNLT_slat = PNL_slat+tone_correction_slat
     PNLT_flap = PNL_flap+tone_correction_flap
     
-    #Calculation of the EPNL for each component and total
-    EPNL_total = epnl_noise(PNLT_total)
-    EPNL_wing  = epnl_noise(PNLT_wing)
-    EPNL_ht    = epnl_noise(PNLT_ht)
-    EPNL_vt    = epnl_noise(PNLT_vt)    
-    EPNL_nose_landing_gear = epnl_noise(PNLT_nose_landing_gear)
-    EPNL_main_landing_gear = epnl_noise(PNLT_main_landing_gear)
-    EPNL_slat = epnl_noise(PNLT_slat)
-    EPNL_flap = epnl_noise(PNLT_flap)
+    #Calculation of the EPNL for each component and total, for each observer
+    EPNL_total = np.array([epnl_noise(PNLT) for PNLT in PNLT_total])
+    EPNL_wing  = np.array([epnl_noise(PNLT) for PNLT in PNLT_wing])
+    EPNL_ht    = np.array([epnl_noise(PNLT) for PNLT in PNLT_ht])
+    EPNL_vt    = np.array([epnl_noise(PNLT) for PNLT in PNLT_vt])    
+    EPNL_nose_landing_gear = np.array([epnl_noise(PNLT) for PNLT in PNLT_nose_landing_gear])
+    EPNL_main_landing_gear = np.array([epnl_noise(PNLT) for PNLT in PNLT_main_landing_gear])
+    EPNL_slat = np.array([epnl_noise(PNLT) for PNLT in PNLT_slat])
+    EPNL_flap = np.array([epnl_noise(PNLT) for PNLT in PNLT_flap])
     
     #Calculation of the SENEL total
-    SENEL_total = senel_noise(SPLt_dBA_max)
+    SENEL_total = np.array([senel_noise(dBA_max) for dBA_max in SPLt_dBA_max])
     
     if ioprint:
         # write header of file
@@ -298,51 +286,55 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         fid.write('Reference speed =  ')
         fid.write(str('%2.2f' % (velocity/Units.kts))+'  kts')
         fid.write('\n')
-        fid.write('PNLT history')
-        fid.write('\n')
-        fid.write('time       altitude      Mach    Polar_angle    Azim_angle   distance        wing  	   ht 	        vt 	   flap   	 slat         nose        main         total         dBA')
-        fid.write('\n')
         
-        for id in range (0,nsteps):
-            fid.write(str('%2.2f' % time[id])+'        ')
-            fid.write(str('%2.2f' % altitude[id])+'        ')
-            fid.write(str('%2.2f' % M[id])+'        ')
-            fid.write(str('%2.2f' % (angle[id]*180/np.pi))+'        ')
-            fid.write(str('%2.2f' % (phi[id]*180/np.pi))+'        ')
-            fid.write(str('%2.2f' % distance_vector[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_wing[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_ht[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_vt[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_flap[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_slat[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_nose_landing_gear[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_main_landing_gear[id])+'        ')
-            fid.write(str('%2.2f' % PNLT_total[id])+'        ')
-            fid.write(str('%2.2f' % SPLt_dBA_max[id])+'        ')
+        for k in range (0,n_observers):
+            if not single_observer:
+                fid.write('Observer = ' + str(k) + '\n')
+            fid.write('PNLT history')
             fid.write('\n')
-        fid.write('\n')
-        fid.write('PNLT max =  ')
-        fid.write(str('%2.2f' % (np.max(PNLT_total)))+'  dB')
-        fid.write('\n')
-        fid.write('dBA max =  ')
-        fid.write(str('%2.2f' % (np.max(SPLt_dBA_max)))+'  dBA')        
-        fid.write('\n')
-        fid.write('\n')
-        fid.write('EPNdB')
-        fid.write('\n')
-        fid.write('wing	       ht          vt         flap         slat    	nose        main	total')
-        fid.write('\n')
-        fid.write(str('%2.2f' % EPNL_wing)+'        ')
-        fid.write(str('%2.2f' % EPNL_ht)+'        ')
-        fid.write(str('%2.2f' % EPNL_vt)+'        ')
-        fid.write(str('%2.2f' % EPNL_flap)+'        ')
-        fid.write(str('%2.2f' % EPNL_slat)+'        ')
-        fid.write(str('%2.2f' % EPNL_nose_landing_gear)+'        ')
-        fid.write(str('%2.2f' % EPNL_main_landing_gear)+'        ')
-        fid.write(str('%2.2f' % EPNL_total)+'        ')
-        fid.write('\n')
-        fid.write('SENEL = ')
-        fid.write(str('%2.2f' % SENEL_total)+'        ')       
+            fid.write('time       altitude      Mach    Polar_angle    Azim_angle   distance        wing  	   ht 	        vt 	   flap   	 slat         nose        main         total         dBA')
+            fid.write('\n')
+            
+            for id in range (0,nsteps):
+                fid.write(str('%2.2f' % time[id])+'        ')
+                fid.write(str('%2.2f' % altitude[id])+'        ')
+                fid.write(str('%2.2f' % M[id,0])+'        ')
+                fid.write(str('%2.2f' % (angle[k,id,0]*180/np.pi))+'        ')
+                fid.write(str('%2.2f' % (phi[k,id,0]*180/np.pi))+'        ')
+                fid.write(str('%2.2f' % distance_vector[k,id,0])+'        ')
+                fid.write(str('%2.2f' % PNLT_wing[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_ht[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_vt[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_flap[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_slat[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_nose_landing_gear[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_main_landing_gear[k,id])+'        ')
+                fid.write(str('%2.2f' % PNLT_total[k,id])+'        ')
+                fid.write(str('%2.2f' % SPLt_dBA_max[k,id])+'        ')
+                fid.write('\n')
+            fid.write('\n')
+            fid.write('PNLT max =  ')
+            fid.write(str('%2.2f' % (np.max(PNLT_total[k])))+'  dB')
+            fid.write('\n')
+            fid.write('dBA max =  ')
+            fid.write(str('%2.2f' % (np.max(SPLt_dBA_max[k])))+'  dBA')        
+            fid.write('\n')
+            fid.write('\n')
+            fid.write('EPNdB')
+            fid.write('\n')
+            fid.write('wing	       ht          vt         flap         slat    	nose        main	total')
+            fid.write('\n')
+            fid.write(str('%2.2f' % EPNL_wing[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_ht[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_vt[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_flap[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_slat[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_nose_landing_gear[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_main_landing_gear[k])+'        ')
+            fid.write(str('%2.2f' % EPNL_total[k])+'        ')
+            fid.write('\n')
+            fid.write('SENEL = ')
+            fid.write(str('%2.2f' % SENEL_total[k])+'        ')       
         fid.close 
         
         
@@ -355,20 +347,26 @@ def noise_airframe_Fink(config, analyses, noise_segment,ioprint = 0, filename=0)
         fid.write('Sound Pressure Level for the Total Aircraft Noise')
         fid.write('\n')
         
-        for nid in range (0,nrange):
-            fid.write('Polar angle = ' + str('%2.2f' % (angle[nid]*(180/np.pi))) + '  degrees' + '\n')
-            fid.write('f		total SPL(dB)    total SPL(dBA)' + '\n')
-            for id in range(0,24):
-                fid.write(str((frequency[id])) + '           ')
-                fid.write(str('%3.2f' % SPL_total_history[nid][id]) + '          ')
-                fid.write(str('%3.2f' % SPLt_dBA_history[nid][id]))
+        for k in range (0,n_observers):
+            if not single_observer:
+                fid.write('Observer = ' + str(k) + '\n')
+            for nid in range (0,nrange):
+                fid.write('Polar angle = ' + str('%2.2f' % (angle[k,nid,0]*(180/np.pi))) + '  degrees' + '\n')
+                fid.write('f		total SPL(dB)    total SPL(dBA)' + '\n')
+                for id in range(0,24):
+                    fid.write(str((frequency[id])) + '           ')
+                    fid.write(str('%3.2f' % SPL_total_history[k][nid][id]) + '          ')
+                    fid.write(str('%3.2f' % SPLt_dBA_history[k][nid][id]))
+                    fid.write('\n')
+                fid.write('SPLmax (dB) =  ')
+                fid.write(str('%3.2f' % (np.max(SPL_total_history[k][nid][:])))+'  dB' + '\n')
+                fid.write('SPLmax (dBA) =  ')
+                fid.write(str('%3.2f' % (np.max(SPLt_dBA_history[k][nid][:])))+'  dB')
                 fid.write('\n')
-            fid.write('SPLmax (dB) =  ')
-            fid.write(str('%3.2f' % (np.max(SPL_total_history[nid][:])))+'  dB' + '\n')
-            fid.write('SPLmax (dBA) =  ')
-            fid.write(str('%3.2f' % (np.max(SPLt_dBA_history[nid][:])))+'  dB')
-            fid.write('\n')
     
         fid.close
     
-    return (EPNL_total,SPL_total_history,SENEL_total)
+    if single_observer:
+        return (EPNL_total[0],SPL_total_history[0],SENEL_total[0])
+    
+    return (EPNL_total,SPL_total_history,SENEL_total)
\ No newline at end of file
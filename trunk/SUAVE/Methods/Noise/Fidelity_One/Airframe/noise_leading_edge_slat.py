@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -37,12 +38,13 @@ def noise_leading_edge_slat (SPL_wing,Sw,bw,velocity,deltaw,viscosity,M,phi,thet
                 SPL                              - Sound Pressure Level of the slat leading edge [dB]
 
             Assumptions:
-                Correlation based."""
+                Correlation based. The inputs that change along the flight path can be arrays, with the frequencies as
+                the last dimension."""
 
     #Process
     SPLslat1   = SPL_wing+3.0
     SPLslat2   = noise_clean_wing(0.15*Sw,bw,1,1,deltaw,velocity,viscosity,M,phi,theta,distance,frequency)
-    peakfactor = 3+max(SPL_wing)-max(SPLslat2)
+    peakfactor = 3+np.max(SPL_wing,axis=-1,keepdims=True)-np.max(SPLslat2,axis=-1,keepdims=True)
     SPLslat2   = SPLslat2+peakfactor
 
     SPL        = 10.*np.log10(10.0**(0.1*SPLslat1)+10.0**(0.1*SPLslat2))
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -16,103 +17,59 @@ import numpy as np
 
 ## @ingroupMethods-Noise-Fidelity_One-Engine
 def noise_source_location (B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone,Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary,Velocity_secondary,Velocity_mixed,Velocity_aircraft,sound_ambient,Str_m,Str_s):
-    
+    """This function calculates the emission angles of the primary, secondary and mixed jet sources,
+    starting from the given angles. The inputs are arrays over the frequencies and any observers or
+    time steps, each band being iterated until its source location converges. B is not used."""
+
     #Primary jet source location
-    XJ = np.zeros(24)
-    
-    for i in range(24):
-        residual = Diameter_primary
-        XJ[i]    = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if (B[i]>=0.):
-            theta_p[i]=np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_p[i]=np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i] = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-        
-        while residual>(Diameter_primary/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_p[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_p[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_p[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_p[i]
-            theta_p[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p[i]/np.pi)-9.)+(Area_secondary/Area_primary))
-            residual   = np.abs(XJ_old-XJ[i])
-
-        #Secondary jet source location
-        residual = Diameter_secondary
-        XJ_old   = 0.0
-        XJ[i]    = (zk*Diameter_secondary)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i])) \
-            *  np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        B[i]     = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        
-        if B[i]>=0.:
-            theta_s[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-            
-        XJ[i] = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
+    def primary_location(theta_p):
+        return (zk*Diameter_primary)*(4.+4.*np.arctan((18.*theta_p/np.pi)-9.)+(Area_secondary/Area_primary))
+
+    XJ      = primary_location(theta_p)
+    theta_p = source_angle(XJ,primary_location,Diameter_primary/200.,Xo,theta,distance_microphone)
+
+    #Secondary jet source location
+    def secondary_location(theta_s,Diameter):
+        return (zk*Diameter)*(2.+1.6*np.arctan((4.5*theta_s/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s))* \
             np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_s[i]
-            B[i]   = (1/np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_s[i] = np.arcsin((B[i]**2.+1.)**(-0.5))
-            else:
-                theta_s[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-            theta2     = theta_s[i]
-            theta_s[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(2.+1.6*np.arctan((4.5*theta_s[i]/np.pi)-2.25))*(1.+0.5/np.sqrt(Str_s[i]))* \
-                np.sqrt(1.+(0.7*Velocity_secondary/sound_ambient))*(Velocity_secondary/(Velocity_secondary-Velocity_aircraft))
-            
-            residual = np.abs(XJ_old-XJ[i])
-
-        #Mixed jet source location
-        residual = Diameter_mixed
-        XJ_old   = 0.
-        XJ[i] = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+ \
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) * \
-            (Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        B[i] = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-        if B[i]>=0.:
-            theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-        else:
-            theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-
-        XJ[i]=(zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-            (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
+
+    XJ      = secondary_location(theta_s,Diameter_secondary)
+    theta_s = source_angle(XJ,lambda theta_s: secondary_location(theta_s,Diameter_mixed),Diameter_mixed/200.,Xo,theta,distance_microphone)
+
+    #Mixed jet source location
+    def mixed_location(theta_m):
+        return (zk*Diameter_mixed)*(3.+np.exp(-Str_m)+(2.+1.1*np.arctan((18.*theta_m/np.pi)-13.))+\
+            (1.+0.5/np.sqrt(Str_m)))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
             *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-        
-        while residual>(Diameter_mixed/200.):
-            XJ_old = XJ[i]
-            theta1 = theta_m[i]
-            B[i]   = (1./np.sin(theta))*(((Xo+XJ[i])/distance_microphone)+np.cos(theta))
-            
-            if B[i]>=0.:
-                theta_m[i] = np.arcsin(((B[i])**2.+1.)**(-0.5))
-            else:
-                theta_m[i] = np.pi-np.arcsin(((B[i])**2.+1.)**(-0.5))
-                
-            theta2     = theta_m[i]
-            theta_m[i] = (theta1+theta2)/2.
-            XJ[i]      = (zk*Diameter_mixed)*(3.+np.exp(-Str_m[i])+(2.+1.1*np.arctan((18.*theta_m[i]/np.pi)-13.))+\
-                (1.+0.5/np.sqrt(Str_m[i])))*np.sqrt(0.5+0.5*Velocity_mixed/sound_ambient) \
-                *(Velocity_mixed/(Velocity_mixed-Velocity_aircraft))
-            
-            residual   = abs(XJ_old-XJ[i])
-
-    return(theta_p,theta_s,theta_m)
\ No newline at end of file
+
+    XJ      = mixed_location(theta_m)
+    theta_m = source_angle(XJ,mixed_location,Diameter_mixed/200.,Xo,theta,distance_microphone)
+
+    return(theta_p,theta_s,theta_m)
+
+def source_angle(XJ,location,tolerance,Xo,theta,distance_microphone):
+    """Iterates the emission angle of a jet source and its location, averaging each new angle with
+    the previous one, until the location of every band changes less than the tolerance."""
+
+    theta_j = emission_angle(XJ,Xo,theta,distance_microphone)
+    XJ      = location(theta_j)
+    active  = np.ones(np.shape(XJ),dtype=bool)
+
+    while np.any(active):
+        theta2      = emission_angle(XJ,Xo,theta,distance_microphone)
+        theta_new   = (theta_j+theta2)/2.
+        XJ_new      = location(theta_new)
+        residual    = np.abs(XJ-XJ_new)
+
+        theta_j     = np.where(active,theta_new,theta_j)
+        XJ          = np.where(active,XJ_new,XJ)
+        active      = active & (residual>tolerance)
+
+    return theta_j
+
+def emission_angle(XJ,Xo,theta,distance_microphone):
+    """Emission angle of a source at XJ downstream of the nozzle"""
+
+    B = (1./np.sin(theta))*(((Xo+XJ)/distance_microphone)+np.cos(theta))
+
+    return np.where(B>=0.,np.arcsin(((B)**2.+1.)**(-0.5)),np.pi-np.arcsin(((B)**2.+1.)**(-0.5)))
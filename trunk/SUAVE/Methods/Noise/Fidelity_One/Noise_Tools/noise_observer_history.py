@@ -0,0 +1,36 @@
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+# noise_observer_history.py
+# 
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Noise Observer History
+# ----------------------------------------------------------------------
+
+## @ingroupMethods-Noise-Fidelity_One-Noise_Tools
+def noise_observer_history(noise_time,time,values):
+    """ SUAVE.Methods.Noise.Fidelity_One.Noise_Tools.noise_observer_history(noise_time,time,values):
+            Interpolates the geometric history of the observers, as the distance or the emission angles, to the time steps of
+            the noise calculation.
+
+            Inputs:
+                noise_time                   - Time steps of the noise calculation [s]
+                time                         - Time steps of the segment [s]
+                values                       - Array of [time steps] for a single observer or [time steps, observers]
+
+            Outputs:
+                history                      - Array of [observers, noise time steps, 1], so it spans the frequencies
+
+            Assumptions:
+                None."""
+    
+    values  = np.reshape(values,(len(time),-1))
+    history = np.array([np.interp(noise_time,time,observer) for observer in values.T])
+    
+    return (history[:,:,None])
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,10 +19,10 @@ def pnl_noise (SPL):
     """This method calculates de Perceived Noise Level PNL from a 1/3 octave band noise spectra
 
         Inputs:
-                    SPL                     - Sound Pressure Level in 1/3 octave band
+                    SPL                     - Sound Pressure Level in 1/3 octave band, the bands being the last dimension
 
                 Outputs:
-                    PNL                     - Perceived Noise Level"""
+                    PNL                     - Perceived Noise Level, for each of the other dimensions"""
     
 
     #Definition of the noisineess matrix for each octave band
@@ -51,41 +52,43 @@ def pnl_noise (SPL):
             [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
 
     
-    #Defining the necessary arrays for the calculation
-    nsteps  = len(SPL)
-    SPL_noy = np.zeros((nsteps,24))
-    PNL     = np.zeros(nsteps)
+    #Defining the necessary arrays for the calculation, the bands are the last dimension of the SPL
+    noy     = np.array(noy)
+    SPL     = np.asarray(SPL)
+    SPL_noy = np.zeros(np.shape(SPL)[:-1]+(24,))
     
     #-------------------------------------------
     #STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------
     
-    for j in range(0,nsteps):
+    bands = SPL[...,0:23]
+    noy   = noy[0:23]
+    noisiness = np.zeros_like(bands)
     
-        for i in range(0,23):
-            if SPL[j][i]>=noy[1][2]:
-                SPL_noy[j][i] = 10**(noy[i][8]*(SPL[j][i]-noy[i][4]))
-                
-            if SPL[j][i]>=noy[i][3] and SPL[j][i]<noy[i][2]:
-                SPL_noy[j][i] = 10**(noy[i][7]*(SPL[j][i]-noy[i][3]))
-                
-            if SPL[j][i]>=noy[i][6] and SPL[j][i]<noy[i][3]:
-                SPL_noy[j][i] = 0.3*(10**(noy[i][10]*(SPL[j][i]-noy[i][6])))
-                
-            if SPL[j][i]>=noy[i][5] and SPL[j][i]<noy[i][6]:
-                SPL_noy[j][i] = 0.1*(10**(noy[i][9]*(SPL[j][i]-noy[i][5])))
-            
-        #-------------------------------------------  
-        #STEP 2 - Combine perceived noiseness values  
-        #-------------------------------------------
-        max_noy = np.max(SPL_noy[j][:])            
-        Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][:])
+    noisiness = np.where(bands>=noy[1][2], \
+                         10**(noy[:,8]*(bands-noy[:,4])),noisiness)
         
-        #-----------------------------------------------------------------
-        #STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-        #------------------------------------------------------------------    
-        if Perceived_noisinees==0:
-            Perceived_noisinees = 0.0625
-        PNL[j] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+    noisiness = np.where((bands>=noy[:,3]) & (bands<noy[:,2]), \
+                         10**(noy[:,7]*(bands-noy[:,3])),noisiness)
         
-    return (PNL)
\ No newline at end of file
+    noisiness = np.where((bands>=noy[:,6]) & (bands<noy[:,3]), \
+                         0.3*(10**(noy[:,10]*(bands-noy[:,6]))),noisiness)
+        
+    noisiness = np.where((bands>=noy[:,5]) & (bands<noy[:,6]), \
+                         0.1*(10**(noy[:,9]*(bands-noy[:,5]))),noisiness)
+    
+    SPL_noy[...,0:23] = noisiness
+        
+    #-------------------------------------------  
+    #STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy = np.max(SPL_noy,axis=-1)            
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=-1)
+    
+    #-----------------------------------------------------------------
+    #STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees = np.where(Perceived_noisinees==0,0.0625,Perceived_noisinees)
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+        
+    return (PNL)
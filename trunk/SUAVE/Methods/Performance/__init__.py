@@ -5,6 +5,7 @@
 
 from .estimate_take_off_field_length   import estimate_take_off_field_length
 from .payload_range                    import payload_range
+from .mission_sweep                    import mission_sweep, scenario_grid, load_sweep_table
 from .estimate_landing_field_length    import estimate_landing_field_length
 from .find_take_off_weight_given_tofl  import find_take_off_weight_given_tofl 
 from .V_n_diagram                      import V_n_diagram
@@ -0,0 +1,489 @@
+## @ingroup Methods-Performance
+# mission_sweep.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import copy
+import warnings
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from SUAVE.Core import Data
+from SUAVE.Core.jobs import picklable
+
+# ----------------------------------------------------------------------
+#  Mission Sweep
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def mission_sweep(mission,scenarios,cruise_segment_tag=None,reserves=0.,directory=None,number_of_workers=1,outputs=None):
+    """Flies a mission for every scenario of a sweep, such as the points of a payload range carpet.
+    A scenario overrides any of the takeoff weight, fuel, payload, cruise altitude and ISA temperature
+    offset. The scenarios are shared out to worker processes, each flying its own copy of the mission
+    with a warm start store, so each solve starts from the solutions of the ones before it. Each
+    result is appended to a table on disk as soon as it is done.
+
+    Assumptions:
+    Any two of takeoff weight, fuel and payload set the third through the operating empty weight. A
+    fuel or payload given alone is flown at the takeoff weight of the mission, which sets the other.
+    With a fuel load, the cruise distance is changed until the mission burns it, less the reserves.
+    The cruise altitude is also set as the end altitude of the segment before the cruise. The
+    scenarios are flown in this process, with a warning, if the mission can't be sent to the workers
+    or they stop unexpectedly. Errors of a scenario are raised.
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.segments[0].analyses.weights.
+      vehicle.mass_properties.
+        operating_empty                   [kg]
+    scenarios.                            one value per scenario, each optional
+      takeoff_weight                      [kg]
+      fuel                                [kg]
+      payload                             [kg]
+      cruise_altitude                     [m]
+      temperature_deviation               [K]
+    cruise_segment_tag                    <string>
+    reserves                              [kg]
+    directory                             <string> None to not store the table
+    number_of_workers                     [-]
+    outputs                               [Data] functions of the flown mission, each giving a float
+
+    Outputs:
+    table.                                one value per scenario, in the order of the scenarios
+      case                                [-]
+      takeoff_weight                      [kg]
+      fuel                                [kg]
+      payload                             [kg]
+      cruise_altitude                     [m]
+      temperature_deviation               [K]
+      range                               [m]
+      fuel_burn                           [kg]
+      time                                [s]
+      converged                           [-]
+      (one column for each of the outputs)
+
+    Properties Used:
+    N/A
+    """
+
+    if outputs is None:
+        outputs = Data()
+
+    cases     = scenario_rows(scenarios)
+    arguments = (cruise_segment_tag,reserves,outputs)
+    rows      = []
+
+    if directory is not None:
+        start_table(directory)
+
+    # rows are written by this process only, in the order they finish
+    def finished(row):
+        rows.append(row)
+        if directory is not None:
+            append_table_row(directory,row)
+
+    workers = number_of_workers > 1 and len(cases) > 1
+    if workers and not picklable((mission,arguments)):
+        warnings.warn('The mission can not be sent to worker processes, flying the scenarios in one process',stacklevel=2)
+        workers = False
+
+    if workers:
+        try:
+            with ProcessPoolExecutor(max_workers=number_of_workers,initializer=start_worker,initargs=(mission,)) as executor:
+                futures = [executor.submit(fly_worker_scenario,case,scenario,arguments) for case, scenario in cases]
+                for future in as_completed(futures):
+                    finished(future.result())
+        except BrokenProcessPool:
+            # fly the rest here instead
+            warnings.warn('The worker processes stopped unexpectedly, flying the remaining scenarios in one process',stacklevel=2)
+
+    done  = set([int(row.case) for row in rows])
+    cases = [(case, scenario) for case, scenario in cases if not case in done]
+
+    if len(cases):
+        local    = worker_copy(mission)
+        baseline = sweep_baseline(local,cruise_segment_tag)
+        for case, scenario in cases:
+            finished(fly_scenario(local,baseline,case,scenario,*arguments))
+
+    # back in the order of the scenarios
+    rows  = sorted(rows,key=lambda row: row.case)
+    table = Data()
+    for key in rows[0].keys():
+        table[key] = np.array([row[key] for row in rows])
+
+    return table
+
+## @ingroup Methods-Performance
+def scenario_grid(**axes):
+    """Builds every combination of the values given for each override, the first one varying slowest
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    axes                                  [array] values of each override, i.e. payload=[...]
+
+    Outputs:
+    scenarios                             [Data] one value per combination for each override
+
+    Properties Used:
+    N/A
+    """
+
+    keys   = list(axes.keys())
+    values = [np.ravel(axes[key]) for key in keys]
+    grids  = np.meshgrid(*values,indexing='ij')
+
+    scenarios = Data()
+    for key, grid in zip(keys,grids):
+        scenarios[key] = np.ravel(grid)
+
+    return scenarios
+
+## @ingroup Methods-Performance
+def load_sweep_table(directory):
+    """Reads the table written by a mission sweep, also while the sweep is still running. Rows are in
+    the order the scenarios finished, a row that is only partly written is left out.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    directory                             <string>
+
+    Outputs:
+    table                                 [Data] an array for each column
+
+    Properties Used:
+    N/A
+    """
+
+    with open(os.path.join(directory,'columns.txt')) as f:
+        keys = f.read().split()
+
+    columns = [np.fromfile(os.path.join(directory,key + '.f8'),dtype='<f8') for key in keys]
+    n_rows  = min([len(column) for column in columns])
+
+    table = Data()
+    for key, column in zip(keys,columns):
+        table[key] = column[:n_rows]
+
+    return table
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def scenario_rows(scenarios):
+    """Splits the overrides into one Data per scenario, numbered in order
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    scenarios                             [Data]
+
+    Outputs:
+    cases                                 [list] of (number, scenario)
+
+    Properties Used:
+    N/A
+    """
+
+    keys    = ['takeoff_weight','fuel','payload','cruise_altitude','temperature_deviation']
+    unknown = [key for key in scenarios.keys() if not key in keys]
+    if len(unknown):
+        raise KeyError('Unknown scenario overrides: ' + ', '.join(unknown))
+
+    values  = dict([(key, np.atleast_1d(scenarios[key])) for key in scenarios.keys()])
+    n_cases = max([len(value) for value in values.values()])
+
+    cases = []
+    for case in range(n_cases):
+        scenario = Data()
+        for key, value in values.items():
+            scenario[key] = float(value[case % len(value)])
+        cases.append((case, scenario))
+
+    return cases
+
+## @ingroup Methods-Performance
+def worker_copy(mission):
+    """Copies a mission for a worker, giving the copy a warm start store of its own if it has none
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission]
+
+    Outputs:
+    mission                               [Mission]
+
+    Properties Used:
+    N/A
+    """
+
+    from SUAVE.Analyses.Mission.Warm_Start import Warm_Start
+
+    mission = copy.deepcopy(mission)
+    if mission.state.numerics.warm_start is None:
+        mission.state.numerics.warm_start = Warm_Start()
+
+    return mission
+
+## @ingroup Methods-Performance
+def sweep_baseline(mission,cruise_segment_tag):
+    """Keeps the values of a mission that the scenarios of a sweep change
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission]
+    cruise_segment_tag                    <string>
+
+    Outputs:
+    baseline                              [list] of (holder, key, value)
+
+    Properties Used:
+    N/A
+    """
+
+    masses   = mission.segments[0].analyses.weights.vehicle.mass_properties
+    baseline = [(masses,'takeoff',masses.takeoff)]
+
+    tags = list(mission.segments.keys())
+    if cruise_segment_tag in tags:
+        cruise   = mission.segments[cruise_segment_tag]
+        baseline = baseline + [(cruise,key,cruise[key]) for key in ['distance','altitude'] if key in cruise]
+        before   = tags.index(cruise_segment_tag) - 1
+        if before >= 0 and 'altitude_end' in mission.segments[before]:
+            baseline.append((mission.segments[before],'altitude_end',mission.segments[before].altitude_end))
+
+    for segment in mission.segments:
+        if 'temperature_deviation' in segment:
+            baseline.append((segment,'temperature_deviation',segment.temperature_deviation))
+
+    return baseline
+
+## @ingroup Methods-Performance
+def fly_scenario(mission,baseline,case,scenario,cruise_segment_tag,reserves,outputs):
+    """Applies the overrides of a scenario to a mission, flies it and collects the results. The
+    mission is first put back to its baseline, so a scenario does not depend on the ones flown before.
+
+    Assumptions:
+    See mission_sweep
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               [Mission]
+    baseline                              [list]
+    case                                  [-]
+    scenario                              [Data]
+    cruise_segment_tag                    <string>
+    reserves                              [kg]
+    outputs                               [Data]
+
+    Outputs:
+    row                                   [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    for holder, key, value in baseline:
+        holder[key] = value
+
+    vehicle = mission.segments[0].analyses.weights.vehicle
+    OEW     = vehicle.mass_properties.operating_empty
+
+    TOW     = scenario.get('takeoff_weight',np.nan)
+    fuel    = scenario.get('fuel',np.nan)
+    payload = scenario.get('payload',np.nan)
+
+    # a fuel or payload alone is flown at the takeoff weight of the mission
+    if np.isnan(TOW) and np.isnan(fuel) != np.isnan(payload):
+        TOW = vehicle.mass_properties.takeoff
+
+    # any two of the weights set the third
+    if np.isnan(TOW) and not np.isnan(fuel) and not np.isnan(payload):
+        TOW = OEW + payload + fuel
+    elif np.isnan(fuel) and not np.isnan(TOW) and not np.isnan(payload):
+        fuel = TOW - OEW - payload
+    elif np.isnan(payload) and not np.isnan(TOW) and not np.isnan(fuel):
+        payload = TOW - OEW - fuel
+
+    if fuel < 0. or payload < 0.:
+        raise ValueError('Scenario ' + str(case) + ' leaves a negative fuel or payload at a takeoff weight of ' + str(TOW) + ' kg')
+
+    if not np.isnan(TOW):
+        vehicle.mass_properties.takeoff = TOW
+    TOW = vehicle.mass_properties.takeoff
+
+    if 'cruise_altitude' in scenario:
+        tags = list(mission.segments.keys())
+        mission.segments[cruise_segment_tag].altitude = scenario.cruise_altitude
+        before = tags.index(cruise_segment_tag) - 1
+        if before >= 0 and 'altitude_end' in mission.segments[before]:
+            mission.segments[before].altitude_end = scenario.cruise_altitude
+
+    if 'temperature_deviation' in scenario:
+        for segment in mission.segments:
+            if 'temperature_deviation' in segment:
+                segment.temperature_deviation = scenario.temperature_deviation
+
+    results = mission.evaluate()
+
+    # change the cruise distance until the fuel is burned
+    if not np.isnan(fuel):
+        maxIter = 10 # maximum iteration limit
+        tol     = 1. # fuel convergency tolerance
+        err     = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - fuel + reserves
+        iter    = 0
+        while abs(err) > tol and iter < maxIter:
+            iter = iter + 1
+
+            segment    = results.segments[cruise_segment_tag]
+            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]
+            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]
+            mission.segments[cruise_segment_tag].distance = CruiseDist - CruiseDist / CruiseFuel * err
+
+            results = mission.evaluate()
+            err     = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - fuel + reserves
+
+    row = Data()
+    row.case                  = float(case)
+    row.takeoff_weight        = TOW
+    row.fuel                  = fuel
+    row.payload               = payload
+    row.cruise_altitude       = scenario.get('cruise_altitude',np.nan)
+    row.temperature_deviation = scenario.get('temperature_deviation',np.nan)
+    row.range                 = results.segments[-1].conditions.frames.inertial.position_vector[-1,0]
+    row.fuel_burn             = TOW - results.segments[-1].conditions.weights.total_mass[-1,0]
+    row.time                  = results.segments[-1].conditions.frames.inertial.time[-1,0]
+    row.converged             = float(all([segment.get('converged',True) is not False for segment in [results] + results.segments.values()]))
+    for key, output in outputs.items():
+        row[key] = float(output(results))
+
+    return row
+
+## @ingroup Methods-Performance
+def start_table(directory):
+    """Makes the folder of a sweep table, removing a table written there before
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    directory                             <string>
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    header = os.path.join(directory,'columns.txt')
+    if os.path.isfile(header):
+        with open(header) as f:
+            keys = f.read().split()
+        for key in keys:
+            column = os.path.join(directory,key + '.f8')
+            if os.path.isfile(column):
+                os.remove(column)
+        os.remove(header)
+
+    return
+
+## @ingroup Methods-Performance
+def append_table_row(directory,row):
+    """Appends a row to the table of a sweep, one little endian float64 file per column
+
+    Assumptions:
+    Only one process writes to the table
+
+    Source:
+    N/A
+
+    Inputs:
+    directory                             <string>
+    row                                   [Data]
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+
+    header = os.path.join(directory,'columns.txt')
+    if not os.path.isfile(header):
+        for key in row.keys():
+            open(os.path.join(directory,key + '.f8'),'wb').close()
+        with open(header,'w') as f:
+            f.write('\n'.join(row.keys()) + '\n')
+
+    for key, value in row.items():
+        with open(os.path.join(directory,key + '.f8'),'ab') as f:
+            np.array([value],dtype='<f8').tofile(f)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Worker Processes
+# ----------------------------------------------------------------------
+
+# the copy of the mission held by a worker process, with its baseline
+_worker_mission  = None
+_worker_baseline = None
+
+def start_worker(mission):
+    """Keeps a warm started copy of the mission a worker process was started with"""
+
+    global _worker_mission, _worker_baseline
+    _worker_mission  = worker_copy(mission)
+    _worker_baseline = None
+
+def fly_worker_scenario(case,scenario,arguments):
+    """Flies a scenario on the copy of the mission held by a worker process"""
+
+    global _worker_baseline
+    if _worker_baseline is None:
+        _worker_baseline = sweep_baseline(_worker_mission,arguments[0])
+
+    return fly_scenario(_worker_mission,_worker_baseline,case,scenario,*arguments)
@@ -3,6 +3,7 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,6 +11,7 @@
 
 from SUAVE.Core import Units
 import time
+import copy
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -17,8 +19,9 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Performance
-def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
-    """Calculates a vehicle's payload range diagram. Includes plotting.
+def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.,ensemble=False):
+    """Calculates a vehicle's payload range diagram. Includes plotting. With ensemble, the points
+    are flown by copies of the mission that are solved together.
 
     Assumptions:
     Constant altitude cruise
@@ -37,6 +40,7 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     mission.segments[0].analyses.weights.
       vehicle.mass_properties.takeoff     [kg]
     cruise_segment_tag                    <string>
+    ensemble                              <boolean>
 
     Outputs:
     payload_range.
@@ -107,8 +111,15 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
+    # all points at once, or one at a time
+    if ensemble:
+        R      = ensemble_ranges(mission,cruise_segment_tag,TOW,FUEL,reserves,iprint)
+        points = []
+    else:
+        points = range(len(TOW))
+
     # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
+    for i in points:
 ##    for i in [2]:
         if iprint:
             print(('   EVALUATING POINT : ' + str(i+1)))
@@ -225,3 +236,79 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         plt.show()
 
     return payload_range
+
+## @ingroup Methods-Performance
+def ensemble_ranges(mission,cruise_segment_tag,TOW,FUEL,reserves=0.,iprint=1):
+    """Finds the range of every point of a payload range diagram together. Each point flies its own
+    copy of the mission, and the copies are evaluated as an ensemble for every update of the cruise
+    distance.
+
+    Assumptions:
+    Constant altitude cruise
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.segments[0].analyses.weights.
+      vehicle.mass_properties.takeoff     [kg]
+    cruise_segment_tag                    <string>
+    TOW                                   [kg]
+    FUEL                                  [kg]
+    reserves                              [kg]
+
+    Outputs:
+    R                                     [nm]
+
+    Properties Used:
+    N/A
+    """
+    from SUAVE.Methods.Missions.Segments import evaluate_ensemble
+
+    # one copy of the mission per point
+    missions = []
+    for i in range(len(TOW)):
+        point = copy.deepcopy(mission)
+        point.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
+        missions.append(point)
+
+    results = evaluate_ensemble(missions)
+
+    maxIter = 10 # maximum iteration limit
+    tol = 1.     # fuel convergency tolerance
+    iters  = [0]*len(TOW)
+    active = list(range(len(TOW)))
+
+    while len(active):
+
+        for i in active:
+            iters[i] = iters[i] + 1
+            segment  = results[i].segments[cruise_segment_tag]
+
+            # Difference between burned fuel and target fuel
+            TotalFuel   = TOW[i] - results[i].segments[-1].conditions.weights.total_mass[-1,0]
+            missingFuel = FUEL[i] - TotalFuel - reserves
+
+            # Estimated distance that will result in total fuel burn = target fuel
+            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+            CruiseSR   = CruiseDist / CruiseFuel        # [m/kg]
+            missions[i].segments[cruise_segment_tag].distance = (CruiseDist + CruiseSR * missingFuel)
+
+        # running the points that are not converged with their new distances
+        evaluate_ensemble([missions[i] for i in active])
+
+        for i in list(active):
+            err = ( TOW[i] - results[i].segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
+
+            if iprint:
+                print(('   POINT : ' + str(i+1) + ' | iter: ' +str('%2g' % iters[i]) + ' | Target Fuel: '   \
+                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
+                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
+
+            if abs(err) <= tol or iters[i] >= maxIter:
+                active.remove(i)
+
+    R = [ results[i].segments[-1].conditions.frames.inertial.position_vector[-1,0] * Units.m / Units.nautical_mile for i in range(len(TOW)) ]      #Distance [nm]
+
+    return R
@@ -5,6 +5,9 @@
 
 import numpy as np
 
+# operators already built, by number of points and integration
+_operators = {}
+
 # ----------------------------------------------------------------------
 #  Method
 # ----------------------------------------------------------------------
@@ -21,6 +24,9 @@ def chebyshev_data(N = 16, integration = True, **options):
         where f is either a 1-d vector or 2-d column array
         
     A full example is available in the function code.
+    
+    The operators are built once for each number of points and
+    copies are returned, so segments may change them in place.
 
     Assumptions:
     None
@@ -45,6 +51,39 @@ def chebyshev_data(N = 16, integration = True, **options):
     N = int(N)
     if N <= 0: raise RuntimeError("N = %i, must be > 0" % N)
     
+    key = (N, bool(integration))
+    if not key in _operators:
+        _operators[key] = chebyshev_operators(N, integration)
+    
+    x, D, I = _operators[key]
+    
+    if I is not None:
+        I = I.copy()
+    
+    return x.copy(), D.copy(), I
+
+## @ingroup Methods-Utilities-Chebyshev
+def chebyshev_operators(N, integration):
+    """Builds the control points and operators returned by chebyshev_data
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    N                      [-]        Number of points
+    integration            <boolean>  Determines if the integration operator is calculated
+
+    Outputs:
+    x                      [-]        N-number of cosine spaced control points, in range [0,1]
+    D                      [-]        Differentiation operation matrix
+    I                      [-]        Integration operation matrix, or None if integration = False
+
+    Properties Used:
+    N/A
+    """
     
     # --- X vector
     
@@ -0,0 +1,217 @@
+## @ingroup Methods-Utilities
+# adaptive_grid_sampling.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from scipy.interpolate import make_interp_spline
+
+# ----------------------------------------------------------------------
+#   Adaptive Grid Sampling
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def adaptive_grid_sampling(sample,x,y,tolerance,maximum_samples,y_breaks=None,error_columns=None,minimum_spacing=None):
+    """Samples a function on a tensor grid. The grid starts from the given lines and new lines are
+    added halfway into the intervals next to the lines with the largest leave-one-out error, until
+    every error is below the tolerance or no line can be added without exceeding the samples.
+    Only the points of the new lines are sampled.
+
+    Assumptions:
+    The function is smooth between the breaks in y. The lines on either side of a break are
+    interpolated separately and the intervals across a break are never split.
+
+    Source:
+    N/A
+
+    Inputs:
+    sample               function(points) -> values, points is [n,2] of x and y, values is [n,m]
+    x                    [-] starting grid lines
+    y                    [-] starting grid lines
+    tolerance            [-] leave-one-out error, relative to the range of each value
+    maximum_samples      [-]
+    y_breaks             [-] values of y that are not interpolated across, None for none
+    error_columns        [list] columns of the values the error is found from, all if None
+    minimum_spacing      [-] smallest new intervals in x and y, 1/64 of the starting range if None
+
+    Outputs:
+    x                    [-] refined grid lines
+    y                    [-] refined grid lines
+    values               [-] array of [m,len(x),len(y)]
+
+    Properties Used:
+    N/A
+    """
+
+    x        = np.unique(np.ravel(x))
+    y        = np.unique(np.ravel(y))
+    if y_breaks is None:
+        y_breaks = []
+    y_breaks = np.sort(np.ravel(np.array(y_breaks,dtype=float)))
+
+    if minimum_spacing is None:
+        minimum_spacing = np.array([x[-1]-x[0],y[-1]-y[0]]) / 64.
+
+    x, y, values = extend_grid(sample,x,y,None,[],[])
+
+    if error_columns is None:
+        error_columns = np.arange(values.shape[0])
+
+    while True:
+        x_errors, y_errors = grid_leave_one_out_error(x,y,values[error_columns],y_breaks)
+
+        # both intervals next to a line that is not well predicted from its neighbors are split
+        candidates = []
+        for axis, lines, errors, breaks in [(0,x,x_errors,[]),(1,y,y_errors,y_breaks)]:
+            segment = np.searchsorted(breaks,lines,side='right')
+            for i in np.where(errors > tolerance)[0]:
+                for j in [i-1,i]:
+                    if j < 0 or j+1 >= len(lines) or segment[j] != segment[j+1]:
+                        continue
+                    if 0.5*(lines[j+1]-lines[j]) < minimum_spacing[axis]:
+                        continue
+                    candidates.append((errors[i],axis,0.5*(lines[j]+lines[j+1])))
+
+        # the largest errors first, down to half of the largest error that fits within the samples
+        candidates.sort(key=lambda candidate: -candidate[0])
+        new_lines = [[],[]]
+        largest   = None
+        for error, axis, line in candidates:
+            if line in new_lines[axis]:
+                continue
+            size        = [len(x)+len(new_lines[0]),len(y)+len(new_lines[1])]
+            size[axis] += 1
+            if size[0]*size[1] > maximum_samples:
+                continue
+            if largest is None:
+                largest = error
+            elif error < 0.5*largest:
+                break
+            new_lines[axis].append(line)
+
+        if len(new_lines[0]) == 0 and len(new_lines[1]) == 0:
+            break
+
+        x, y, values = extend_grid(sample,x,y,values,new_lines[0],new_lines[1])
+
+    return x, y, values
+
+## @ingroup Methods-Utilities
+def extend_grid(sample,x,y,values,new_x,new_y):
+    """Adds lines to a sampled tensor grid and samples the new points, ordered by y and then x
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    sample               function(points) -> values, see adaptive_grid_sampling
+    x, y                 [-] grid lines
+    values               [-] array of [m,len(x),len(y)], None if nothing is sampled yet
+    new_x, new_y         [-] lines to add
+
+    Outputs:
+    x, y                 [-] sorted grid lines
+    values               [-] array of [m,len(x),len(y)]
+
+    Properties Used:
+    N/A
+    """
+
+    grid_x = np.sort(np.concatenate([x,new_x]))
+    grid_y = np.sort(np.concatenate([y,new_y]))
+
+    sampled = np.zeros((len(grid_x),len(grid_y)),dtype=bool)
+    if values is not None:
+        sampled[np.ix_(np.searchsorted(grid_x,x),np.searchsorted(grid_y,y))] = True
+
+    iy, ix = np.where(~sampled.T)
+    points = np.vstack([grid_x[ix],grid_y[iy]]).T
+    new    = np.reshape(sample(points),(len(points),-1))
+
+    grid_values = np.zeros((new.shape[1],len(grid_x),len(grid_y)))
+    if values is not None:
+        grid_values[:,sampled] = values.reshape(values.shape[0],-1)
+    grid_values[:,ix,iy] = new.T
+
+    return grid_x, grid_y, grid_values
+
+## @ingroup Methods-Utilities
+def grid_leave_one_out_error(x,y,values,y_breaks=None):
+    """Finds how well each interior grid line is predicted by a spline through the other lines of
+    its segment. The error of a line is the largest over the other axis and the values, relative to
+    the range of each value.
+
+    Assumptions:
+    Cubic splines where a segment has enough lines, linear otherwise. The first and last lines of a
+    segment have no error.
+
+    Source:
+    N/A
+
+    Inputs:
+    x, y                 [-] grid lines
+    values               [-] array of [m,len(x),len(y)]
+    y_breaks             [-] values of y that are not interpolated across, None for none
+
+    Outputs:
+    x_errors             [-] error of each x line
+    y_errors             [-] error of each y line
+
+    Properties Used:
+    N/A
+    """
+
+    scale = np.max(values,axis=(1,2)) - np.min(values,axis=(1,2))
+    scale[scale == 0.] = 1.
+    values = values / scale[:,None,None]
+
+    if y_breaks is None:
+        y_breaks = []
+
+    x_errors = line_errors(x,values,1,[])
+    y_errors = line_errors(y,values,2,y_breaks)
+
+    return x_errors, y_errors
+
+def line_errors(lines,values,axis,breaks):
+    """Leave-one-out errors of the lines along one axis, see grid_leave_one_out_error
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    lines                [-]
+    values               [-] array of [m,len(x),len(y)]
+    axis                 [-] axis of the values along the lines
+    breaks               [-]
+
+    Outputs:
+    errors               [-]
+
+    Properties Used:
+    N/A
+    """
+
+    errors  = np.zeros(len(lines))
+    segment = np.searchsorted(np.sort(np.ravel(np.array(breaks,dtype=float))),lines,side='right')
+
+    for s in np.unique(segment):
+        index = np.where(segment == s)[0]
+        for k in range(1,len(index)-1):
+            rest     = np.delete(index,k)
+            order    = 3 if len(rest) >= 4 else 1
+            spline   = make_interp_spline(lines[rest],np.take(values,rest,axis=axis),k=order,axis=axis)
+            estimate = spline(lines[index[k]])
+            errors[index[k]] = np.max(np.abs(estimate - np.take(values,index[k],axis=axis)))
+
+    return errors
@@ -5,6 +5,7 @@
 # Modified: Feb 2016, M. Vegh
 #           Apr 2017, T. MacDonald
 #           Jul 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,9 +15,16 @@
 import SUAVE 
 from SUAVE.Core import Data, DataOrdered
 from SUAVE.Analyses import Process
+from SUAVE.Core.result_cache import load_result, save_result
+from SUAVE.Core.jobs import picklable
 from copy import deepcopy
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from . import helper_functions as help_fun
 import numpy as np
+import hashlib
+import warnings
 
 # ----------------------------------------------------------------------
 #  Nexus Class
@@ -69,6 +77,26 @@ class Nexus(Data):
         self.last_fidelity          = None
         self.evaluation_count       = 0
         self.force_evaluate         = False
+        
+        # design points of a batch are shared out to this many worker processes
+        self.number_of_workers      = 1
+        self._worker_pool           = Worker_Pool()
+        
+        # objective and constraint values of this many distinct inputs and fidelity levels are
+        # reused, 0 to only reuse the last evaluation. A reused value does not run the procedure, so
+        # the results and summary are those of the last evaluation unless they are kept as well
+        self.evaluation_cache_size      = 0
+        self.evaluation_cache_results   = False # also keep the results and summary of each
+        self.evaluation_cache_directory = None  # values are also stored here to resume a run
+        
+        # the stored values are only found again with the same version, the vehicle, analyses,
+        # missions and procedure are not part of the key, so change it or clear the directory
+        # whenever they change
+        self.evaluation_cache_version   = None
+        self._evaluation_cache          = None
+        
+        # the aliases of the problem, looked up once
+        self._compiled_aliases          = Compiled_Aliases()
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in SUAVE.
@@ -156,17 +184,209 @@ class Nexus(Data):
             None
         """           
     
-        self.evaluate(x)
-        
-        aliases     = self.optimization_problem.aliases
-        objective   = self.optimization_problem.objective
-        results     = self.results
-    
-        objective_value  = help_fun.get_values(self,objective,aliases)  
+        objective        = self.optimization_problem.objective
+        objective_value  = self.problem_values('objective',x)
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective.astype('Float64') 
     
+    def problem_values(self,name,x = None):
+        """Retrieve the unscaled objective or constraint values at the inputs. Values found at the same
+            inputs and fidelity level before are reused, otherwise the problem is evaluated.
+    
+            Assumptions:
+            The values only depend on the inputs and the fidelity level. Reused values leave the
+            results and summary of the last evaluation, unless evaluation_cache_results is set
+    
+            Source:
+            N/A
+    
+            Inputs:
+            name               [string] 'objective' or 'constraints'
+            x                  [vector]
+    
+            Outputs:
+            values             [array]
+    
+            Properties Used:
+            self.
+              evaluation_cache_results   <boolean>
+              last_inputs                [array]
+        """
+        
+        self.unpack_inputs(x)
+        
+        key   = self.evaluation_key()
+        entry = None
+        if self.force_evaluate == False:
+            entry = self.cached_evaluation(key)
+            
+        if entry is not None and name in entry:
+            last = np.all(self.optimization_problem.inputs==self.last_inputs) \
+                and self.last_fidelity == self.fidelity_level
+            
+            # the nexus does not hold an evaluation of these inputs, the next evaluate call runs them
+            if not last:
+                self.last_inputs = None
+                if 'results' in entry:
+                    self.results = deepcopy(entry.results)
+                    self.summary = deepcopy(entry.summary)
+            return entry[name]
+        
+        self.evaluate()
+        
+        getters = self.compiled_aliases()[name]
+        values  = help_fun.get_compiled_values(self,getters)
+        
+        if entry is None:
+            entry = Data()
+        entry[name] = values
+        if self.evaluation_cache_results:
+            entry.results = deepcopy(self.results)
+            entry.summary = deepcopy(self.summary)
+        self.store_evaluation(key,entry)
+        
+        return values
+    
+    def evaluation_key(self):
+        """Identifies the current inputs and fidelity level
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            key                <tuple>
+    
+            Properties Used:
+            None
+        """
+        
+        inputs = np.array(self.optimization_problem.inputs[:,1],dtype=float)
+        
+        return (inputs.tobytes(),self.fidelity_level)
+    
+    def cached_evaluation(self,key):
+        """Returns the values stored for a key, in memory or else on disk, or None if there are none
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            key                <tuple>
+    
+            Outputs:
+            entry              [Data] or None
+    
+            Properties Used:
+            self.evaluation_cache_directory
+        """
+        
+        if self._evaluation_cache is not None and key in self._evaluation_cache:
+            self._evaluation_cache.move_to_end(key)
+            return self._evaluation_cache[key]
+        
+        stored = load_result(self.evaluation_cache_directory,self.evaluation_file_key(key))
+        if stored is None:
+            return None
+        
+        entry = Data()
+        for name, values in stored.items():
+            entry[name] = values
+        self.store_evaluation(key,entry,save=False)
+        
+        return entry
+    
+    def store_evaluation(self,key,entry,save=True):
+        """Stores the values for a key, dropping the least recently used ones beyond the cache size.
+            The values are also written to the cache directory if there is one.
+    
+            Assumptions:
+            Results and summaries are only kept in memory
+    
+            Source:
+            N/A
+    
+            Inputs:
+            key                <tuple>
+            entry              [Data]
+            save               <boolean>
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            self.
+              evaluation_cache_size      [-]
+              evaluation_cache_directory <string>
+        """
+        
+        if save:
+            arrays = dict((name,entry[name]) for name in ['objective','constraints'] if name in entry)
+            save_result(self.evaluation_cache_directory,self.evaluation_file_key(key),arrays)
+        
+        size = int(self.evaluation_cache_size)
+        if size <= 0:
+            return
+        
+        if self._evaluation_cache is None:
+            self._evaluation_cache = OrderedDict()
+            
+        self._evaluation_cache[key] = entry
+        self._evaluation_cache.move_to_end(key)
+        
+        while len(self._evaluation_cache) > size:
+            self._evaluation_cache.popitem(last=False)
+    
+    def evaluation_file_key(self,key):
+        """Name of the file the values for a key are stored in, which also depends on the definition
+            of the problem and on the cache version, so different problems can share a directory
+    
+            Assumptions:
+            The model behind the problem is the same for the same cache version. Values stored
+            before the vehicle, analyses, missions or procedure changed are returned as they were,
+            unless the cache version is changed or the directory is cleared.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            key                <tuple>
+    
+            Outputs:
+            file_key           <string> or None without a cache directory
+    
+            Properties Used:
+            self.
+              evaluation_cache_directory <string>
+              evaluation_cache_version   <string>
+        """
+        
+        if self.evaluation_cache_directory is None:
+            return None
+        
+        problem = self.optimization_problem
+        digest  = hashlib.sha1()
+        for definition in [problem.inputs[:,0],problem.aliases]:
+            digest.update(str(definition).encode('utf-8'))
+        for table in [problem.objective,problem.constraints]:
+            # the units are replaced by their values the first time the problem is evaluated
+            for row in table:
+                digest.update(str(list(row[:-1]) + [row[-1]*1.0]).encode('utf-8'))
+        digest.update(str(self.evaluation_cache_version).encode('utf-8'))
+        digest.update(key[0])
+        digest.update(str(key[1]).encode('utf-8'))
+        
+        return digest.hexdigest()
+    
     def inequality_constraint(self,x = None):
         """Retrieve the inequality constraint values for your function
     
@@ -186,11 +406,8 @@ class Nexus(Data):
             None
             """           
         
-        self.evaluate(x)
-        
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
+        values      = self.problem_values('constraints',x)
         
         # Setup constraints  
         indices = []
@@ -204,7 +421,7 @@ class Nexus(Data):
         else:
 
             # get constaint values 
-            constraint_values = help_fun.get_values(self,iqconstraints,aliases)          
+            constraint_values = np.delete(values,indices)
             
             # scale bounds 
             scaled_bnd_constraints  = help_fun.scale_const_bnds(iqconstraints)
@@ -239,11 +456,8 @@ class Nexus(Data):
             None
         """         
     
-        self.evaluate(x)
-
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
-        results     = self.results
+        values      = self.problem_values('constraints',x)
         
         # Setup constraints  
         indices = []
@@ -257,7 +471,7 @@ class Nexus(Data):
         if eqconstraints == []:
             scaled_constraints = []
         else:
-            constraint_values  = help_fun.get_values(self,eqconstraints,aliases)
+            constraint_values  = np.delete(values,indices)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values) - help_fun.scale_const_bnds(eqconstraints)
 
         return scaled_constraints   
@@ -281,13 +495,8 @@ class Nexus(Data):
             None
         """         
         
-        self.evaluate(x)
-        
-        aliases     = self.optimization_problem.aliases
-        constraints = self.optimization_problem.constraints
-        results     = self.results
-    
-        constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        constraints        = self.optimization_problem.constraints
+        constraint_values  = self.problem_values('constraints',x)
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values) 
 
         return scaled_constraints     
@@ -321,10 +530,63 @@ class Nexus(Data):
         converted_values = help_fun.convert_values(inputs)
         
         # Set the dictionary
-        aliases = self.optimization_problem.aliases
-        vehicle = self.vehicle_configurations
+        setters = self.compiled_aliases().setters
         
-        self    = help_fun.set_values(self,inputs,converted_values,aliases)     
+        self    = help_fun.set_compiled_values(self,setters,converted_values)     
+    
+    def compiled_aliases(self):
+        """Returns the setters of the inputs and the getters of the objective and constraints. They are
+            made again when the inputs, objective, constraints or aliases of the problem are replaced.
+    
+            Assumptions:
+            Wildcards are expanded over the keys present when the aliases are compiled. Call
+            clear_aliases after changing the problem in place or adding configurations.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            compiled           [Compiled_Aliases]
+    
+            Properties Used:
+            None
+        """
+        
+        problem  = self.optimization_problem
+        sources  = [problem.inputs,problem.objective,problem.constraints,problem.aliases]
+        compiled = self._compiled_aliases
+        
+        if compiled.sources is None or any([new is not old for new, old in zip(sources,compiled.sources)]):
+            compiled.setters     = help_fun.compile_setters(self,problem.inputs,problem.aliases)
+            compiled.objective   = help_fun.compile_getters(problem.objective,problem.aliases)
+            compiled.constraints = help_fun.compile_getters(problem.constraints,problem.aliases)
+            compiled.sources     = sources
+            
+        return compiled
+    
+    def clear_aliases(self):
+        """Makes the aliases be compiled again at the next evaluation.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        self._compiled_aliases = Compiled_Aliases()
     
     def constraints_individual(self,x = None):
         """Put's the values of the problem in the right place.
@@ -367,30 +629,21 @@ class Nexus(Data):
             None
         """           
         
-        obj = self.objective(x)
-        con = self.all_constraints(x)
+        x      = np.asarray(x)*1.0
+        inplen = len(self.optimization_problem.inputs)
         
-        inpu  = self.optimization_problem.inputs
-        const = self.optimization_problem.constraints
+        # the base point followed by a step in each input
+        X      = np.tile(x,(inplen+1,1))
+        steps  = np.arange(inplen)
+        X[steps+1,steps] = X[steps+1,steps] + diff_interval
         
-        inplen = len(inpu)
-        conlen = len(const)
+        values = self.evaluate_batch(X,['objective','all_constraints'])
+        objs   = np.reshape(values.objective,len(X))
+        cons   = values.all_constraints
         
-        grad_obj = np.zeros(inplen)
-        jac_con  = np.zeros((inplen,conlen))
+        grad_obj = (objs[1:] - objs[0])/diff_interval
         
-        con2 = (con*np.ones_like(jac_con))
-        
-        for ii in range(0,inplen):
-            newx     = np.asarray(x)*1.0
-            newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
-        
-        grad_obj = (grad_obj - obj)/diff_interval
-        
-        jac_con = (jac_con - con2).T/diff_interval
+        jac_con = (cons[1:] - cons[0]).T/diff_interval
         
         grad_obj = grad_obj.astype(float)
         jac_con  = jac_con.astype(float)
@@ -398,6 +651,83 @@ class Nexus(Data):
         return grad_obj, jac_con
     
     
+    def evaluate_batch(self,X,outputs=['objective','all_constraints']):
+        """Evaluates the problem at each row of a matrix of design points. With more than one worker
+            the points are shared out to worker processes, each holding its own copy of the nexus.
+    
+            Assumptions:
+            The results only depend on the inputs and the fidelity level. The workers keep the copy
+            of the vehicles, analyses and missions they were started with until stop_workers is called.
+            The batch is evaluated in this process, with a warning, if the nexus can't be sent to the
+            workers or they stop unexpectedly. Errors of the procedure are raised.
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X                  [array] one row per design point
+            outputs            [list]  names of the functions to evaluate, i.e. 'objective'
+    
+            Outputs:
+            values             [Data]  an array for each output, one row per design point
+    
+            Properties Used:
+            self.number_of_workers
+        """
+        
+        X       = np.atleast_2d(np.asarray(X)*1.0)
+        outputs = list(outputs)
+        rows    = None
+        
+        pool    = self._worker_pool
+        started = pool.executor is not None and pool.number_of_workers == self.number_of_workers
+        workers = self.number_of_workers > 1 and len(X) > 1
+        if workers and not started and not picklable(self):
+            warnings.warn('The nexus can not be sent to worker processes, evaluating the batch in one process',stacklevel=2)
+            workers = False
+        
+        if workers:
+            try:
+                executor = pool.start(self,self.number_of_workers)
+                futures  = [executor.submit(evaluate_worker_point,x,self.fidelity_level,outputs) for x in X]
+                results  = [future.result() for future in futures]
+                rows     = [result[0] for result in results]
+                self.evaluation_count += sum([result[1] for result in results])
+            except BrokenProcessPool:
+                warnings.warn('The worker processes stopped unexpectedly, evaluating the batch in one process',stacklevel=2)
+                self.stop_workers()
+                rows = None
+                
+        if rows is None:
+            rows = [evaluate_point(self,x,outputs)[0] for x in X]
+            
+        values = Data()
+        for ii, name in enumerate(outputs):
+            values[name] = np.array([row[ii] for row in rows])
+            
+        return values
+    
+    def stop_workers(self):
+        """Stops the worker processes, so the next batch starts them from the current nexus.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        self._worker_pool.stop()
+    
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
     
@@ -439,7 +769,102 @@ class Nexus(Data):
         print(const_table)
         
         return inpu,const_table
-                               
+
+
+# ----------------------------------------------------------------------
+#  Worker Processes
+# ----------------------------------------------------------------------
+
+class Worker_Pool(object):
+    """Holds the worker processes of a nexus. A copy of the nexus, such as the ones sent to the
+        workers, gets a pool that has not been started.
+        
+        Assumptions:
+        None
         
+        Source:
+        N/A
+    """
+    
+    def __init__(self):
+        """Starts with no processes"""
+        self.executor          = None
+        self.number_of_workers = 0
+        
+    def start(self,nexus,number_of_workers):
+        """Starts the worker processes, each with a copy of the nexus, unless they are running"""
+        
+        if self.executor is not None and self.number_of_workers != number_of_workers:
+            self.stop()
+            
+        if self.executor is None:
+            self.executor          = ProcessPoolExecutor(max_workers=number_of_workers,initializer=start_worker,initargs=(nexus,))
+            self.number_of_workers = number_of_workers
+            
+        return self.executor
+    
+    def stop(self):
+        """Shuts down the worker processes if they are running"""
+        
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor          = None
+            self.number_of_workers = 0
+            
+    def __reduce__(self):
+        return (Worker_Pool,())
+    
+    def __repr__(self):
+        return '<Worker_Pool with ' + str(self.number_of_workers) + ' workers>'
+
+class Compiled_Aliases(object):
+    """Holds the compiled aliases of a nexus. They are not copied with the nexus, copies compile
+        their own.
+        
+        Assumptions:
+        None
+        
+        Source:
+        N/A
+    """
+    
+    def __init__(self):
+        """Starts with nothing compiled"""
+        self.sources     = None
+        self.setters     = []
+        self.objective   = []
+        self.constraints = []
+        
+    def __getitem__(self,name):
+        return getattr(self,name)
+        
+    def __reduce__(self):
+        return (Compiled_Aliases,())
+    
+    def __repr__(self):
+        return '<Compiled_Aliases>'
+
+# the copy of the nexus held by a worker process
+_worker_nexus = None
+
+def start_worker(nexus):
+    """Keeps the copy of the nexus a worker process was started with"""
+    
+    global _worker_nexus
+    _worker_nexus = nexus
+    
+def evaluate_worker_point(x,fidelity_level,outputs):
+    """Evaluates a design point on the copy of the nexus held by a worker process"""
+    
+    _worker_nexus.fidelity_level = fidelity_level
+    
+    return evaluate_point(_worker_nexus,x,outputs)
+
+def evaluate_point(nexus,x,outputs):
+    """Evaluates the named functions of a nexus at a design point, with the number of times the
+    procedure was run"""
+    
+    count  = nexus.evaluation_count
+    values = [getattr(nexus,name)(x) for name in outputs]
     
- 
+    return values, nexus.evaluation_count - count
@@ -2,6 +2,7 @@
 # particle_swarm_optimization.py
 # 
 # Created:  Sep. 2019, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,7 +15,7 @@ import scipy as sp
 ## @ingroup Optimization-Package_Setups
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, batch_func=None):
     """
     This function perform a particle swarm optimization (PSO)
     
@@ -41,6 +42,9 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        batch_func: Returns the objective values and the constraint arrays for a matrix of positions, one per row. 
+                    If specified, the whole swarm is moved before it is evaluated, each iteration using the 
+                    swarm's best position from the previous one (Default: None)                                     [function]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -126,9 +130,15 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
    
         # Initialize the particle's best known position
         p[i, :] = x[i, :]
-       
+        
+    # Evaluate the whole swarm at once if it can be
+    if batch_func is not None:
+        fp[:], cp = batch_func(p)
+        
+    for i in range(S):
         # Calculate the objective's value at the current particle's
-        fp[i] = obj(p[i, :])
+        if batch_func is None:
+            fp[i] = obj(p[i, :])
        
         # At the start, there may not be any feasible starting point, so just
         # give it a temporary "best" point since it's likely to change
@@ -137,7 +147,7 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
 
         # If the current particle's position is better than the swarm's,
         # update the best swarm position
-        if fp[i]<fg and is_feasible(p[i, :]):
+        if fp[i]<fg and (is_feasible(p[i, :]) if batch_func is None else np.all(cp[i]>=0)):
             fg = fp[i]
             g = p[i, :].copy()
        
@@ -149,23 +159,35 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     while it<=maxiter:
         rp = np.random.uniform(size=(S, D))
         rg = np.random.uniform(size=(S, D))
+        
+        # Move the whole swarm towards the best position of the last iteration, then evaluate it
+        if batch_func is not None:
+            v = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+            x = np.clip(x + v, lb, ub)
+            fxs, cxs = batch_func(x)
+            
         for i in range(S):
-
-            # Update the particle's velocity
-            v[i, :] = omega*v[i, :] + phip*rp[i, :]*(p[i, :] - x[i, :]) + \
-                      phig*rg[i, :]*(g - x[i, :])
-                      
-            # Update the particle's position, correcting lower and upper bound 
-            # violations, then update the objective function value
-            x[i, :] = x[i, :] + v[i, :]
-            mark1 = x[i, :]<lb
-            mark2 = x[i, :]>ub
-            x[i, mark1] = lb[mark1]
-            x[i, mark2] = ub[mark2]
-            fx = obj(x[i, :])
+            
+            if batch_func is None:
+                # Update the particle's velocity
+                v[i, :] = omega*v[i, :] + phip*rp[i, :]*(p[i, :] - x[i, :]) + \
+                          phig*rg[i, :]*(g - x[i, :])
+                          
+                # Update the particle's position, correcting lower and upper bound 
+                # violations, then update the objective function value
+                x[i, :] = x[i, :] + v[i, :]
+                mark1 = x[i, :]<lb
+                mark2 = x[i, :]>ub
+                x[i, mark1] = lb[mark1]
+                x[i, mark2] = ub[mark2]
+                fx = obj(x[i, :])
+                feasible = is_feasible(x[i, :]) if fx<fp[i] else False
+            else:
+                fx = fxs[i]
+                feasible = np.all(cxs[i]>=0)
             
             # Compare particle's best position (if constraints are satisfied)
-            if fx<fp[i] and is_feasible(x[i, :]):
+            if fx<fp[i] and feasible:
                 p[i, :] = x[i, :].copy()
                 fp[i] = fx
 
@@ -5,6 +5,7 @@
 # Modified: Feb 2017, M. Vegh
 #           Mar 2020, E. Botero
 #           Jul 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -107,8 +108,13 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, tol
                                                      workers=1,constraints=diff_evo_cons)
         
     elif solver == 'particle_swarm_optimization':
+        # with worker processes the swarm is evaluated a whole iteration at a time
+        batch = None
+        if problem.number_of_workers > 1:
+            batch = lambda X:SciPy_Batch_Problem(problem,X)
         outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
-                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
+                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False,\
+                                              batch_func=batch)    
     else:
         outputs = sp.optimize.minimize(wrapper,x,method=solver)
     
@@ -145,3 +151,34 @@ def SciPy_Problem(problem,x):
     
     return obj
 
+## @ingroup Optimization-Package_Setups
+def SciPy_Batch_Problem(problem,X):
+    """ This wrapper runs the SUAVE problem at several design points at once, sharing them out to
+        the worker processes of the nexus. Prints the inputs as well as the objective values
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        problem   [nexus()]
+        X         [array]
+
+        Outputs:
+        obj       [array]
+        con       [array]
+
+        Properties Used:
+        None
+    """      
+    
+    values = problem.evaluate_batch(X,['objective','inequality_constraint'])
+    obj    = np.reshape(values.objective,len(X))
+    print('Inputs')
+    print(X)
+    print('Obj')
+    print(obj)
+    
+    return obj, values.inequality_constraint
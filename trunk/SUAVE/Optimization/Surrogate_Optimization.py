@@ -3,6 +3,7 @@
 #
 #Created:  Jul 2016, M. Vegh
 #Modified: Feb 2017, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -108,11 +109,8 @@ class Surrogate_Optimization(Data):
             Xsample = self.sample_plan(scaled_bounds,npoints)
     
             #now run; results will be written to file, which can be read later
-            for i in range(0,npoints):
-        
-                opt_prob.inputs[:,1] = Xsample[i,:]*scl#/base_units
-            
-                problem.objective()
+            #the samples are shared out to the worker processes of the problem if it has any
+            problem.evaluate_batch(Xsample[:npoints],['objective'])
         return 
         
         
@@ -3,12 +3,14 @@
 # 
 # Created:  May 2015, E. Botero
 # Modified: Feb 2015, M. Vegh
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
 # ----------------------------------------------------------------------    
 
 import numpy as np
+from operator import attrgetter
 from SUAVE.Core import Data
 
 # ----------------------------------------------------------------------        
@@ -42,45 +44,135 @@ def set_values(dictionary,input_dictionary,converted_values,aliases):
     N/A
     """      
     
-    provided_names = input_dictionary[:,0]
+    setters = compile_setters(dictionary,input_dictionary,aliases)
+            
+    return set_compiled_values(dictionary,setters,converted_values)
+
+## @ingroup Optimization
+def set_compiled_values(dictionary,setters,converted_values):
+    """ Sets the values in a dictionary through setters made by compile_setters
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    setters          [list of (index, function)]
+    converted_values [array]
+
+    Outputs:
+    dictionary       [Data()]
+
+    Properties Used:
+    N/A
+    """      
+    
+    for ii, setter in setters:
+        setter(dictionary,converted_values[ii])
         
-    # Correspond aliases to inputs
-    pointer = []
-    for ii in range(0,len(provided_names)):
-        for jj in range(0,len(aliases)):
-            if provided_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])
+    return dictionary
+
+## @ingroup Optimization
+def compile_setters(dictionary,input_dictionary,aliases):
+    """ Makes a setter for each place in the dictionary the inputs link to, so the aliases are only
+        looked up once. Wildcards are expanded over the keys the dictionary has now.
+
+    Assumptions:
+    Every place an input is set to already exists but for its last key
+
+    Source:
+    N/A
 
+    Inputs:
+    dictionary       [Data()]
+    input_dictionary [array]
+    aliases          [list of str]
+
+    Outputs:
+    setters          [list of (index, function)] index of the input each function sets
+
+    Properties Used:
+    N/A
+    """      
+    
+    pointer = find_aliases(input_dictionary[:,0],aliases)
+    
+    setters = []
     for ii in range(0,len(pointer)):
-        pointers = pointer[ii][:]
+        pointers = pointer[ii]
         if isinstance(pointers,str):
-            length = 0
-            if '*' in pointers:
-                newstrings = find_a_star(dictionary,pointer[ii])
-                for jj in range(0,len(newstrings)):
-                    localstrs = newstrings[jj].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])
-                    
-            elif '*' not in pointers:
-                localstrs = pointers.split('.')
-                correctname = '.'.join(localstrs[0:])
-                dictionary.deep_set(correctname,converted_values[ii])              
+            pointers = [pointers]
+        for string in pointers:
+            if '*' in string:
+                paths = find_a_star(dictionary,string)
+            else:
+                paths = [string]
+            for path in paths:
+                setters.append((ii,compile_setter(dictionary,path)))
+                
+    return setters
+
+## @ingroup Optimization
+def compile_setter(dictionary,path):
+    """ Makes a function that sets a value at a path, the same way Data.deep_set does. The path is split
+        and checked once, and followed again at every call so objects replaced along it are set on.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    path             [str]
+
+    Outputs:
+    setter           [function] setter(dictionary,value)
+
+    Properties Used:
+    N/A
+    """      
+    
+    keys    = path.split('.')
+    parents = keys[:-1]
+    last    = keys[-1]
+    indices = []
+    if last[-1] == ']':
+        splitkey = last.split('[')
+        last     = splitkey[0]
+        indices  = [int(index[:-1]) for index in splitkey[1:]]
+        
+    def find_parent(dictionary):
+        data = dictionary
+        for key in parents:
+            data = data[key]
+        return data
+    
+    # check the path now rather than at every evaluation
+    try:
+        parent = find_parent(dictionary)
+        if not isinstance(parent,dict):
+            raise TypeError
+        if indices:
+            parent[last]
+    except (KeyError,TypeError,AttributeError):
+        raise KeyError('The alias path "' + path + '" does not exist')
+    
+    def setter(dictionary,value):
+        data = find_parent(dictionary)
+        if indices:
+            thing = data[last]
+            for index in indices[:-1]:
+                thing = thing[index]
+            thing[indices[-1]] = value
         else:
-            for zz in range(1,len(pointers)+1):
-                if '*' in pointers[zz-1]:
-                    newstrings = find_a_star(dictionary,pointer[ii][zz-1])
-                    for jj in range(0,len(newstrings)):
-                        localstrs = newstrings[jj].split('.')
-                        correctname = '.'.join(localstrs[0:])
-                        dictionary.deep_set(correctname,converted_values[ii])
-                        
-                elif '*' not in pointers[zz-1]:
-                    localstrs = pointers[zz-1].split('.')
-                    correctname = '.'.join(localstrs[0:])
-                    dictionary.deep_set(correctname,converted_values[ii])            
+            data[last] = value
             
-    return dictionary
+    return setter
         
 ## @ingroup Optimization
 def find_a_star(dictionary,string):
@@ -108,7 +200,7 @@ def find_a_star(dictionary,string):
     for ii in range(0,len(splitstring)):
         if '*' in splitstring[ii]:
             if ii==0:
-                newkeys = dictionary.keys()
+                newkeys = list(dictionary.keys())
             elif ii !=0:
                 strtoeval = 'dictionary.'+'.'.join(splitstring[0:ii])+'.keys()'
                 newkeys = list(eval(strtoeval))
@@ -116,7 +208,7 @@ def find_a_star(dictionary,string):
             
     newstrings = []
     for ii in range(0,len(newkeys)):
-        newstrings.append('.'.join(splitstring[0:lastindex])+'.'+newkeys[ii]+'.'+'.'.join(splitstring[lastindex+1:]))
+        newstrings.append('.'.join(splitstring[0:lastindex]+[newkeys[ii]]+splitstring[lastindex+1:]))
         
     return newstrings
 
@@ -203,23 +295,127 @@ def get_values(dictionary,outputs,aliases):
     N/A
     """     
     
-    npoutputs   = np.array(outputs)
-    output_names = npoutputs[:,0]
-        
-    # Correspond aliases to outputs
-    pointer = []
-    for ii in range(0,len(output_names)):
-        for jj in range(0,len(aliases)):
-            if output_names[ii] == aliases[jj][0]:
-                pointer.append(aliases[jj][1])    
-                
-    values = np.zeros(len(outputs))
-    for ii in range(0,len(outputs)):
-        splitstring = pointer[ii].split('.')
-        values[ii]  = eval('dictionary.'+'.'.join(splitstring[0:]))
+    getters = compile_getters(outputs,aliases)
+    
+    return get_compiled_values(dictionary,getters)
+
+## @ingroup Optimization
+def get_compiled_values(dictionary,getters):
+    """ Retrieves values saved in a dictionary through getters made by compile_getters
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    dictionary       [Data()]
+    getters          [list of functions]
+
+    Outputs:
+    values           [array]
+
+    Properties Used:
+    N/A
+    """     
+    
+    values = np.zeros(len(getters))
+    for ii in range(0,len(getters)):
+        values[ii] = getters[ii](dictionary)
     
     return values
 
+## @ingroup Optimization
+def compile_getters(outputs,aliases):
+    """ Makes a getter for each output, so the aliases are only looked up and parsed once
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    outputs          [array]
+    aliases          [list of str]
+
+    Outputs:
+    getters          [list of functions] getter(dictionary)
+
+    Properties Used:
+    N/A
+    """     
+    
+    if len(outputs) == 0:
+        return []
+    
+    npoutputs = np.array(outputs)
+    
+    return [compile_getter(path) for path in find_aliases(npoutputs[:,0],aliases)]
+
+## @ingroup Optimization
+def compile_getter(path):
+    """ Makes a function that retrieves the value at a path. Paths that are more than attribute
+        names, such as ones with indices, are compiled as expressions on the dictionary.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    path             [str]
+
+    Outputs:
+    getter           [function] getter(dictionary)
+
+    Properties Used:
+    N/A
+    """     
+    
+    if all([key.isidentifier() for key in path.split('.')]):
+        return attrgetter(path)
+    
+    expression = compile('dictionary.' + path,path,'eval')
+    
+    return lambda dictionary: eval(expression,globals(),{'dictionary':dictionary})
+
+## @ingroup Optimization
+def find_aliases(names,aliases):
+    """ Finds the path, or list of paths, each name is an alias for
+
+    Assumptions:
+    The first alias given for a name is used
+
+    Source:
+    N/A
+
+    Inputs:
+    names            [array of str]
+    aliases          [list of str]
+
+    Outputs:
+    pointer          [list]
+
+    Properties Used:
+    N/A
+    """     
+    
+    table = dict()
+    for alias in aliases:
+        if alias[0] not in table:
+            table[alias[0]] = alias[1]
+    
+    pointer = []
+    for name in names:
+        if name not in table:
+            raise KeyError('No alias is given for "' + str(name) + '"')
+        pointer.append(table[name])
+    
+    return pointer
+
 ## @ingroup Optimization
 def scale_obj_values(inputs,x):
     """ Rescales an objective based on Nexus inputs scale